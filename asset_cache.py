@@ -0,0 +1,200 @@
+import pygame
+from typing import Callable
+from core.game_logger import game_logger
+
+# Flags que fazem parte da chave do cache
+FLAG_ALPHA: int = 1 # Superfície convertida com convert_alpha() (caso contrário, convert())
+FLAG_FLIP_X: int = 2 # Superfície espelhada horizontalmente (sprite virado para a esquerda)
+
+
+class AssetCache:
+    """
+    Cache central de imagens (e sons) do jogo.
+    Cada combinação (caminho, tamanho, flags) é decodificada/escalada uma única vez
+    e a mesma Surface é entregue a todas as instâncias que a pedirem.
+    As superfícies compartilhadas NÃO devem ser modificadas no lugar por quem as recebe.
+    Os arquivos podem ser decodificados antes, em segundo plano, pelo core.asset_loader;
+    o cache só é modificado na thread principal.
+    """
+    def __init__(self) -> None:
+        self._surfaces: dict[tuple[str, tuple[int, int] | None, int], pygame.Surface] = {}
+        self._sounds: dict[str, pygame.mixer.Sound | None] = {}
+        self._music: dict[str, bytes] = {} # Músicas lidas para a memória (tocadas por stream a partir delas)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_image(self, path: str, size: tuple[int, int] | None = None, alpha: bool = True,
+                  placeholder: Callable[[tuple[int, int]], pygame.Surface] | None = None,
+                  flip_x: bool = False) -> pygame.Surface:
+        """
+        Retorna a imagem do caminho indicado, escalada para o tamanho pedido.
+        Args:
+            path (str): Caminho do arquivo de imagem.
+            size (tuple[int, int] | None): Tamanho final (largura, altura). None mantém o tamanho original.
+            alpha (bool): Se a imagem deve manter o canal alfa (convert_alpha).
+            placeholder (Callable | None): Função que desenha um substituto do tamanho pedido
+                caso o arquivo não possa ser carregado. O substituto também fica no cache,
+                então o disco não é consultado de novo para o mesmo arquivo.
+            flip_x (bool): Se a imagem deve vir espelhada horizontalmente.
+        Returns:
+            pygame.Surface: A superfície compartilhada.
+        Raises:
+            pygame.error / FileNotFoundError: Se o arquivo falhar e nenhum placeholder for dado.
+        """
+        flags = (FLAG_ALPHA if alpha else 0) | (FLAG_FLIP_X if flip_x else 0)
+        key = (path, size, flags)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if flip_x:
+            # A versão espelhada deriva da versão normal do mesmo tamanho
+            surface = pygame.transform.flip(self.get_image(path, size, alpha, placeholder), True, False)
+            self._surfaces[key] = surface
+            return surface
+
+        # Deriva da versão original (também cacheada) para decodificar o arquivo só uma vez
+        original_key = (path, None, flags)  # flags aqui nunca inclui FLAG_FLIP_X
+        original = self._surfaces.get(original_key)
+        if original is None:
+            original = self._load(path, alpha, placeholder, size)
+            self._surfaces[original_key] = original
+
+        if size is None or original.get_size() == tuple(size):
+            surface = original
+        else:
+            surface = pygame.transform.scale(original, size)
+        self._surfaces[key] = surface
+        return surface
+
+    def get_oriented(self, path: str, size: tuple[int, int] | None = None,
+                     placeholder: Callable[[tuple[int, int]], pygame.Surface] | None = None
+                     ) -> tuple[pygame.Surface, pygame.Surface]:
+        """
+        Retorna as variações virada para a direita (original) e para a esquerda (espelhada)
+        de uma imagem, para que o desenho só precise escolher uma delas.
+        Args:
+            path (str): Caminho do arquivo de imagem.
+            size (tuple[int, int] | None): Tamanho final (largura, altura).
+            placeholder (Callable | None): Substituto caso o arquivo não possa ser carregado.
+        Returns:
+            tuple[pygame.Surface, pygame.Surface]: (imagem_direita, imagem_esquerda).
+        """
+        return (self.get_image(path, size, placeholder=placeholder),
+                self.get_image(path, size, placeholder=placeholder, flip_x=True))
+
+    def _load(self, path: str, alpha: bool,
+              placeholder: Callable[[tuple[int, int]], pygame.Surface] | None,
+              size: tuple[int, int] | None) -> pygame.Surface:
+        """Decodifica o arquivo do disco (ou gera o placeholder se falhar)."""
+        try:
+            loaded = pygame.image.load(path)
+            return loaded.convert_alpha() if alpha else loaded.convert()
+        except (pygame.error, FileNotFoundError):
+            if placeholder is None or size is None:
+                raise
+            game_logger.warning("assets", "Imagem {} não encontrada. Usando um placeholder.", path)
+            # O placeholder é desenhado no tamanho de quem pediu primeiro;
+            # outros tamanhos são escalados a partir dele.
+            return placeholder(size)
+
+    def add_decoded(self, path: str, decoded: pygame.Surface, alpha: bool = True) -> None:
+        """
+        Guarda uma imagem já decodificada (ex: por outra thread) como a versão original do arquivo.
+        A conversão para o formato da tela acontece aqui, na thread principal.
+        Args:
+            path (str): Caminho do arquivo de imagem.
+            decoded (pygame.Surface): A imagem decodificada, ainda não convertida.
+            alpha (bool): Se a imagem deve manter o canal alfa (convert_alpha).
+        """
+        flags = FLAG_ALPHA if alpha else 0
+        self._surfaces[(path, None, flags)] = decoded.convert_alpha() if alpha else decoded.convert()
+
+    def get_sound(self, path: str) -> pygame.mixer.Sound | None:
+        """
+        Retorna o som do caminho indicado, compartilhado por todas as instâncias.
+        Args:
+            path (str): Caminho do arquivo de som.
+        Returns:
+            pygame.mixer.Sound | None: O som, ou None se o arquivo não puder ser carregado
+                (a falha também fica no cache, então o disco não é consultado de novo).
+        """
+        if path in self._sounds:
+            self.hits += 1
+            return self._sounds[path]
+        self.misses += 1
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError):
+            game_logger.warning("assets", "Som {} não encontrado.", path)
+            sound = None
+        self._sounds[path] = sound
+        return sound
+
+    def add_sound(self, path: str, sound: pygame.mixer.Sound) -> None:
+        """
+        Guarda um som já carregado.
+        Args:
+            path (str): Caminho do arquivo de som (a chave usada por get_sound).
+            sound (pygame.mixer.Sound): O som.
+        """
+        self._sounds[path] = sound
+
+    def get_music(self, path: str) -> bytes | None:
+        """
+        Retorna o conteúdo de uma música já lida para a memória, ou None se ela não foi pré-carregada.
+        Args:
+            path (str): Caminho do arquivo de música.
+        """
+        return self._music.get(path)
+
+    def add_music(self, path: str, data: bytes) -> None:
+        """
+        Guarda o conteúdo de um arquivo de música.
+        Args:
+            path (str): Caminho do arquivo de música.
+            data (bytes): O conteúdo do arquivo.
+        """
+        self._music[path] = data
+
+    def preload(self, entries: list[tuple]) -> None:
+        """
+        Carrega antecipadamente uma lista de imagens para evitar travadas durante o jogo.
+        Args:
+            entries (list[tuple]): Tuplas (path, size) ou (path, size, placeholder).
+        """
+        for entry in entries:
+            path, size = entry[0], entry[1]
+            placeholder = entry[2] if len(entry) > 2 else None
+            self.get_image(path, size, placeholder=placeholder)
+
+    def evict(self, path: str | None = None, size: tuple[int, int] | None = None) -> int:
+        """
+        Remove superfícies do cache.
+        Args:
+            path (str | None): Remove apenas as variações deste arquivo. None esvazia o cache inteiro.
+            size (tuple[int, int] | None): Remove apenas as variações deste arquivo neste tamanho
+                (a versão original, usada para derivar os outros tamanhos, continua no cache).
+        Returns:
+            int: Quantidade de entradas removidas.
+        """
+        if path is None:
+            removed = len(self._surfaces)
+            self._surfaces.clear()
+            return removed
+        keys = [key for key in self._surfaces if key[0] == path and (size is None or key[1] == tuple(size))]
+        for key in keys:
+            del self._surfaces[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._surfaces
+
+
+# Instância compartilhada por todos os sprites do jogo
+asset_cache = AssetCache()
@@ -0,0 +1,105 @@
+import io
+import queue
+import threading
+import time
+from typing import NamedTuple
+import pygame
+from core.asset_cache import AssetCache, asset_cache
+from core.game_logger import game_logger
+
+
+class AssetEntry(NamedTuple):
+    """Um arquivo do manifesto de assets."""
+    kind: str # "image", "sound" ou "music"
+    path: str
+
+
+class AssetLoader:
+    """
+    Pré-carrega os assets de um manifesto em segundo plano.
+    A thread de carregamento lê os arquivos do disco e decodifica as imagens; a finalização
+    (converter as imagens para o formato da tela, criar os sons e guardar tudo no cache)
+    acontece na thread principal, em pedaços limitados por tempo (finalize), para que uma
+    cena de carregamento continue desenhando enquanto isso.
+    """
+    def __init__(self, cache: AssetCache = asset_cache) -> None:
+        """
+        Inicializa o carregador.
+        Args:
+            cache (AssetCache): Cache onde os assets finalizados são guardados.
+        """
+        self.cache: AssetCache = cache
+        self.total: int = 0
+        self.finalized: int = 0
+        self._results: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    def start(self, manifest: list[AssetEntry]) -> None:
+        """
+        Começa a ler os arquivos do manifesto em uma thread de fundo.
+        Args:
+            manifest (list[AssetEntry]): Os arquivos a carregar.
+        """
+        self.total = len(manifest)
+        self.finalized = 0
+        self._thread = threading.Thread(target=self._run, args=(list(manifest),), name="asset-loader", daemon=True)
+        self._thread.start()
+
+    def _run(self, manifest: list[AssetEntry]) -> None:
+        """
+        Laço da thread de carregamento: lê (e, para imagens, decodifica) um arquivo por vez.
+        Toda entrada gera um resultado, mesmo com erro inesperado: finalize() sem orçamento
+        espera um resultado por entrada e ficaria bloqueado para sempre se a thread morresse.
+        """
+        for entry in manifest:
+            try:
+                with open(entry.path, 'rb') as f:
+                    data = f.read()
+                if entry.kind == "image":
+                    # Decodificar não exige a tela; só convert()/convert_alpha() ficam para a thread principal
+                    data = pygame.image.load(io.BytesIO(data), entry.path)
+                self._results.put((entry, data, None))
+            except Exception as e: # Qualquer falha vira um aviso na finalização, nunca uma thread morta
+                self._results.put((entry, None, e))
+
+    @property
+    def progress(self) -> float:
+        """Fração (0 a 1) dos assets do manifesto já finalizados."""
+        return self.finalized / self.total if self.total else 1.0
+
+    def finalize(self, budget_ms: float | None = None) -> float:
+        """
+        Finaliza, na thread principal, os assets que a thread de fundo já leu.
+        Args:
+            budget_ms (float | None): Tempo máximo gasto nesta chamada (None = espera e finaliza todos).
+        Returns:
+            float: O progresso do carregamento (1.0 quando todos os assets estão no cache).
+        """
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        while self.finalized < self.total:
+            try:
+                entry, data, error = self._results.get(block=deadline is None)
+            except queue.Empty:
+                break # A thread de fundo ainda está lendo; tenta de novo no próximo passo
+            self._finalize_entry(entry, data, error)
+            self.finalized += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return self.progress
+
+    def _finalize_entry(self, entry: AssetEntry, data, error: Exception | None) -> None:
+        """Guarda um asset no cache. Uma falha só é registrada: quem usar o asset cai no fallback de sempre."""
+        if error is not None:
+            # Imagens ausentes já avisam (e usam o placeholder) quando o sprite as pede ao cache
+            if entry.kind != "image" or not isinstance(error, (OSError, pygame.error)):
+                game_logger.warning("assets", "Não foi possível pré-carregar {}: {}", entry.path, error)
+            return
+        try:
+            if entry.kind == "image":
+                self.cache.add_decoded(entry.path, data)
+            elif entry.kind == "sound":
+                self.cache.add_sound(entry.path, pygame.mixer.Sound(file=io.BytesIO(data)))
+            else:
+                self.cache.add_music(entry.path, data)
+        except pygame.error as e:
+            game_logger.warning("assets", "Não foi possível pré-carregar {}: {}", entry.path, e)
@@ -0,0 +1,30 @@
+import os
+from core.asset_loader import AssetEntry
+from characters.player import PLAYER_IMAGE_PATH
+from characters.sword import SWORD_IMAGE_PATH
+from characters.monster import MONSTER_IMAGE_PATH
+from characters.dragon import DRAGON_IMAGE_PATH, FIREBALL_SOUND_PATH
+from world.tree import TREE_IMAGE_PATH
+from world.coin import COIN_IMAGE_PATH
+from world.platform import PLATFORM_IMAGE_PATH
+from world.projectile import FIREBALL_IMAGE_PATH
+
+# Caminhos dos arquivos de música
+MENU_MUSIC_PATH: str = os.path.join("assets", "sounds", "orb8bt.mp3")
+GAME_MUSIC_PATH: str = os.path.join("assets", "sounds", "game_music.mp3")
+
+# Tudo o que o jogo usa, carregado em segundo plano na abertura (ver Jogo e core.asset_loader).
+# Um asset fora desta lista continua funcionando: é carregado na primeira vez em que for pedido.
+GAME_ASSETS: list[AssetEntry] = [
+    AssetEntry("image", PLAYER_IMAGE_PATH),
+    AssetEntry("image", SWORD_IMAGE_PATH),
+    AssetEntry("image", MONSTER_IMAGE_PATH),
+    AssetEntry("image", DRAGON_IMAGE_PATH),
+    AssetEntry("image", TREE_IMAGE_PATH),
+    AssetEntry("image", COIN_IMAGE_PATH),
+    AssetEntry("image", PLATFORM_IMAGE_PATH),
+    AssetEntry("image", FIREBALL_IMAGE_PATH),
+    AssetEntry("sound", FIREBALL_SOUND_PATH),
+    AssetEntry("music", MENU_MUSIC_PATH),
+    AssetEntry("music", GAME_MUSIC_PATH),
+]
@@ -0,0 +1,108 @@
+"""
+Benchmark da fase ampla de colisões: spritecollide em cascata (como a CenaJogo fazia)
+contra a grade SpatialHash, para quantidades crescentes de entidades.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_spatial_hash.py [--sizes 10 100 1000 5000] [--repeats 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from core.spatial_hash import SpatialHash
+
+WORLD_WIDTH: int = 1280
+WORLD_HEIGHT: int = 720
+
+
+class _Box(pygame.sprite.Sprite):
+    """Sprite mínimo (só rect) para medir colisões sem precisar de tela."""
+    def __init__(self, x: int, y: int, width: int, height: int) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+def _make_world(entity_count: int, rng: random.Random) -> tuple[list, list[pygame.sprite.Group]]:
+    """
+    Cria monstros e projéteis espalhados por uma área que cresce com a quantidade de entidades
+    (densidade constante, como uma fase maior com mais inimigos).
+    Returns:
+        tuple: (monstros, grupos de projéteis, um por dragão)
+    """
+    scale = max(1.0, (entity_count / 100) ** 0.5)
+    width, height = int(WORLD_WIDTH * scale), int(WORLD_HEIGHT * scale)
+    monsters = [_Box(rng.randrange(width), rng.randrange(height), 90, 90) for _ in range(entity_count // 2)]
+    dragon_count = max(1, entity_count // 100)
+    projectile_groups = [pygame.sprite.Group() for _ in range(dragon_count)]
+    for i in range(entity_count - len(monsters)):
+        projectile_groups[i % dragon_count].add(_Box(rng.randrange(width), rng.randrange(height), 40, 40))
+    return monsters, projectile_groups
+
+
+def _naive(monsters: list, projectile_groups: list[pygame.sprite.Group]) -> int:
+    """Laço antigo: dragões x monstros x projéteis de cada dragão."""
+    hits = 0
+    for projectiles in projectile_groups:
+        for monster in monsters:
+            hits += len(pygame.sprite.spritecollide(monster, projectiles, False))
+    return hits
+
+
+def _hashed(grid: SpatialHash, monsters: list, projectile_groups: list[pygame.sprite.Group]) -> int:
+    """Reconstrói a grade de monstros e consulta cada projétil nela."""
+    grid.rebuild(monsters)
+    hits = 0
+    for projectiles in projectile_groups:
+        for projectile in projectiles:
+            hits += len(grid.collide(projectile))
+    return hits
+
+
+def _best_of(repeats: int, func, *args) -> tuple[float, int]:
+    """Executa func várias vezes e retorna o menor tempo (em ms) e o resultado."""
+    best = float("inf")
+    result = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def run(sizes: list[int], repeats: int, seed: int = 1234) -> list[dict]:
+    """
+    Mede as duas abordagens para cada tamanho.
+    Returns:
+        list[dict]: Um registro por tamanho com os tempos em milissegundos.
+    """
+    rng = random.Random(seed)
+    grid = SpatialHash()
+    results = []
+    for size in sizes:
+        monsters, projectile_groups = _make_world(size, rng)
+        naive_ms, naive_hits = _best_of(repeats, _naive, monsters, projectile_groups)
+        hashed_ms, hashed_hits = _best_of(repeats, _hashed, grid, monsters, projectile_groups)
+        assert naive_hits == hashed_hits, "A grade deve encontrar exatamente as mesmas colisões"
+        results.append({"entities": size, "naive_ms": naive_ms, "spatial_hash_ms": hashed_ms, "hits": naive_hits})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 2000, 5000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'entidades':>10} {'cascata (ms)':>14} {'spatial hash (ms)':>18} {'ganho':>8}")
+    for row in run(args.sizes, args.repeats):
+        speedup = row["naive_ms"] / row["spatial_hash_ms"] if row["spatial_hash_ms"] else float("inf")
+        print(f"{row['entities']:>10} {row['naive_ms']:>14.3f} {row['spatial_hash_ms']:>18.3f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Suíte de benchmarks dos caminhos quentes do jogo. Roda sem tela (driver "dummy" do SDL).
+
+Casos medidos:
+    sword_update          Sword.update (balanço + retorno) em vários níveis de crescimento
+    player_update         Player.update contra N plataformas
+    environment_coin_drop Environment.update com uma chuva de N moedas (queda + pouso)
+    cena_jogo_atualizar   CenaJogo.atualizar inteiro (cascata de colisões) com N entidades
+    save_game / load_game SaveLoad em mundos grandes (JSON e binário)
+    spatial_hash          Fase ampla de colisões (ver bench_spatial_hash.py)
+
+Os resultados são gravados em JSON; com --baseline, cada caso é comparado com a linha de base
+e o processo termina com código 1 se algum ficar mais lento que a tolerância.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/run_benchmarks.py [--quick] [--only sword] [--output resultados.json]
+    python benchmarks/run_benchmarks.py --save-baseline          # grava a linha de base
+    python benchmarks/run_benchmarks.py --baseline benchmarks/results/baseline.json
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COINS_FOR_SWORD_LEVEL_UP
+from characters.sword import Sword
+from characters.player import Player
+from characters.monster import Monster
+from characters.dragon import Dragon
+from world.tree import Tree
+from world.platform import Platform
+from world.coin import coin_pool
+from world.projectile import projectile_pool
+from world.environment import Environment
+from world.platform_index import PlatformIndex
+from save_system.save_load import SaveLoad
+from core.game_logger import game_logger, ERROR
+
+RESULTS_DIR: str = os.path.join(ROOT_DIR, "benchmarks", "results")
+DEFAULT_OUTPUT: str = os.path.join(RESULTS_DIR, "latest.json")
+DEFAULT_BASELINE: str = os.path.join(RESULTS_DIR, "baseline.json")
+GROUND_Y_TOP: int = SCREEN_HEIGHT - 50
+
+
+def _measure(func, iterations: int, repeats: int, setup=None) -> dict:
+    """
+    Mede func() executada `iterations` vezes seguidas, `repeats` vezes.
+    Args:
+        func: Função medida; recebe o estado retornado por setup (se houver).
+        iterations (int): Chamadas por repetição.
+        repeats (int): Repetições (cada uma com um setup novo).
+        setup: Função opcional, fora da medição, que prepara o estado de cada repetição.
+    Returns:
+        dict: Tempos por chamada em milissegundos (melhor e média das repetições).
+    """
+    samples = []
+    for _ in range(repeats):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func(state)
+        samples.append((time.perf_counter() - start) * 1000 / iterations)
+    return {
+        "ms_per_op": min(samples),
+        "ms_per_op_mean": sum(samples) / len(samples),
+        "iterations": iterations,
+        "repeats": repeats,
+    }
+
+
+def bench_sword_update(repeats: int, quick: bool) -> dict:
+    """Sword.update com a espada balançando sem parar, em cada nível de crescimento."""
+    results = {}
+    for level in ([0, 10] if quick else [0, 5, 20, 50]):
+        def setup(level=level):
+            sword = Sword()
+            sword.try_grow_by_coins(level * COINS_FOR_SWORD_LEVEL_UP)
+            return {"sword": sword, "frame": 0}
+
+        def step(state):
+            sword = state["sword"]
+            state["frame"] += 1
+            if not sword.swing_active and state["frame"] % 30 == 0:
+                sword.start_swing(1 if state["frame"] % 60 else -1)
+            sword.update((SCREEN_WIDTH // 2, GROUND_Y_TOP - 55), state["frame"] % 120 < 60)
+
+        results[f"sword_update[level={level}]"] = _measure(step, 600, repeats, setup)
+    return results
+
+
+def _spread_platforms(count: int, rng: random.Random) -> list[Platform]:
+    """Plataformas espalhadas por uma faixa que cresce com a quantidade (densidade constante)."""
+    width = max(SCREEN_WIDTH, count * 60)
+    return [Platform(rng.randrange(-width // 2, width // 2 + SCREEN_WIDTH), rng.randrange(150, GROUND_Y_TOP - 30), 150, 30)
+            for _ in range(count)]
+
+
+def bench_player_update(repeats: int, quick: bool) -> dict:
+    """Player.update (movimento, pulo, pouso e cabeçadas) contra N plataformas."""
+    results = {}
+    for count in ([10, 1000] if quick else [10, 100, 1000, 10000]):
+        index = PlatformIndex(_spread_platforms(count, random.Random(count)))
+
+        def setup():
+            player = Player(SCREEN_WIDTH // 2, GROUND_Y_TOP - 110)
+            return {"player": player, "frame": 0}
+
+        def step(state, index=index):
+            player = state["player"]
+            state["frame"] += 1
+            player.moving_right = state["frame"] % 240 < 120
+            player.moving_left = not player.moving_right
+            if state["frame"] % 45 == 0 and not player.is_jumping:
+                player.velocity_y = player.jump_power
+                player.is_jumping = True
+            player.update(index)
+
+        results[f"player_update[platforms={count}]"] = _measure(step, 600, repeats, setup)
+    return results
+
+
+def bench_environment_coin_drop(repeats: int, quick: bool) -> dict:
+    """Environment.update: N moedas geradas de uma vez, mais 120 passos de queda e pouso."""
+    results = {}
+    for count in ([100] if quick else [100, 1000, 5000]):
+        def setup(count=count):
+            random.seed(count)
+            environment = Environment()
+            for tree in environment.trees:
+                tree.is_cut = True
+                tree.coins_on_cut = count // len(environment.trees)
+            return environment
+
+        def drop(environment):
+            player_rect = pygame.Rect(0, 0, 80, 110)
+            for _ in range(121): # Passo da geração + 120 passos de queda
+                environment.update(player_rect)
+            coin_pool.release_all(environment.coins) # Devolve as moedas para a próxima repetição
+
+        results[f"environment_coin_drop[coins={count}]"] = _measure(drop, 1, repeats, setup)
+    return results
+
+
+def _populate_scene(scene, entity_count: int, rng: random.Random) -> None:
+    """
+    Substitui o cenário da CenaJogo por N entidades: 40% monstros, 20% árvores,
+    30% moedas e 10% projéteis de dragões, espalhados pela tela.
+    """
+    environment = scene.environment
+    for group in (environment.trees, environment.monsters):
+        group.empty()
+    coin_pool.release_all(environment.coins)
+
+    monster_count = entity_count * 4 // 10
+    tree_count = entity_count * 2 // 10
+    coin_count = entity_count * 3 // 10
+    projectile_count = entity_count - monster_count - tree_count - coin_count
+
+    for _ in range(monster_count):
+        environment.monsters.add(Monster(rng.randrange(0, SCREEN_WIDTH - 90), GROUND_Y_TOP - 90))
+    for _ in range(tree_count):
+        environment.trees.add(Tree(rng.randrange(0, SCREEN_WIDTH - 120), GROUND_Y_TOP - 180))
+    for _ in range(coin_count):
+        environment.coins.add(coin_pool.acquire(rng.randrange(0, SCREEN_WIDTH - 30), rng.randrange(0, GROUND_Y_TOP - 30)))
+
+    dragons = [Dragon(rng.randrange(0, SCREEN_WIDTH - 200), 150) for _ in range(max(1, entity_count // 100))]
+    for i in range(projectile_count):
+        dragon = dragons[i % len(dragons)]
+        target = (rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT))
+        dragon.projectiles.add(projectile_pool.acquire(dragon.rect.centerx, dragon.rect.centery, target, 7, dragon.damage))
+    environment.monsters.add(*dragons)
+    environment.begin_snapshot() # Dá ids às entidades adicionadas direto nos grupos
+
+    scene.player.health = 10 ** 9 # O jogador não pode morrer durante a medição
+
+
+def bench_cena_jogo(repeats: int, quick: bool, jogo) -> dict:
+    """CenaJogo.atualizar completo (jogador, cenário e cascata de colisões) com N entidades."""
+    from cena_jogo import CenaJogo
+
+    results = {}
+    for count in ([10, 100] if quick else [10, 100, 1000]):
+        def setup(count=count):
+            random.seed(count)
+            scene = CenaJogo(jogo, sem_slot=True)
+            jogo.cena_atual = scene
+            _populate_scene(scene, count, random.Random(count))
+            return {"scene": scene, "frame": 0}
+
+        def step(state):
+            scene = state["scene"]
+            state["frame"] += 1
+            # O jogador anda de um lado para o outro, balançando a espada
+            scene.player.moving_right = state["frame"] % 240 < 120
+            scene.player.moving_left = not scene.player.moving_right
+            if state["frame"] % 25 == 0:
+                scene.player.sword.start_swing(1 if scene.player.facing_right else -1)
+            scene.atualizar([])
+            jogo.relogio.advance(1000.0 / jogo.simulacao_hz)
+
+        results[f"cena_jogo_atualizar[entities={count}]"] = _measure(step, 120, repeats, setup)
+    return results
+
+
+def _large_world_state(entity_count: int) -> dict:
+    """Estado de jogo (como Jogo.save_game_state monta) com um cenário de N entidades."""
+    rng = random.Random(entity_count)
+    random.seed(entity_count)
+    environment = Environment()
+    for _ in range(entity_count // 3):
+        environment.trees.add(Tree(rng.randrange(0, SCREEN_WIDTH * 10), GROUND_Y_TOP - 180))
+        environment.monsters.add(Monster(rng.randrange(0, SCREEN_WIDTH * 10), GROUND_Y_TOP - 90))
+        environment.coins.add(coin_pool.acquire(rng.randrange(0, SCREEN_WIDTH * 10), GROUND_Y_TOP - 30))
+    player = Player(SCREEN_WIDTH // 2, GROUND_Y_TOP - 110)
+    state = {
+        "player": player.to_dict(),
+        "environment": environment.to_dict(),
+        "current_scene": "CenaJogo",
+        "music_volume": 0.5,
+        "sfx_volume": 0.75,
+    }
+    coin_pool.release_all(environment.coins)
+    return state
+
+
+def bench_save_load(repeats: int, quick: bool) -> dict:
+    """SaveLoad.save_game e load_game com mundos grandes (JSON e binário), em uma pasta temporária."""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in ([1000] if quick else [1000, 10000]):
+            state = _large_world_state(count)
+            for save_format, suffix in (("json", ""), ("binary", ",format=binary")):
+                save_load = SaveLoad(save_format=save_format)
+                save_load.save_file_path = os.path.join(temp_dir, f"bench_save.{save_format}")
+                results[f"save_game[entities={count}{suffix}]"] = _measure(lambda _: save_load.save_game(state), 3, repeats)
+                results[f"load_game[entities={count}{suffix}]"] = _measure(lambda _: save_load.load_game(), 3, repeats)
+    return results
+
+
+def bench_spatial_hash(repeats: int, quick: bool) -> dict:
+    """Cascata de spritecollide contra a grade SpatialHash (ver bench_spatial_hash.py)."""
+    from bench_spatial_hash import run
+
+    results = {}
+    for row in run([100, 1000] if quick else [100, 1000, 5000], repeats):
+        results[f"spatial_hash[entities={row['entities']}]"] = {
+            "ms_per_op": row["spatial_hash_ms"],
+            "naive_ms": row["naive_ms"],
+            "repeats": repeats,
+        }
+    return results
+
+
+def run_all(repeats: int, quick: bool, only: str | None = None, verbose: bool = False) -> dict:
+    """
+    Executa todos os grupos de benchmarks.
+    Args:
+        repeats (int): Repetições de cada caso.
+        quick (bool): Usa menos tamanhos (para uma verificação rápida).
+        only (str | None): Só executa os grupos cujo nome contém este texto.
+        verbose (bool): Mantém as mensagens que o jogo imprime durante os casos.
+    Returns:
+        dict: {nome do caso: medidas}.
+    """
+    from jogo import Jogo
+
+    jogo = Jogo(headless=True)
+    if not verbose:
+        game_logger.set_level(ERROR) # O log é escrito por outra thread, fora do redirect_stdout abaixo
+    groups = {
+        "sword_update": lambda: bench_sword_update(repeats, quick),
+        "player_update": lambda: bench_player_update(repeats, quick),
+        "environment_coin_drop": lambda: bench_environment_coin_drop(repeats, quick),
+        "cena_jogo_atualizar": lambda: bench_cena_jogo(repeats, quick, jogo),
+        "save_load": lambda: bench_save_load(repeats, quick),
+        "spatial_hash": lambda: bench_spatial_hash(repeats, quick),
+    }
+    results = {}
+    for name, bench in groups.items():
+        if only and only not in name:
+            continue
+        print(f"Executando {name}...", flush=True)
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with output: # O jogo imprime mensagens (moedas, danos, saves) que poluiriam a saída
+            results.update(bench())
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[tuple[str, float, float, str]]:
+    """
+    Compara os resultados com a linha de base.
+    Args:
+        results (dict): Casos medidos agora.
+        baseline (dict): Casos da linha de base.
+        tolerance (float): Variação relativa aceita antes de acusar regressão (ex: 0.15 = 15%).
+    Returns:
+        list[tuple[str, float, float, str]]: (caso, ms base, ms atual, situação) para os casos em comum.
+    """
+    rows = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        base_ms, current_ms = baseline[name]["ms_per_op"], current["ms_per_op"]
+        ratio = current_ms / base_ms if base_ms else 1.0
+        if ratio > 1 + tolerance:
+            status = "REGRESSÃO"
+        elif ratio < 1 - tolerance:
+            status = "melhora"
+        else:
+            status = "ok"
+        rows.append((name, base_ms, current_ms, status))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="Menos tamanhos por caso")
+    parser.add_argument("--only", default=None, help="Só os grupos cujo nome contém este texto")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Arquivo JSON dos resultados")
+    parser.add_argument("--baseline", default=None, help="Linha de base JSON para comparar")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Também grava os resultados em {DEFAULT_BASELINE}")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Variação aceita antes de acusar regressão")
+    parser.add_argument("--verbose", action="store_true", help="Mostra as mensagens do jogo")
+    args = parser.parse_args()
+
+    os.chdir(ROOT_DIR) # Os caminhos dos assets são relativos à raiz do projeto
+    results = run_all(args.repeats, args.quick, args.only, args.verbose)
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "pygame": pygame.version.ver,
+            "platform": sys.platform,
+            "repeats": args.repeats,
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+    print(f"\n{'caso':<42} {'ms/op':>10} {'média':>10}")
+    for name, row in results.items():
+        print(f"{name:<42} {row['ms_per_op']:>10.4f} {row.get('ms_per_op_mean', row['ms_per_op']):>10.4f}")
+
+    outputs = [args.output] + ([DEFAULT_BASELINE] if args.save_baseline else [])
+    for path in outputs:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"Resultados gravados em {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        rows = compare(results, baseline, args.tolerance)
+        print(f"\n{'caso':<42} {'base':>10} {'atual':>10} {'variação':>9}  situação")
+        for name, base_ms, current_ms, status in rows:
+            change = (current_ms / base_ms - 1) * 100 if base_ms else 0.0
+            print(f"{name:<42} {base_ms:>10.4f} {current_ms:>10.4f} {change:>+8.1f}%  {status}")
+        if any(status == "REGRESSÃO" for *_, status in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import struct
+import zlib
+
+# Formato binário dos saves (little-endian):
+#   cabeçalho (8 bytes, nunca comprimido): magic "LECS" + versão (uint16) + flags (uint16)
+#   corpo (comprimido com zlib se FLAG_ZLIB):
+#       jogo:       volume da música, volume dos efeitos (double), tempo de jogo em ms (uint64, desde a
+#                   versão 2) + nome da cena (uint8 + UTF-8)
+#       jogador:    um registro PLAYER
+#       contagens:  árvores, monstros, moedas, plataformas (uint32)
+#       registros:  TREE * árvores, MONSTER * monstros, COIN * moedas, PLATFORM * plataformas
+# Cada registro espelha as chaves do to_dict() da classe correspondente.
+BINARY_SAVE_MAGIC: bytes = b"LECS"
+BINARY_SAVE_VERSION: int = 2
+FLAG_ZLIB: int = 1
+
+_HEADER = struct.Struct("<4sHH")
+_GAME_V1 = struct.Struct("<ddB")
+_GAME = struct.Struct("<ddQB")
+_PLAYER = struct.Struct("<iiiiBii")   # x, y, health, coins, facing_right, sword_growth_level, sword_current_damage
+_COUNTS = struct.Struct("<IIII")
+_TREE = struct.Struct("<iiiB")        # x, y, health, is_cut
+_MONSTER = struct.Struct("<BiiiBiibiq") # tipo, x, y, health, is_alive, speed, damage, direction, patrol_start_x, last_fireball_time
+_COIN = struct.Struct("<iiiBd")       # x, y, value, collected, velocity_y
+_PLATFORM = struct.Struct("<iiii")    # x, y, width, height
+
+_MONSTER_TYPES: dict[str, int] = {"Monster": 0, "Dragon": 1}
+_MONSTER_TYPE_NAMES: dict[int, str] = {code: name for name, code in _MONSTER_TYPES.items()}
+
+
+def is_binary_save(data: bytes) -> bool:
+    """
+    Verifica, pelo cabeçalho, se os bytes são de um save binário.
+    Args:
+        data (bytes): Início (ou todo) o conteúdo do arquivo.
+    """
+    return data[:len(BINARY_SAVE_MAGIC)] == BINARY_SAVE_MAGIC
+
+
+def encode_game_state(game_data: dict, compress: bool = True) -> bytes:
+    """
+    Converte o estado do jogo (o mesmo dicionário salvo em JSON) para o formato binário.
+    Args:
+        game_data (dict): Estado com "player", "environment", "current_scene" e volumes.
+        compress (bool): Comprime o corpo com zlib.
+    Returns:
+        bytes: O conteúdo do arquivo de save.
+    """
+    player = game_data.get("player") or {}
+    environment = game_data.get("environment") or {}
+    trees = environment.get("trees", [])
+    monsters = environment.get("monsters", [])
+    coins = environment.get("coins", [])
+    platforms = environment.get("platforms", [])
+
+    scene = game_data.get("current_scene", "CenaJogo").encode("utf-8")
+    chunks = [
+        _GAME.pack(game_data.get("music_volume", 0.5), game_data.get("sfx_volume", 0.75),
+                   int(game_data.get("play_time_ms", 0)), len(scene)),
+        scene,
+        _PLAYER.pack(player.get("x", 0), player.get("y", 0), player.get("health", 0), player.get("coins", 0),
+                     bool(player.get("facing_right", True)), player.get("sword_growth_level", 0),
+                     player.get("sword_current_damage", 0)),
+        _COUNTS.pack(len(trees), len(monsters), len(coins), len(platforms)),
+    ]
+    chunks.extend(_TREE.pack(t["x"], t["y"], t["health"], t["is_cut"]) for t in trees)
+    chunks.extend(_MONSTER.pack(_MONSTER_TYPES.get(m.get("type", "Monster"), 0), m["x"], m["y"], m["health"],
+                                m["is_alive"], m["speed"], m["damage"], m["direction"], m["patrol_start_x"],
+                                m.get("last_fireball_time", 0))
+                  for m in monsters)
+    chunks.extend(_COIN.pack(c["x"], c["y"], c["value"], c["collected"], c["velocity_y"]) for c in coins)
+    chunks.extend(_PLATFORM.pack(p["x"], p["y"], p["width"], p["height"]) for p in platforms)
+
+    body = b"".join(chunks)
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 6)
+        flags |= FLAG_ZLIB
+    return _HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION, flags) + body
+
+
+def _unpack_records(record: struct.Struct, body: bytes, offset: int, count: int) -> tuple[list[tuple], int]:
+    """Lê count registros seguidos a partir de offset. Retorna (registros, novo offset)."""
+    end = offset + record.size * count
+    if end > len(body):
+        raise ValueError("Save binário truncado.")
+    return list(record.iter_unpack(body[offset:end])), end
+
+
+def _decode_v1(body: bytes) -> dict:
+    """Decodifica o corpo da versão 1 (sem tempo de jogo) para o dicionário de estado do jogo."""
+    music_volume, sfx_volume, scene_length = _GAME_V1.unpack_from(body, 0)
+    return _decode_world(body, _GAME_V1.size, scene_length, music_volume, sfx_volume)
+
+
+def _decode_v2(body: bytes) -> dict:
+    """Decodifica o corpo da versão 2 para o dicionário de estado do jogo."""
+    music_volume, sfx_volume, play_time_ms, scene_length = _GAME.unpack_from(body, 0)
+    game_data = _decode_world(body, _GAME.size, scene_length, music_volume, sfx_volume)
+    game_data["play_time_ms"] = play_time_ms
+    return game_data
+
+
+def _decode_world(body: bytes, offset: int, scene_length: int, music_volume: float, sfx_volume: float) -> dict:
+    """Decodifica o que vem depois do registro do jogo (igual em todas as versões)."""
+    scene = body[offset:offset + scene_length].decode("utf-8")
+    offset += scene_length
+
+    x, y, health, coins, facing_right, growth_level, sword_damage = _PLAYER.unpack_from(body, offset)
+    offset += _PLAYER.size
+    tree_count, monster_count, coin_count, platform_count = _COUNTS.unpack_from(body, offset)
+    offset += _COUNTS.size
+
+    trees, offset = _unpack_records(_TREE, body, offset, tree_count)
+    monsters, offset = _unpack_records(_MONSTER, body, offset, monster_count)
+    coin_records, offset = _unpack_records(_COIN, body, offset, coin_count)
+    platforms, offset = _unpack_records(_PLATFORM, body, offset, platform_count)
+
+    monsters_data = []
+    for type_code, mx, my, m_health, is_alive, speed, damage, direction, patrol_start_x, last_fireball_time in monsters:
+        monster = {"x": mx, "y": my, "health": m_health, "is_alive": bool(is_alive), "speed": speed,
+                   "damage": damage, "direction": direction, "patrol_start_x": patrol_start_x,
+                   "type": _MONSTER_TYPE_NAMES.get(type_code, "Monster")}
+        if monster["type"] == "Dragon":
+            monster["last_fireball_time"] = last_fireball_time
+        monsters_data.append(monster)
+
+    return {
+        "player": {"x": x, "y": y, "health": health, "coins": coins, "facing_right": bool(facing_right),
+                   "sword_growth_level": growth_level, "sword_current_damage": sword_damage},
+        "environment": {
+            "trees": [{"x": tx, "y": ty, "health": t_health, "is_cut": bool(is_cut)}
+                      for tx, ty, t_health, is_cut in trees],
+            "monsters": monsters_data,
+            "coins": [{"x": cx, "y": cy, "value": value, "collected": bool(collected), "velocity_y": velocity_y}
+                      for cx, cy, value, collected, velocity_y in coin_records],
+            "platforms": [{"x": px, "y": py, "width": width, "height": height}
+                          for px, py, width, height in platforms],
+        },
+        "current_scene": scene,
+        "music_volume": music_volume,
+        "sfx_volume": sfx_volume,
+    }
+
+
+# Decodificadores por versão: versões antigas continuam legíveis quando o formato mudar
+_DECODERS = {1: _decode_v1, 2: _decode_v2}
+
+
+def decode_game_state(data: bytes) -> dict:
+    """
+    Converte um save binário de volta para o dicionário de estado do jogo.
+    Args:
+        data (bytes): Conteúdo do arquivo.
+    Returns:
+        dict: O mesmo formato de dicionário dos saves em JSON.
+    Raises:
+        ValueError: Se o arquivo não for um save binário válido ou for de uma versão desconhecida.
+    """
+    if len(data) < _HEADER.size or not is_binary_save(data):
+        raise ValueError("Não é um save binário.")
+    _, version, flags = _HEADER.unpack_from(data, 0)
+    decoder = _DECODERS.get(version)
+    if decoder is None:
+        raise ValueError(f"Versão de save binário desconhecida: {version}")
+    body = data[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise ValueError(f"Save binário corrompido: {e}") from e
+    try:
+        return decoder(body)
+    except struct.error as e:
+        raise ValueError(f"Save binário corrompido: {e}") from e
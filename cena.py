@@ -10,3 +10,31 @@ class Cena(ABC):
     @abstractmethod
     def desenhar(self, tela: pygame.Surface) -> None:
         pass
+
+    def obter_areas_alteradas(self) -> list[pygame.Rect] | None:
+        """
+        Retorna as áreas da tela alteradas no último desenhar(), para que o Jogo
+        atualize só elas. None (padrão) indica que a tela inteira deve ser atualizada.
+        """
+        return None
+
+    def obter_contagens(self) -> dict[str, int]:
+        """
+        Retorna a quantidade de entidades de cada grupo da cena (para o painel de desempenho).
+        Cenas sem entidades retornam um dicionário vazio (padrão).
+        """
+        return {}
+
+    def finalizar(self) -> None:
+        """
+        Chamado pelo Jogo quando a cena é substituída por outra, para liberar o que ela
+        pegou emprestado (ex: sprites dos pools). Cenas sem recursos compartilhados ignoram.
+        """
+        pass
+
+    def invalidar(self) -> None:
+        """
+        Avisa que algo foi desenhado por cima da cena (ex: o painel de desempenho) e que o
+        próximo desenhar() deve redesenhar a tela inteira. Cenas que sempre redesenham tudo ignoram.
+        """
+        pass
@@ -0,0 +1,66 @@
+from typing import Callable
+import pygame
+from cena import Cena
+from core.font_registry import font_registry
+from core.settings import LOADING_FRAME_BUDGET_MS
+
+
+class CenaCarregando(Cena):
+    """
+    Cena de carregamento: executa um trabalho longo em pedaços, um por passo de simulação,
+    e mostra uma barra de progresso enquanto isso, em vez de travar a janela.
+    """
+    def __init__(self, jogo, tarefa: Callable[[float], float], ao_concluir: Callable[[], None],
+                 titulo: str = "Carregando...", orcamento_ms: float = LOADING_FRAME_BUDGET_MS) -> None:
+        """
+        Inicializa a CenaCarregando.
+        Args:
+            jogo: A instância do jogo principal.
+            tarefa (Callable[[float], float]): Faz um pedaço do trabalho em até N milissegundos
+                e retorna o progresso (0 a 1); 1.0 indica que terminou.
+            ao_concluir (Callable[[], None]): Chamado uma vez quando a tarefa termina (normalmente troca de cena).
+            titulo (str): Texto mostrado acima da barra.
+            orcamento_ms (float): Tempo máximo de trabalho por passo, para a janela continuar respondendo.
+        """
+        self.jogo = jogo
+        self.tarefa = tarefa
+        self.ao_concluir = ao_concluir
+        self.titulo: str = titulo
+        self.orcamento_ms: float = orcamento_ms
+        self.progresso: float = 0.0
+        self.concluido: bool = False
+
+        largura_barra = jogo.largura // 2
+        self.barra = pygame.Rect(jogo.largura // 2 - largura_barra // 2, jogo.altura // 2, largura_barra, 30)
+
+    def atualizar(self, eventos: list) -> None:
+        """
+        Avança a tarefa por no máximo orcamento_ms e troca de cena quando ela termina.
+        Args:
+            eventos (list): Lista de eventos do Pygame (ignorados durante o carregamento).
+        """
+        if self.concluido:
+            return
+        self.progresso = self.tarefa(self.orcamento_ms)
+        if self.progresso >= 1.0:
+            self.concluido = True
+            self.ao_concluir()
+
+    def desenhar(self, tela: pygame.Surface) -> None:
+        """
+        Desenha o título e a barra de progresso.
+        Args:
+            tela (pygame.Surface): A superfície onde a cena será desenhada.
+        """
+        tela.fill((20, 20, 30))
+
+        titulo = font_registry.render_label(self.titulo, (255, 255, 255), 'Arial', 40, bold=True)
+        tela.blit(titulo, (self.jogo.largura // 2 - titulo.get_width() // 2, self.barra.y - 80))
+
+        preenchido = self.barra.copy()
+        preenchido.width = int(self.barra.width * min(self.progresso, 1.0))
+        pygame.draw.rect(tela, (100, 150, 255), preenchido)
+        pygame.draw.rect(tela, (255, 255, 255), self.barra, 2)
+
+        porcentagem = font_registry.render_label(f"{int(self.progresso * 100)}%", (200, 200, 200), 'Arial', 24)
+        tela.blit(porcentagem, (self.jogo.largura // 2 - porcentagem.get_width() // 2, self.barra.bottom + 15))
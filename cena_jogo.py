@@ -3,13 +3,46 @@ from cena import Cena
 from characters.player import Player 
 from characters.dragon import Dragon
 from world.environment import Environment 
-from world.coin import Coin 
+from world.coin import coin_pool
 from cena_menu import CenaMenu 
+from core.spatial_hash import SpatialHash
+from hud import Hud
+from core.settings import DIRTY_RECT_RENDERING, SAVE_STATUS_DURATION_MS, AUTOSAVE_INTERVAL_MS, AUTOSAVE_SNAPSHOT_EVERY
+from core.game_clock import get_ticks
+from core.frame_timer import frame_timer
+from core.game_logger import game_logger
+from save_system.save_load import SaveCallback
 
 
 class CenaJogo(Cena):
-    def __init__(self, jogo, initial_game_data: dict = None) -> None:
+    def __init__(self, jogo, initial_game_data: dict = None, slot: int | None = None,
+                 carregamento_gradual: bool = False, sem_slot: bool = False) -> None:
+        """
+        Inicializa a cena do jogo, nova ou restaurada de um save.
+        Args:
+            jogo: A instância do jogo principal.
+            initial_game_data (dict | None): Estado salvo a restaurar (None = jogo novo).
+            slot (int | None): Slot da partida (None = o primeiro slot livre).
+            carregamento_gradual (bool): Só decodifica o cenário salvo; os sprites são criados depois
+                por environment.materialize() (pela CenaCarregando), antes da cena começar a rodar.
+            sem_slot (bool): A partida não ocupa slot nenhum (gravações, reproduções, simulações):
+                o S grava no arquivo único e não há autosave.
+        """
         self.jogo = jogo
+        # Slot onde a partida é salva (S); uma partida nova ocupa o primeiro slot livre.
+        # Sem slot livre (None), o S grava no arquivo único e não há autosave: nenhum save existente
+        # é sobrescrito sem o jogador escolher o slot (ver CenaSlots)
+        self.slot: int | None = None if sem_slot else slot or jogo.save_load_system.first_free_slot()
+        self.tempo_jogo_ms: float = (initial_game_data or {}).get("play_time_ms", 0)
+
+        # Autosave incremental: a cada AUTOSAVE_INTERVAL_MS, só o que mudou vai para o journal do slot;
+        # a cada AUTOSAVE_SNAPSHOT_EVERY deltas (ou se o slot ainda não tem save), um save completo.
+        # Gravações e reproduções de entradas nunca escrevem nos saves do jogador
+        self.autosave_ativo: bool = (AUTOSAVE_INTERVAL_MS > 0 and not jogo.headless and self.slot is not None
+                                     and jogo.gravador is None and jogo.reprodutor is None)
+        self.proximo_autosave_ms: float = self.tempo_jogo_ms + AUTOSAVE_INTERVAL_MS
+        self.deltas_no_journal: int = (initial_game_data.get("journal_deltas", 0) if initial_game_data
+                                       else AUTOSAVE_SNAPSHOT_EVERY)
         
         player_height = 110 
         ground_y_top = jogo.altura - 50 
@@ -18,12 +51,38 @@ class CenaJogo(Cena):
         self.monster_attack_cooldown_ms: int = 1000 
         self.monster_last_attack_time: int = 0 
 
+        # Grades de colisão dos objetos móveis, reconstruídas a cada frame
+        self.tree_grid = SpatialHash()
+        self.monster_grid = SpatialHash()
+        self.coin_grid = SpatialHash()
+        self.projectile_grid = SpatialHash()
+        self.projectiles_this_frame: list = []
+
+        # Fundo estático (céu + chão) desenhado uma única vez
+        self.background = pygame.Surface((jogo.largura, jogo.altura)).convert()
+        self.background.fill((135, 206, 235)) 
+        pygame.draw.rect(self.background, (34, 139, 34), (0, jogo.altura - 50, jogo.largura, 50)) # [cite: 9a]
+
+        # Modo de retângulos sujos: só as áreas que mudaram são restauradas e enviadas para a tela
+        self.dirty_rendering: bool = DIRTY_RECT_RENDERING
+        self._full_redraw: bool = True # O primeiro frame sempre redesenha a tela inteira
+        self._previous_rects: list[pygame.Rect] = []
+        self._dirty_rects: list[pygame.Rect] | None = None
+
+        self.hud = Hud([
+            ("moedas", "Moedas: {}"),
+            ("espada", "Espada: {}px"),
+            ("vida", "Vida: {}"),
+            ("status", "{}") # Avisos temporários, como "Jogo salvo!"
+        ])
+        self.status_expira_em: int | None = None # Quando (relógio do jogo) o aviso da HUD some
+
         if initial_game_data:
             player_data = initial_game_data.get("player")
             environment_data = initial_game_data.get("environment")
 
             self.player = Player(0, 0, initial_data=player_data) 
-            self.environment = Environment(initial_data=environment_data) 
+            self.environment = Environment(initial_data=environment_data, lazy=carregamento_gradual) 
             print("Jogo restaurado de save.")
         else:
             self.player = Player(jogo.largura // 2 - (80//2), player_y) 
@@ -31,6 +90,7 @@ class CenaJogo(Cena):
             print("Iniciando novo jogo (sem save).")
 
     def atualizar(self, eventos: list) -> None:
+        started = frame_timer.start()
         for evento in eventos:
             self.player.handle_input(evento)
 
@@ -44,87 +104,238 @@ class CenaJogo(Cena):
                     self.player.collect_coin(10)
                 elif evento.key == pygame.K_s: 
                     print("Tentando salvar jogo...")
-                    self.jogo.save_game_state(
-                        self.player.to_dict(), 
-                        self.environment.to_dict() 
-                    )
+                    self._salvar_snapshot(self._ao_salvar)
+
+        frame_timer.stop("atualizar.eventos", started)
+        if self.jogo.cena_atual is not self:
+            return # A cena foi trocada (ESC) e já devolveu moedas e projéteis aos pools
 
-        # Passe o grupo de plataformas para o update do jogador
-        self.player.update(self.environment.platforms) # NOVO: Passa plataformas
+
+        # Posições do início do passo, usadas para interpolar o desenho entre passos
+        self.player.snapshot_position()
+        self.environment.snapshot_positions()
+
+        # Passe o índice estático de plataformas para o update do jogador
+        started = frame_timer.start()
+        self.player.update(self.environment.platform_index)
+        frame_timer.stop("atualizar.jogador", started)
+        started = frame_timer.start()
         self.environment.update(self.player.rect) 
+        frame_timer.stop("atualizar.cenario", started)
+
+        current_time = get_ticks() # Relógio do jogo (avança por passo de simulação)
+        self.tempo_jogo_ms += 1000 / self.jogo.simulacao_hz
+        if self.status_expira_em is not None and current_time >= self.status_expira_em:
+            self.hud.definir_valor("status", "")
+            self.status_expira_em = None
 
-        current_time = pygame.time.get_ticks() 
+        started = frame_timer.start()
+        self._rebuild_collision_grids()
 
         if self.player.sword.is_attacking: # [cite: 9a]
             player_sword_damage = self.player.sword.get_damage() 
 
-            hit_trees = pygame.sprite.spritecollide(self.player.sword, self.environment.trees, False) # [cite: 9a]
-            for tree in hit_trees:
+            for tree in self.tree_grid.collide(self.player.sword): # [cite: 9a]
                 coins_gained = tree.take_hit(player_sword_damage) 
+                self.environment.mark_dirty("trees", tree)
                 if coins_gained > 0:
                     self.player.collect_coin(coins_gained) 
 
-            hit_monsters = pygame.sprite.spritecollide(self.player.sword, self.environment.monsters, False) # [cite: 9a]
-            for monster in hit_monsters:
+            for monster in self.monster_grid.collide(self.player.sword): # [cite: 9a]
                 coins_gained = monster.take_damage(player_sword_damage) 
+                self.environment.mark_dirty("monsters", monster)
                 if coins_gained > 0:
                     self.player.collect_coin(coins_gained) 
         
-            for monster in self.environment.monsters:
-                if isinstance(monster, Dragon) and monster.is_alive: # [cite: 9a]
-                    colliding_projectiles = pygame.sprite.spritecollide(self.player.sword, monster.projectiles, False) # [cite: 9a]
-                    for projectile in colliding_projectiles:
-                        if not projectile.repelled: 
-                            self.player.sword.repel_projectile(projectile, self.player.facing_right) 
+            for projectile in self.projectile_grid.collide(self.player.sword): # [cite: 9a]
+                if projectile.is_active and not projectile.repelled: 
+                    self.player.sword.repel_projectile(projectile, self.player.facing_right) 
 
         if current_time - self.monster_last_attack_time > self.monster_attack_cooldown_ms:
-            colliding_monsters = pygame.sprite.spritecollide(self.player, self.environment.monsters, False)
-            for monster in colliding_monsters:
+            for monster in self.monster_grid.collide(self.player):
                 if monster.is_alive:
                     self.player.take_damage(monster.damage)
                     self.monster_last_attack_time = current_time 
 
-        for monster_source in self.environment.monsters:
-            if isinstance(monster_source, Dragon):
-                hit_player_by_projectiles = pygame.sprite.spritecollide(self.player, monster_source.projectiles, True) # [cite: 9a]
-                for projectile in hit_player_by_projectiles:
-                    if not projectile.repelled: 
-                        self.player.take_damage(projectile.damage) 
-                        print(f"Jogador atingido por projétil! Dano: {projectile.damage}")
-
-                for target_monster in self.environment.monsters:
-                    if target_monster.is_alive: # [cite: 9a]
-                        repelled_hit_target = pygame.sprite.spritecollide(target_monster, monster_source.projectiles, True) # [cite: 9a]
-                        for projectile in repelled_hit_target:
-                            if projectile.repelled and target_monster != self.player: 
-                                print(f"{target_monster.__class__.__name__} atingido por projétil repelido! Dano: {projectile.repeller_damage}")
-                                coins_gained = target_monster.take_damage(projectile.repeller_damage)
-                                if coins_gained > 0:
-                                    self.player.collect_coin(coins_gained) 
-
-        collected_coins = pygame.sprite.spritecollide(self.player, self.environment.coins, True) # [cite: 9a]
-        for coin in collected_coins:
+        for projectile in self.projectile_grid.collide(self.player): # [cite: 9a]
+            if not projectile.is_active:
+                continue
+            projectile.despawn() # Remove do grupo e devolve ao pool
+            if not projectile.repelled: 
+                self.player.take_damage(projectile.damage) 
+                game_logger.debug("combate", "Jogador atingido por projétil! Dano: {}", projectile.damage)
+
+        # Projéteis repelidos atingindo monstros: cada projétil consulta só os monstros das suas células,
+        # em vez de percorrer dragões x monstros x projéteis
+        for projectile in self.projectiles_this_frame:
+            if not (projectile.repelled and projectile.is_active):
+                continue
+            for target_monster in self.monster_grid.collide(projectile):
+                if target_monster.is_alive: # [cite: 9a]
+                    projectile.despawn() # Projétil repelido se consome no primeiro monstro atingido
+                    game_logger.debug("combate", "{} atingido por projétil repelido! Dano: {}",
+                                      target_monster.__class__.__name__, projectile.repeller_damage)
+                    coins_gained = target_monster.take_damage(projectile.repeller_damage)
+                    self.environment.mark_dirty("monsters", target_monster)
+                    if coins_gained > 0:
+                        self.player.collect_coin(coins_gained) 
+                    break
+
+        for coin in self.coin_grid.collide(self.player): # [cite: 9a]
+            self.environment.mark_removed("coins", coin)
+            coin_pool.release(coin) # Remove do grupo e devolve ao pool
             self.player.collect_coin(coin.value) 
+        frame_timer.stop("atualizar.colisoes", started)
 
         if self.player.health <= 0:
-            print("GAME OVER!")
+            game_logger.info("jogo", "GAME OVER!")
+            if self.jogo.headless:
+                # Sem janela ninguém sai do menu: a simulação termina aqui, para os passos/s
+                # e a telemetria medirem só a partida
+                game_logger.info("jogo", "Simulação headless encerrada no passo {}.", self.jogo.passos_simulados + 1)
+                self.jogo.rodando = False
+                return
             from cena_menu import CenaMenu 
             self.jogo.mudar_cena(CenaMenu(self.jogo)) 
+        elif self.autosave_ativo and self.tempo_jogo_ms >= self.proximo_autosave_ms:
+            self.proximo_autosave_ms = self.tempo_jogo_ms + AUTOSAVE_INTERVAL_MS
+            self._autosalvar()
+
+    def _salvar_snapshot(self, ao_concluir: SaveCallback) -> None:
+        """
+        Salva a partida inteira no slot (o journal de deltas do slot recomeça vazio).
+        Só a cópia do estado acontece neste frame; a escrita roda em segundo plano.
+        Args:
+            ao_concluir (SaveCallback): Chamado na thread principal quando o save terminar.
+        """
+        self.environment.begin_snapshot()
+        self.jogo.save_game_state(
+            self.player.to_dict(), 
+            self.environment.to_dict(),
+            ao_concluir,
+            slot=self.slot,
+            tempo_jogo_ms=self.tempo_jogo_ms
+        )
+        self.deltas_no_journal = 0
+
+    def _autosalvar(self) -> None:
+        """
+        Autosave periódico: acrescenta ao journal só o jogador e os elementos do cenário que mudaram.
+        Quando o journal fica longo, grava um save completo no lugar, que o reinicia.
+        """
+        if self.deltas_no_journal >= AUTOSAVE_SNAPSHOT_EVERY:
+            self._salvar_snapshot(self._ao_autosalvar)
+            return
+        delta = self.environment.collect_delta()
+        delta["player"] = self.player.to_dict()
+        delta["play_time_ms"] = int(self.tempo_jogo_ms)
+        self.jogo.save_load_system.append_delta_async(delta, self.slot, self._ao_autosalvar)
+        self.deltas_no_journal += 1
+
+    def _ao_autosalvar(self, sucesso: bool, mensagem: str) -> None:
+        """
+        Chamado na thread principal quando um autosave termina. O autosave é silencioso; se falhar,
+        o próximo grava um save completo, já que os deltas perdidos não voltam para as anotações.
+        Args:
+            sucesso (bool): Se o autosave foi gravado.
+            mensagem (str): Descrição do resultado.
+        """
+        if not sucesso:
+            self.deltas_no_journal = AUTOSAVE_SNAPSHOT_EVERY
+            self.hud.definir_valor("status", "Erro no autosave!")
+            self.status_expira_em = get_ticks() + SAVE_STATUS_DURATION_MS
+
+    def _ao_salvar(self, sucesso: bool, mensagem: str) -> None:
+        """
+        Chamado na thread principal quando o save em segundo plano termina: mostra o aviso na HUD.
+        Args:
+            sucesso (bool): Se o save foi gravado.
+            mensagem (str): Descrição do resultado.
+        """
+        if not sucesso:
+            texto = "Erro ao salvar!"
+        elif self.slot is None:
+            texto = "Jogo salvo!"
+        else:
+            texto = f"Jogo salvo no slot {self.slot}!"
+        self.hud.definir_valor("status", texto)
+        self.status_expira_em = get_ticks() + SAVE_STATUS_DURATION_MS
+
+    def _rebuild_collision_grids(self) -> None:
+        """
+        Reconstrói as grades de colisão com as posições deste frame.
+        Todas as consultas de colisão da cena passam por elas.
+        """
+        self.tree_grid.rebuild(self.environment.trees)
+        self.monster_grid.rebuild(self.environment.monsters)
+        self.coin_grid.rebuild(self.environment.coins)
+
+        self.projectiles_this_frame = []
+        for monster in self.environment.monsters:
+            if isinstance(monster, Dragon):
+                self.projectiles_this_frame.extend(monster.projectiles)
+        self.projectile_grid.rebuild(self.projectiles_this_frame)
 
     def desenhar(self, tela: pygame.Surface) -> None:
-        tela.fill((135, 206, 235)) 
-        pygame.draw.rect(tela, (34, 139, 34), (0, self.jogo.altura - 50, self.jogo.largura, 50)) # [cite: 9a]
+        alpha = self.jogo.alpha_interpolacao # Fração do passo de simulação já decorrida
+        if self.dirty_rendering and not self._full_redraw:
+            # Apaga apenas onde havia objetos no frame anterior, restaurando o fundo em cache
+            for rect in self._previous_rects:
+                tela.blit(self.background, rect, rect)
+        else:
+            tela.blit(self.background, (0, 0))
+
+        self.environment.draw(tela, alpha) 
+        self.player.draw(tela, alpha) 
+
+        # A HUD só renderiza de novo as linhas cujo valor mudou
+        self.hud.definir_valor("moedas", self.player.coins)
+        self.hud.definir_valor("espada", self.player.sword.scaled_current_image.get_height())
+        self.hud.definir_valor("vida", self.player.health)
+        self.hud.desenhar(tela)
+
+        if self.dirty_rendering:
+            current_rects = self.environment.dynamic_rects(alpha)
+            player_rect = self.player.render_rect(alpha)
+            sword_rect = self.player.sword.rect.move(player_rect.x - self.player.rect.x, player_rect.y - self.player.rect.y)
+            current_rects.extend((player_rect, sword_rect, self.hud.rect))
+            if self._full_redraw:
+                self._dirty_rects = [tela.get_rect()]
+                self._full_redraw = False
+            else:
+                # Áreas antigas (objetos que saíram dali) + áreas novas (onde foram desenhados)
+                self._dirty_rects = self._previous_rects + current_rects
+            self._previous_rects = current_rects
 
-        self.environment.draw(tela) 
-        self.player.draw(tela) 
+    def obter_areas_alteradas(self) -> list[pygame.Rect] | None:
+        """
+        Retorna as áreas alteradas no último desenhar() quando o modo de retângulos sujos está ativo.
+        """
+        if not self.dirty_rendering:
+            return None
+        return self._dirty_rects
 
-        font = pygame.font.SysFont('Arial', 30)
-        coin_text = font.render(f"Moedas: {self.player.coins}", True, (0, 0, 0))
-        tela.blit(coin_text, (10, 10))
+    def obter_contagens(self) -> dict[str, int]:
+        """
+        Retorna a quantidade de entidades de cada grupo do cenário.
+        """
+        return {
+            "monstros": len(self.environment.monsters),
+            "moedas": len(self.environment.coins),
+            "projéteis": sum(self.environment.projectile_counts()),
+            "árvores": len(self.environment.trees),
+        }
 
-        sword_height = self.player.sword.image.get_height()
-        sword_size_text = font.render(f"Espada: {sword_height}px", True, (0, 0, 0))
-        tela.blit(sword_size_text, (10, 50))
+    def finalizar(self) -> None:
+        """
+        Devolve aos pools as moedas e os projéteis do cenário quando a partida é descartada
+        (volta ao menu, game over ou carregamento de outro slot).
+        """
+        self.environment.release_pooled()
 
-        health_text = font.render(f"Vida: {self.player.health}", True, (0, 0, 0))
-        tela.blit(health_text, (10, 90))
+    def invalidar(self) -> None:
+        """
+        Força o próximo desenhar() a redesenhar a tela inteira (no modo de retângulos sujos,
+        algo desenhado por cima da cena não seria apagado de outra forma).
+        """
+        self._full_redraw = True
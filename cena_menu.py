@@ -3,6 +3,7 @@ import sys
 from botao import Botao
 import pygame
 from cena import Cena
+from core.font_registry import font_registry
 # Importações locais de CenaJogo e CenaOpcoes para evitar dependências circulares
 # from cena_opcoes import CenaOpcoes
 # from cena_jogo import CenaJogo
@@ -70,19 +71,25 @@ class CenaMenu(Cena):
     def iniciar_novo_jogo(self) -> None:
         """
         Função chamada ao clicar no botão "Novo Jogo".
-        Inicia uma nova CenaJogo.
+        Inicia uma nova CenaJogo no primeiro slot livre; se todos estiverem ocupados,
+        o jogador escolhe na CenaSlots qual save será sobrescrito.
         """
         print("Iniciando novo jogo...")
+        slot = self.jogo.save_load_system.first_free_slot()
+        if slot is None:
+            from cena_slots import CenaSlots # Importação local para evitar ciclo
+            self.jogo.mudar_cena(CenaSlots(self.jogo, novo_jogo=True))
+            return
         from cena_jogo import CenaJogo # Importação local para evitar ciclo
-        self.jogo.mudar_cena(CenaJogo(self.jogo)) # Inicia CenaJogo sem dados iniciais
+        self.jogo.mudar_cena(CenaJogo(self.jogo, slot=slot)) # Inicia CenaJogo sem dados iniciais
     
     def continuar_jogo(self) -> None:
         """
         Função chamada ao clicar no botão "Continuar".
-        Tenta carregar um jogo salvo através do objeto Jogo.
+        Abre a escolha de slots; o save só é carregado depois que um slot é escolhido.
         """
-        print("Tentando carregar jogo...")
-        self.jogo.load_game_state() # Chama o método de carregamento do Jogo
+        from cena_slots import CenaSlots # Importação local para evitar ciclo
+        self.jogo.mudar_cena(CenaSlots(self.jogo))
 
     def ir_para_opcoes(self) -> None:
         """
@@ -114,8 +121,7 @@ class CenaMenu(Cena):
         """
         tela.fill((240, 240, 240))  # Fundo cinza claro
         
-        fonte_titulo = pygame.font.SysFont('Arial', 48, bold=True)
-        titulo = fonte_titulo.render("CYBERBUG 2077", True, (0, 0, 0))
+        titulo = font_registry.render_label("CYBERBUG 2077", (0, 0, 0), 'Arial', 48, bold=True)
         tela.blit(titulo, (self.jogo.largura//2 - titulo.get_width()//2, 80))
         
         for botao in self.botoes:
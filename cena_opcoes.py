@@ -2,6 +2,7 @@ import pygame
 import sys
 from cena import Cena
 from botao import Botao
+from core.font_registry import font_registry
 # Importação local de CenaMenu para evitar dependência circular
 # from cena_menu import CenaMenu 
 
@@ -17,7 +18,7 @@ class CenaOpcoes(Cena):
         """
         self.jogo = jogo
         self.botoes = []
-        self.fonte = pygame.font.SysFont('Arial', 30)
+        self.fonte = font_registry.get_font('Arial', 30)
 
         # Configurações de sliders
         self.slider_musica_rect = pygame.Rect(self.jogo.largura // 2 - 150, 200, 300, 20)
@@ -92,8 +93,7 @@ class CenaOpcoes(Cena):
         tela.fill((200, 200, 220)) # Fundo cinza azulado claro
 
         # Desenha título
-        fonte_titulo = pygame.font.SysFont('Arial', 40, bold=True)
-        titulo = fonte_titulo.render("Opções de Som", True, (0, 0, 0))
+        titulo = font_registry.render_label("Opções de Som", (0, 0, 0), 'Arial', 40, bold=True)
         tela.blit(titulo, (self.jogo.largura // 2 - titulo.get_width() // 2, 80))
 
         # Desenha sliders
@@ -102,7 +102,7 @@ class CenaOpcoes(Cena):
         indicador_musica_x = self.slider_musica_rect.left + (self.slider_musica_rect.width * self.jogo.volume_musica)
         pygame.draw.circle(tela, (50, 150, 50), (int(indicador_musica_x), self.slider_musica_rect.centery), 10) # Indicador verde
         
-        texto_musica = self.fonte.render(f"Música: {int(self.jogo.volume_musica * 100)}%", True, (0, 0, 0))
+        texto_musica = font_registry.render_label(f"Música: {int(self.jogo.volume_musica * 100)}%", (0, 0, 0), 'Arial', 30)
         tela.blit(texto_musica, (self.slider_musica_rect.x, self.slider_musica_rect.y - 30))
 
         # Slider de Efeitos Sonoros
@@ -110,7 +110,7 @@ class CenaOpcoes(Cena):
         indicador_efeitos_x = self.slider_efeitos_rect.left + (self.slider_efeitos_rect.width * self.jogo.volume_efeitos)
         pygame.draw.circle(tela, (150, 50, 50), (int(indicador_efeitos_x), self.slider_efeitos_rect.centery), 10) # Indicador vermelho
 
-        texto_efeitos = self.fonte.render(f"Efeitos: {int(self.jogo.volume_efeitos * 100)}%", True, (0, 0, 0))
+        texto_efeitos = font_registry.render_label(f"Efeitos: {int(self.jogo.volume_efeitos * 100)}%", (0, 0, 0), 'Arial', 30)
         tela.blit(texto_efeitos, (self.slider_efeitos_rect.x, self.slider_efeitos_rect.y - 30))
 
         # Desenha botões
@@ -0,0 +1,138 @@
+import datetime
+import pygame
+from cena import Cena
+from botao import Botao
+from core.font_registry import font_registry
+from core.settings import SAVE_THUMBNAIL_SIZE
+# Importações locais de CenaMenu e CenaJogo para evitar dependências circulares
+
+
+class CenaSlots(Cena):
+    """
+    Cena de escolha do slot de save a ser carregado (ou, com todos ocupados, do slot que
+    um jogo novo vai sobrescrever).
+    Os resumos vêm do índice de saves (lido uma única vez); o mundo completo só é
+    carregado quando o jogador escolhe um slot.
+    """
+    def __init__(self, jogo, novo_jogo: bool = False):
+        """
+        Inicializa a CenaSlots, criando um botão por slot a partir do índice de saves.
+        Args:
+            jogo: A instância do jogo principal.
+            novo_jogo (bool): Escolher um slot começa um jogo novo nele, mesmo que esteja ocupado
+                (usado pelo "Novo Jogo" quando não há slot livre).
+        """
+        self.jogo = jogo
+        self.novo_jogo: bool = novo_jogo
+        self.botoes = []
+        self.datas: list[tuple[pygame.Surface, tuple[int, int]]] = [] # Legenda com a data de cada slot
+        self.miniaturas: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        save_load = jogo.save_load_system
+        indice = save_load.read_index()
+        x_miniatura = jogo.largura // 2 - 420
+        x_botao = x_miniatura + SAVE_THUMBNAIL_SIZE[0] + 20
+
+        for slot in range(1, save_load.slot_count + 1):
+            y = 140 + (slot - 1) * (SAVE_THUMBNAIL_SIZE[1] + 30)
+            resumo = indice.get(slot)
+            if resumo:
+                texto = (f"Slot {slot}: {resumo['coins']} moedas | vida {resumo['health']} | "
+                         f"espada nv {resumo['sword_level']} | {self._formatar_tempo(resumo.get('play_time_ms', 0))}")
+                data = datetime.datetime.fromtimestamp(resumo["timestamp"]).strftime("%d/%m/%Y %H:%M")
+                legenda = f"Salvo em {data}" + (" (será sobrescrito)" if novo_jogo else "")
+                self.datas.append((font_registry.render_label(legenda, (60, 60, 60), 'Arial', 18), (x_botao, y + 58)))
+                miniatura = self._carregar_miniatura(resumo.get("thumbnail"))
+                if miniatura:
+                    self.miniaturas.append((miniatura, (x_miniatura, y)))
+            else:
+                texto = f"Slot {slot}: vazio (novo jogo)"
+
+            self.botoes.append(Botao(
+                x=x_botao,
+                y=y,
+                largura=660,
+                altura=50,
+                texto=texto,
+                cor_normal=(100, 150, 255),
+                cor_hover=(50, 100, 200),
+                acao=lambda slot=slot, ocupado=bool(resumo): self.escolher_slot(slot, ocupado)
+            ))
+
+        self.botoes.append(Botao(
+            x=jogo.largura // 2 - 100,
+            y=140 + save_load.slot_count * (SAVE_THUMBNAIL_SIZE[1] + 30) + 20,
+            largura=200,
+            altura=50,
+            texto="Voltar",
+            cor_normal=(150, 150, 150),
+            cor_hover=(100, 100, 100),
+            acao=self.voltar_para_menu
+        ))
+
+    @staticmethod
+    def _formatar_tempo(tempo_ms: float) -> str:
+        """Formata o tempo de jogo como hh:mm:ss (ou mm:ss)."""
+        minutos, segundos = divmod(int(tempo_ms // 1000), 60)
+        horas, minutos = divmod(minutos, 60)
+        return f"{horas}:{minutos:02d}:{segundos:02d}" if horas else f"{minutos:02d}:{segundos:02d}"
+
+    @staticmethod
+    def _carregar_miniatura(caminho: str | None) -> pygame.Surface | None:
+        """Carrega a miniatura de um slot (não passa pelo asset_cache: ela muda a cada save)."""
+        if not caminho:
+            return None
+        try:
+            return pygame.image.load(caminho).convert()
+        except (pygame.error, FileNotFoundError):
+            return None
+
+    def escolher_slot(self, slot: int, ocupado: bool) -> None:
+        """
+        Carrega o slot escolhido ou, se estiver vazio (ou no modo novo_jogo), começa um jogo novo nele.
+        Args:
+            slot (int): O slot escolhido.
+            ocupado (bool): Se há um save no slot.
+        """
+        if ocupado and not self.novo_jogo and self.jogo.load_game_state(slot):
+            return
+        from cena_jogo import CenaJogo # Importação local para evitar ciclo
+        self.jogo.mudar_cena(CenaJogo(self.jogo, slot=slot))
+
+    def voltar_para_menu(self) -> None:
+        """
+        Retorna para a cena do menu principal.
+        """
+        from cena_menu import CenaMenu # Importação local para evitar ciclo
+        self.jogo.mudar_cena(CenaMenu(self.jogo))
+
+    def atualizar(self, eventos: list) -> None:
+        """
+        Atualiza o estado da cena, processando eventos para os botões.
+        Args:
+            eventos (list): Lista de eventos do Pygame.
+        """
+        for botao in self.botoes:
+            botao.atualizar(eventos)
+            if self.jogo.cena_atual is not self:
+                break # Um slot foi escolhido: os outros botões não devem reagir ao mesmo clique
+
+    def desenhar(self, tela: pygame.Surface) -> None:
+        """
+        Desenha a lista de slots na tela.
+        Args:
+            tela (pygame.Surface): A superfície onde a cena será desenhada.
+        """
+        tela.fill((240, 240, 240))
+
+        texto_titulo = "Slots cheios: escolha qual sobrescrever" if self.novo_jogo else "Escolha um save"
+        titulo = font_registry.render_label(texto_titulo, (0, 0, 0), 'Arial', 48, bold=True)
+        tela.blit(titulo, (self.jogo.largura // 2 - titulo.get_width() // 2, 50))
+
+        for miniatura, posicao in self.miniaturas:
+            tela.blit(miniatura, posicao)
+            pygame.draw.rect(tela, (0, 0, 0), miniatura.get_rect(topleft=posicao), 1)
+        for legenda, posicao in self.datas:
+            tela.blit(legenda, posicao)
+        for botao in self.botoes:
+            botao.desenhar(tela)
@@ -1,7 +1,22 @@
 import pygame
 from core.settings import SCREEN_HEIGHT # [cite: 9a]
+from core.asset_cache import asset_cache
+from core.sprite_pool import SpritePool
+from world.platform_index import PlatformIndex
+from core.interpolation import Interpolated
 
-class Coin(pygame.sprite.Sprite):
+COIN_IMAGE_PATH: str = "assets/images/coin.png"
+COIN_SIZE: tuple[int, int] = (40, 40) # Tamanho da moeda
+
+
+def _coin_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Círculo amarelo usado quando coin.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 255, 0), (size[0] // 2, size[1] // 2), min(size) // 2)
+    return surface
+
+
+class Coin(Interpolated, pygame.sprite.Sprite):
     """
     Representa uma moeda que o jogador pode coletar.
     Possui física de queda simples.
@@ -16,28 +31,38 @@ class Coin(pygame.sprite.Sprite):
             initial_data (dict | None): Dados para restaurar o estado da moeda.
         """
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/coin.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (40, 40)) # Tamanho da moeda [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem da moeda (coin.png) não encontrada. Usando um círculo amarelo como placeholder.")
-            self.image = pygame.Surface((40, 40), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            pygame.draw.circle(self.image, (255, 255, 0), (20, 20), 20) # Círculo amarelo [cite: 9a]
+        # Imagem compartilhada pelo cache: 50 moedas de um dragão não decodificam o PNG 50 vezes
+        self.image = asset_cache.get_image(COIN_IMAGE_PATH, COIN_SIZE, placeholder=_coin_placeholder)
         
         self.rect = self.image.get_rect(topleft=(x, y)) # [cite: 9a]
+        self.gravity: float = 0.5 # Força da gravidade aplicada à moeda (pode ser ajustada) [cite: 9a]
+        self.reset(x, y, value, initial_data)
+
+    def reset(self, x: int, y: int, value: int = 1, initial_data: dict = None) -> None:
+        """
+        Reinicia o estado da moeda (usado pelo construtor e pelo coin_pool).
+        Args:
+            x (int): Posição inicial X.
+            y (int): Posição inicial Y.
+            value (int): Valor da moeda.
+            initial_data (dict | None): Dados para restaurar o estado da moeda.
+        """
+        self.rect.topleft = (x, y)
         self.value: int = value
         self.collected: bool = False # Flag para saber se já foi coletada [cite: 9a]
 
         # Atributos de Física para Moeda (para cair)
         self.velocity_y: float = 0.0 # Velocidade vertical da moeda, para queda [cite: 9a]
-        self.gravity: float = 0.5 # Força da gravidade aplicada à moeda (pode ser ajustada) [cite: 9a]
 
         if initial_data: # Restaura o estado da moeda se dados forem fornecidos
             self.from_dict(initial_data)
+        self.snapshot_position() # Moeda reaproveitada não deve "deslizar" da posição antiga
 
-    def update(self) -> None:
+    def update(self, platforms: PlatformIndex | None = None) -> None:
         """
         Atualiza a lógica da moeda (principalmente a física de queda).
+        Args:
+            platforms (PlatformIndex | None): Índice de plataformas sobre as quais a moeda pode pousar.
         """
         if self.collected: # Moedas coletadas não precisam de atualização [cite: 9a]
             return
@@ -50,15 +75,21 @@ class Coin(pygame.sprite.Sprite):
         if self.rect.bottom >= ground_level: # Se a parte inferior da moeda atingiu ou passou do chão
             self.rect.bottom = ground_level # Posiciona a moeda exatamente no chão
             self.velocity_y = 0 # Zera a velocidade vertical para parar a queda [cite: 9a]
+        elif platforms is not None:
+            landing_top = platforms.find_landing(self.rect, self.velocity_y)
+            if landing_top is not None: # Pousa em cima da plataforma
+                self.rect.bottom = landing_top
+                self.velocity_y = 0
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Desenha a moeda na tela se não foi coletada.
         Args:
             screen (pygame.Surface): A superfície da tela do Pygame.
+            alpha (float): Fração do passo de simulação decorrida, para interpolar a posição.
         """
         if not self.collected: # Só desenha a moeda se ela ainda não foi coletada [cite: 9a]
-            screen.blit(self.image, self.rect) # Desenha a imagem da moeda na sua posição [cite: 9a]
+            screen.blit(self.image, self.render_pos(alpha)) # Desenha a imagem da moeda na sua posição [cite: 9a]
 
     def to_dict(self) -> dict:
         """Converte o estado da moeda em um dicionário para salvamento."""
@@ -77,3 +108,7 @@ class Coin(pygame.sprite.Sprite):
         self.value = data.get("value", self.value)
         self.collected = data.get("collected", self.collected)
         self.velocity_y = data.get("velocity_y", 0.0)
+
+
+# Pool compartilhado de moedas (quedas de árvores, monstros e dragões)
+coin_pool = SpritePool(Coin, max_size=256)
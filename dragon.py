@@ -2,8 +2,21 @@
 import pygame
 import math
 from characters.monster import Monster # Dragão herda do Monstro [cite: 9a]
-from world.projectile import Projectile # Para as bolas de fogo [cite: 9a]
+from world.projectile import projectile_pool # Para as bolas de fogo [cite: 9a]
 from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COINS_PER_DRAGON_KILL, SFX_VOLUME # [cite: 9a, 10d]
+from core.asset_cache import asset_cache
+from core.game_clock import get_ticks
+
+DRAGON_IMAGE_PATH: str = "assets/images/dragon.png"
+DRAGON_SIZE: tuple[int, int] = (250, 200) # Tamanho do dragão
+FIREBALL_SOUND_PATH: str = "assets/sounds/fireball_sfx.wav"
+
+
+def _dragon_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Retângulo roxo usado quando dragon.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((128, 0, 128))
+    return surface
 
 class Dragon(Monster):
     """
@@ -22,13 +35,8 @@ class Dragon(Monster):
         super().__init__(x, y, speed=3, health=100, damage=15, initial_data=initial_data) 
         
         # Sobrescreve a imagem do Monster
-        try:
-            self.original_image = pygame.image.load("assets/images/dragon.png").convert_alpha()
-            self.image = pygame.transform.scale(self.original_image, (250, 200)) # Tamanho do dragão [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem do dragão (dragon.png) não encontrada. Usando um retângulo roxo como placeholder.")
-            self.image = pygame.Surface((250, 200), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            self.image.fill((128, 0, 128))
+        self.image_right, self.image_left = asset_cache.get_oriented(DRAGON_IMAGE_PATH, DRAGON_SIZE, placeholder=_dragon_placeholder)
+        self.image = self.image_right
 
         self.rect = self.image.get_rect(topleft=(x, y)) # Garante que o rect seja com a imagem do dragão
 
@@ -42,18 +50,15 @@ class Dragon(Monster):
 
         # Cooldown de ataque (em frames)
         self.fireball_cooldown_ms: int = 1500 # Cooldown em milissegundos (1.5 segundos) [cite: 9a]
-        self.last_fireball_time: int = pygame.time.get_ticks()
+        self.last_fireball_time: int = get_ticks()
 
         # Grupo para gerenciar projéteis do dragão
         self.projectiles: pygame.sprite.Group = pygame.sprite.Group()
 
-        # Sons do dragão
-        try:
-            self.fireball_sound = pygame.mixer.Sound("assets/sounds/fireball_sfx.wav")
+        # Sons do dragão (compartilhados pelo cache: cada dragão não decodifica o WAV de novo)
+        self.fireball_sound = asset_cache.get_sound(FIREBALL_SOUND_PATH)
+        if self.fireball_sound:
             self.fireball_sound.set_volume(SFX_VOLUME) # Aplica o volume de efeitos [cite: 10d]
-        except pygame.error:
-            print("Erro: Som fireball_sfx.wav não encontrado.")
-            self.fireball_sound = None
 
         # Dragão voa, então não tem gravidade nem velocidade vertical (para Monster base)
         self.velocity_y = 0.0 
@@ -61,6 +66,7 @@ class Dragon(Monster):
         
         if initial_data: # Restaura o estado do dragão se dados forem fornecidos
             self.from_dict(initial_data)
+        self.snapshot_position()
 
     def update(self, player_rect: pygame.Rect) -> None:
         """
@@ -70,21 +76,20 @@ class Dragon(Monster):
         """
         if not self.is_alive:
             self.projectiles.update() # Ainda atualiza projéteis mesmo morto para eles sumirem
+            self._compact_projectiles()
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
 
         dx = player_rect.centerx - self.rect.centerx
         # dy não é mais usado para movimento vertical do dragão, apenas para virar
         distance_to_player = math.hypot(dx, player_rect.centery - self.rect.centery)
 
-        # Lógica de virar o dragão (para onde o jogador está)
+        # Lógica de virar o dragão (para onde o jogador está), usando as variações pré-espelhadas
         if dx > 0: # Jogador à direita
-            if self.image is not self.original_image: # Evita flip repetido
-                self.image = self.original_image
+            self.image = self.image_right
         elif dx < 0: # Jogador à esquerda
-            if self.image is self.original_image: # Evita flip repetido
-                self.image = pygame.transform.flip(self.original_image, True, False)
+            self.image = self.image_left
 
         # --- Comportamento: Perseguir ou Patrulhar Horizontalmente ---
         if distance_to_player <= self.detection_range:
@@ -114,6 +119,28 @@ class Dragon(Monster):
 
         # Atualiza os projéteis do dragão
         self.projectiles.update()
+        self._compact_projectiles()
+
+    def _compact_projectiles(self) -> None:
+        """
+        Remove do grupo qualquer projétil que tenha ficado inativo sem ser devolvido ao pool,
+        para que colisões e desenho não percorram projéteis mortos.
+        """
+        for projectile in self.projectiles.sprites():
+            if not projectile.is_active:
+                projectile.despawn()
+
+    @property
+    def projectile_count(self) -> int:
+        """Quantidade de projéteis vivos deste dragão."""
+        return len(self.projectiles)
+
+    def clear_projectiles(self) -> None:
+        """
+        Devolve ao pool todos os projéteis do dragão (ex: quando o dragão é removido do cenário).
+        """
+        for projectile in self.projectiles.sprites():
+            projectile.despawn()
 
     def _shoot_fireball(self, target_pos: tuple[int, int]) -> None:
         """
@@ -126,22 +153,24 @@ class Dragon(Monster):
             
         # Ponto de origem da bola de fogo (ex: boca do dragão)
         # Ajuste este offset para a boca do seu sprite de dragão
-        fire_start_x = self.rect.centerx + (self.rect.width // 3 if self.image is self.original_image else -self.rect.width // 3)
+        fire_start_x = self.rect.centerx + (self.rect.width // 3 if self.image is self.image_right else -self.rect.width // 3)
         fire_start_y = self.rect.top + (self.rect.height // 4) # Mais perto do topo para sair da boca [cite: 9a]
 
-        fireball = Projectile(fire_start_x, fire_start_y, target_pos, speed=7, damage=self.damage)
+        fireball = projectile_pool.acquire(fire_start_x, fire_start_y, target_pos, speed=7, damage=self.damage)
         self.projectiles.add(fireball)
         # print("Dragão atirou bola de fogo!") # Debug removido
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Desenha o dragão e seus projéteis.
         Args:
             screen (pygame.Surface): A superfície da tela do Pygame.
+            alpha (float): Fração do passo de simulação decorrida, para interpolar a posição.
         """
         if self.is_alive:
-            screen.blit(self.image, self.rect)
-        self.projectiles.draw(screen) # Desenha os projéteis gerenciados pelo dragão [cite: 9a]
+            screen.blit(self.image, self.render_pos(alpha))
+        for projectile in self.projectiles: # Desenha os projéteis gerenciados pelo dragão [cite: 9a]
+            projectile.draw(screen, alpha)
 
     def to_dict(self) -> dict:
         """Converte o estado do dragão em um dicionário para salvamento."""
@@ -155,5 +184,5 @@ class Dragon(Monster):
     def from_dict(self, data: dict) -> None:
         """Restaura o estado do dragão a partir de um dicionário."""
         super().from_dict(data) # Restaura dados da classe base (Monster)
-        self.last_fireball_time = data.get("last_fireball_time", pygame.time.get_ticks()) # Restaura o tempo do último ataque
+        self.last_fireball_time = data.get("last_fireball_time", get_ticks()) # Restaura o tempo do último ataque
         # Não restaura projéteis, eles devem ser recriados no jogo
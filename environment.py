@@ -1,31 +1,51 @@
 import pygame
 import random
+import time
+from collections import deque
 from world.tree import Tree
-from world.coin import Coin
+from world.coin import coin_pool
 from world.platform import Platform # NOVO: Importa a classe Platform
 from characters.monster import Monster
 from characters.dragon import Dragon 
 from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT # [cite: 9a]
+from world.platform_index import PlatformIndex
+
+# Grupos do cenário que entram nos deltas do autosave (plataformas não mudam durante a fase)
+DELTA_KINDS: tuple[str, ...] = ("trees", "monsters", "coins")
 
 class Environment:
     """
     Gerencia os elementos do cenário, como árvores, moedas, inimigos e plataformas.
     É responsável por gerar, atualizar e desenhar esses elementos.
     """
-    def __init__(self, initial_data: dict = None) -> None:
+    def __init__(self, initial_data: dict = None, lazy: bool = False) -> None:
         """
         Inicializa o ambiente, criando grupos de sprites.
         Se initial_data for fornecido, restaura o estado; caso contrário, gera elementos iniciais.
         Args:
             initial_data (dict | None): Dados para restaurar o ambiente, se existirem.
+            lazy (bool): Adia a criação dos sprites restaurados para materialize() (ver from_dict).
         """
         self.trees: pygame.sprite.Group = pygame.sprite.Group() 
         self.coins: pygame.sprite.Group = pygame.sprite.Group() 
         self.monsters: pygame.sprite.Group = pygame.sprite.Group() 
         self.platforms: pygame.sprite.Group = pygame.sprite.Group() # NOVO: Grupo para plataformas
+        # Plataformas não se movem: o índice delas é montado uma vez por fase
+        self.platform_index: PlatformIndex = PlatformIndex()
+
+        # Autosave incremental: cada árvore, monstro e moeda tem um id (entity_id) dentro do seu grupo,
+        # e o ambiente anota o que mudou desde o último delta (collect_delta)
+        self._next_id: dict[str, int] = {kind: 0 for kind in DELTA_KINDS}
+        self._dirty: dict[str, dict[int, pygame.sprite.Sprite]] = {kind: {} for kind in DELTA_KINDS}
+        self._removed: dict[str, set[int]] = {kind: set() for kind in DELTA_KINDS}
+
+        # Carregamento progressivo (from_dict com lazy=True)
+        self._pending: deque[tuple[str, int, dict]] = deque()
+        self._pending_total: int = 0
+        self._platforms_pending: bool = False
 
         if initial_data:
-            self.from_dict(initial_data)
+            self.from_dict(initial_data, lazy)
         else:
             self._generate_initial_elements()
 
@@ -39,18 +59,18 @@ class Environment:
         for _ in range(3):
             x = random.randint(100, SCREEN_WIDTH - 200)
             y = ground_y_top - 180 
-            self.trees.add(Tree(x, y))
+            self.trees.add(self._register("trees", Tree(x, y)))
 
         # Monstros genéricos (altura 90px)
         for _ in range(2):
             x = random.randint(150, SCREEN_WIDTH - 150)
             y = ground_y_top - 90 
-            self.monsters.add(Monster(x, y))
+            self.monsters.add(self._register("monsters", Monster(x, y)))
         
         # Dragão (altura 200px)
         dragon_x = SCREEN_WIDTH // 4 
         dragon_y = 150 
-        self.monsters.add(Dragon(dragon_x, dragon_y))
+        self.monsters.add(self._register("monsters", Dragon(dragon_x, dragon_y)))
 
         # NOVO: Geração de Plataformas
         # Plataforma 1: Mais à esquerda, baixa
@@ -59,6 +79,79 @@ class Environment:
         self.platforms.add(Platform(SCREEN_WIDTH // 2 - 75, ground_y_top - 250, 150, 30))
         # Plataforma 3: Mais à direita, alta
         self.platforms.add(Platform(SCREEN_WIDTH * 3 // 4 - 50, ground_y_top - 350, 100, 30))
+        self.platform_index.build(self.platforms)
+
+    def _register(self, kind: str, entity: pygame.sprite.Sprite, entity_id: int | None = None) -> pygame.sprite.Sprite:
+        """
+        Dá um id ao elemento dentro do seu grupo.
+        Args:
+            kind (str): Grupo do elemento ("trees", "monsters" ou "coins").
+            entity (pygame.sprite.Sprite): O elemento.
+            entity_id (int | None): Id restaurado de um save (None = o próximo id livre).
+        Returns:
+            pygame.sprite.Sprite: O próprio elemento, para encadear com add().
+        """
+        if entity_id is None:
+            entity_id = self._next_id[kind]
+        entity.entity_id = entity_id
+        self._next_id[kind] = max(self._next_id[kind], entity_id + 1)
+        return entity
+
+    def _spawn_coin(self, x: int, y: int) -> None:
+        """Cria (pelo pool) uma moeda nova e a anota para o próximo delta."""
+        coin = self._register("coins", coin_pool.acquire(x, y))
+        self.coins.add(coin)
+        self.mark_dirty("coins", coin)
+
+    def mark_dirty(self, kind: str, entity: pygame.sprite.Sprite) -> None:
+        """
+        Anota que o estado de um elemento mudou (árvore atingida, monstro ferido, moeda nova).
+        Args:
+            kind (str): Grupo do elemento ("trees", "monsters" ou "coins").
+            entity (pygame.sprite.Sprite): O elemento alterado.
+        """
+        self._dirty[kind][entity.entity_id] = entity
+
+    def mark_removed(self, kind: str, entity: pygame.sprite.Sprite) -> None:
+        """
+        Anota que um elemento saiu do cenário (árvore cortada, monstro derrotado, moeda coletada).
+        Args:
+            kind (str): Grupo do elemento ("trees", "monsters" ou "coins").
+            entity (pygame.sprite.Sprite): O elemento removido.
+        """
+        self._dirty[kind].pop(entity.entity_id, None)
+        self._removed[kind].add(entity.entity_id)
+
+    def collect_delta(self) -> dict:
+        """
+        Retorna o que mudou desde o último delta (ou snapshot) e limpa as anotações.
+        Só os elementos alterados são serializados: o custo não depende do tamanho do mundo.
+        Posições de monstros em patrulha e moedas caindo não geram deltas; elas vêm do último snapshot.
+        Returns:
+            dict: {"upsert": {grupo: [registros com "id"]}, "remove": {grupo: [ids]}}; grupos sem mudanças ficam de fora.
+        """
+        delta = {"upsert": {}, "remove": {}}
+        for kind in DELTA_KINDS:
+            if self._dirty[kind]:
+                delta["upsert"][kind] = [{**entity.to_dict(), "id": entity_id} for entity_id, entity in self._dirty[kind].items()]
+                self._dirty[kind].clear()
+            if self._removed[kind]:
+                delta["remove"][kind] = sorted(self._removed[kind])
+                self._removed[kind].clear()
+        return delta
+
+    def begin_snapshot(self) -> None:
+        """
+        Prepara um snapshot completo: renumera os ids na ordem em que to_dict() lista os elementos
+        (o snapshot guarda só a posição na lista) e descarta as anotações, já cobertas pelo snapshot.
+        Deve ser chamado logo antes do to_dict() de um save que reinicia o journal do slot.
+        """
+        for kind in DELTA_KINDS:
+            for entity_id, entity in enumerate(getattr(self, kind)):
+                entity.entity_id = entity_id
+            self._next_id[kind] = len(getattr(self, kind))
+            self._dirty[kind].clear()
+            self._removed[kind].clear()
 
 
     def update(self, player_rect: pygame.Rect) -> None:
@@ -73,9 +166,9 @@ class Environment:
             if isinstance(monster, Dragon): 
                 monster.update(player_rect)
             else: 
-                monster.update()
+                monster.update(self.platform_index)
         
-        self.coins.update() # [cite: 9a]
+        self.coins.update(self.platform_index) # [cite: 9a]
 
         # Lógica de remoção e geração de moedas
         for tree in self.trees.copy(): 
@@ -83,7 +176,8 @@ class Environment:
                 for _ in range(tree.coins_on_cut):
                     coin_x = tree.rect.x + random.randint(0, tree.rect.width - 30)
                     coin_y = tree.rect.y + (tree.rect.height // 4) 
-                    self.coins.add(Coin(coin_x, coin_y))
+                    self._spawn_coin(coin_x, coin_y)
+                self.mark_removed("trees", tree)
                 self.trees.remove(tree) 
 
         for monster in self.monsters.copy():
@@ -91,9 +185,35 @@ class Environment:
                 for _ in range(monster.coins_on_defeat):
                     coin_x = monster.rect.x + random.randint(0, monster.rect.width - 30)
                     coin_y = monster.rect.y + (monster.rect.height // 4) 
-                    self.coins.add(Coin(coin_x, coin_y))
+                    self._spawn_coin(coin_x, coin_y)
+                if isinstance(monster, Dragon):
+                    monster.clear_projectiles() # Projéteis de um dragão removido não ficam órfãos
+                self.mark_removed("monsters", monster)
                 self.monsters.remove(monster) 
 
+    def projectile_counts(self) -> list[int]:
+        """
+        Retorna a quantidade de projéteis vivos de cada dragão do cenário.
+        Útil para verificar que os grupos de projéteis continuam limitados em sessões longas.
+        """
+        return [monster.projectile_count for monster in self.monsters if isinstance(monster, Dragon)]
+
+    def dynamic_rects(self, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        Retorna os rects de desenho de tudo que pode mudar de um frame para o outro
+        (árvores, monstros, moedas e projéteis). Plataformas nunca mudam e ficam de fora.
+        Usado pelo modo de retângulos sujos da CenaJogo.
+        Args:
+            alpha (float): Fração do passo de simulação decorrida (mesma usada no draw).
+        """
+        rects = [tree.rect.copy() for tree in self.trees]
+        rects.extend(coin.render_rect(alpha) for coin in self.coins)
+        for monster in self.monsters:
+            rects.append(monster.render_rect(alpha))
+            if isinstance(monster, Dragon):
+                rects.extend(projectile.render_rect(alpha) for projectile in monster.projectiles)
+        return rects
+
     def to_dict(self) -> dict:
         """Converte o estado do ambiente e seus sprites em um dicionário para salvamento."""
         trees_data = [tree.to_dict() for tree in self.trees]
@@ -108,36 +228,116 @@ class Environment:
             "platforms": platforms_data # NOVO: Inclui plataformas nos dados salvos
         }
 
-    def from_dict(self, data: dict) -> None:
-        """Restaura o estado do ambiente e seus sprites a partir de um dicionário."""
+    def from_dict(self, data: dict, lazy: bool = False) -> None:
+        """
+        Restaura o estado do ambiente e seus sprites a partir de um dicionário.
+        Registros vindos do journal trazem o "id"; os do snapshot usam a posição na lista.
+        Args:
+            data (dict): O estado salvo do ambiente.
+            lazy (bool): Só guarda os registros; os sprites são criados depois, aos poucos, por
+                materialize() (cada sprite carrega e escala a sua imagem, o que trava saves grandes).
+        """
+        self._next_id = {kind: 0 for kind in DELTA_KINDS}
+        for kind in DELTA_KINDS:
+            self._dirty[kind].clear()
+            self._removed[kind].clear()
+        self.release_pooled()
         self.trees.empty() 
-        for tree_data in data.get("trees", []):
-            self.trees.add(Tree(0, 0, initial_data=tree_data)) 
-
         self.monsters.empty()
-        for monster_data in data.get("monsters", []):
-            monster_type = monster_data.get("type", "Monster") 
-            if monster_type == "Dragon": 
-                self.monsters.add(Dragon(0, 0, initial_data=monster_data))
+        self.platforms.empty() # NOVO: Limpa plataformas existentes
+
+        # Registros ainda sem sprite: (grupo, id, registro). Plataformas primeiro: o índice delas
+        # é montado assim que ficam prontas
+        self._pending.clear()
+        self._pending.extend(("platforms", index, platform_data) for index, platform_data in enumerate(data.get("platforms", [])))
+        for kind in DELTA_KINDS:
+            for index, record in enumerate(data.get(kind, [])):
+                entity_id = record.get("id", index)
+                self._pending.append((kind, entity_id, record))
+                self._next_id[kind] = max(self._next_id[kind], entity_id + 1)
+        self._pending_total = len(self._pending)
+        self._platforms_pending = True
+
+        if not lazy:
+            self.materialize()
+
+    def release_pooled(self) -> None:
+        """
+        Devolve aos pools as moedas do cenário e os projéteis dos dragões.
+        Chamado quando o cenário é descartado ou substituído, para que os pools não
+        continuem contando como "em uso" sprites de uma partida que acabou.
+        """
+        for monster in self.monsters:
+            if isinstance(monster, Dragon):
+                monster.clear_projectiles()
+        coin_pool.release_all(self.coins)
+
+    @property
+    def loading_progress(self) -> float:
+        """Fração (0 a 1) dos registros carregados que já viraram sprites."""
+        if not self._pending_total:
+            return 1.0
+        return 1.0 - len(self._pending) / self._pending_total
+
+    def materialize(self, budget_ms: float | None = None) -> float:
+        """
+        Cria os sprites dos registros pendentes de um from_dict(lazy=True), na ordem do save.
+        Args:
+            budget_ms (float | None): Tempo máximo gasto nesta chamada (None = cria todos).
+        Returns:
+            float: O progresso do carregamento (1.0 quando o ambiente está completo).
+        """
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        while self._pending:
+            kind, entity_id, record = self._pending.popleft()
+            if kind == "platforms":
+                # A largura/altura salvas definem o tamanho da imagem, então precisam ir para o construtor
+                self.platforms.add(Platform(0, 0, record.get("width", 1), record.get("height", 1), initial_data=record))
+            elif kind == "trees":
+                self.trees.add(self._register(kind, Tree(0, 0, initial_data=record), entity_id))
+            elif kind == "monsters":
+                monster_class = Dragon if record.get("type", "Monster") == "Dragon" else Monster
+                self.monsters.add(self._register(kind, monster_class(0, 0, initial_data=record), entity_id))
             else:
-                self.monsters.add(Monster(0, 0, initial_data=monster_data))
+                self.coins.add(self._register(kind, coin_pool.acquire(0, 0, initial_data=record), entity_id))
 
-        self.coins.empty()
-        for coin_data in data.get("coins", []):
-            self.coins.add(Coin(0, 0, initial_data=coin_data))
+            if self._platforms_pending and self._pending and self._pending[0][0] != "platforms":
+                self._build_platform_index()
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        if self._platforms_pending and not self._pending:
+            self._build_platform_index()
+        return self.loading_progress
+
+    def _build_platform_index(self) -> None:
+        """Monta o índice das plataformas restauradas (todas já viraram sprites)."""
+        self.platform_index.build(self.platforms)
+        self._platforms_pending = False
 
-        self.platforms.empty() # NOVO: Limpa plataformas existentes
-        for platform_data in data.get("platforms", []): # NOVO: Restaura plataformas
-            self.platforms.add(Platform(0, 0, 1, 1, initial_data=platform_data)) # Largura/Altura temp, from_dict irá restaurar
 
+    def snapshot_positions(self) -> None:
+        """
+        Registra a posição de todos os elementos móveis no início de um passo de simulação,
+        para que o desenho possa interpolar entre o passo anterior e o atual.
+        """
+        for monster in self.monsters:
+            monster.snapshot_position()
+            if isinstance(monster, Dragon):
+                for projectile in monster.projectiles:
+                    projectile.snapshot_position()
+        for coin in self.coins:
+            coin.snapshot_position()
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Desenha todos os elementos do ambiente na tela.
         Args:
             screen (pygame.Surface): A superfície da tela do Pygame.
+            alpha (float): Fração do passo de simulação decorrida, para interpolar as posições.
         """
         self.trees.draw(screen)
-        self.monsters.draw(screen) 
-        self.coins.draw(screen)
+        for monster in self.monsters: # Dragon.draw também desenha os projéteis do dragão
+            monster.draw(screen, alpha)
+        for coin in self.coins:
+            coin.draw(screen, alpha)
         self.platforms.draw(screen) # NOVO: Desenha as plataformas
@@ -0,0 +1,66 @@
+import pygame
+
+
+class FontRegistry:
+    """
+    Registro de fontes compartilhado pelo processo inteiro.
+    Cada combinação (família, tamanho, negrito, itálico) é resolvida com SysFont uma única vez,
+    mesmo que as cenas e botões sejam recriados (ex: CenaMenu a cada ESC ou game over).
+    Também guarda as superfícies já renderizadas de textos fixos, como legendas de botões e títulos.
+    """
+    def __init__(self) -> None:
+        self._fonts: dict[tuple[str, int, bool, bool], pygame.font.Font] = {}
+        self._labels: dict[tuple, pygame.Surface] = {}
+
+    def get_font(self, family: str = 'Arial', size: int = 30, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        """
+        Retorna a fonte pedida, criando-a apenas na primeira vez.
+        Args:
+            family (str): Nome da família da fonte do sistema.
+            size (int): Tamanho da fonte.
+            bold (bool): Negrito.
+            italic (bool): Itálico.
+        Returns:
+            pygame.font.Font: A fonte compartilhada.
+        """
+        key = (family, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init() # Garante que o módulo de fontes do Pygame esteja inicializado
+            font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+            self._fonts[key] = font
+        return font
+
+    def render_label(self, text: str, color: tuple[int, int, int], family: str = 'Arial', size: int = 30,
+                     bold: bool = False, italic: bool = False, antialias: bool = True) -> pygame.Surface:
+        """
+        Retorna o texto renderizado, reaproveitando a superfície se ele já foi renderizado antes.
+        Use apenas para textos com poucas variações (legendas, títulos); a superfície
+        é compartilhada e não deve ser modificada.
+        Args:
+            text (str): O texto.
+            color (tuple[int, int, int]): Cor do texto.
+            family (str): Nome da família da fonte do sistema.
+            size (int): Tamanho da fonte.
+            bold (bool): Negrito.
+            italic (bool): Itálico.
+            antialias (bool): Suavização das bordas.
+        Returns:
+            pygame.Surface: A superfície com o texto.
+        """
+        key = (text, color, family, size, bold, italic, antialias)
+        label = self._labels.get(key)
+        if label is None:
+            label = self.get_font(family, size, bold, italic).render(text, antialias, color)
+            self._labels[key] = label
+        return label
+
+    def clear(self) -> None:
+        """Descarta todas as fontes e textos em cache."""
+        self._fonts.clear()
+        self._labels.clear()
+
+
+# Instância compartilhada pelo jogo inteiro
+font_registry = FontRegistry()
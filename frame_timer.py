@@ -0,0 +1,100 @@
+import time
+from collections import deque
+
+
+class FrameTimer:
+    """
+    Mede quanto tempo cada fase de um frame levou (eventos, atualizar, desenhar, flip...).
+    Uso:
+        started = frame_timer.start()
+        ...fase...
+        frame_timer.stop("desenhar", started)
+    Desligado (enabled = False), start() e stop() só testam um booleano: os pontos de medição
+    podem ficar no loop do jogo sem custo perceptível.
+    """
+    def __init__(self, window: int = 240) -> None:
+        """
+        Inicializa o medidor.
+        Args:
+            window (int): Quantos frames recentes entram nas estatísticas (percentis e gráfico).
+        """
+        self.enabled: bool = False
+        self.window: int = window
+        self.frame_times: deque[float] = deque(maxlen=window) # Duração total (ms) dos últimos frames
+        self.phase_history: dict[str, deque[float]] = {}
+        self.last_frame: dict[str, float] = {} # Fases (ms) do último frame completo
+        self._current: dict[str, float] = {}
+        self._frame_start: float = 0.0
+
+    def start(self) -> float:
+        """
+        Marca o início de uma fase.
+        Returns:
+            float: Instante de início, a ser passado para stop() (0.0 se desligado).
+        """
+        if not self.enabled:
+            return 0.0
+        return time.perf_counter()
+
+    def stop(self, phase: str, started: float) -> None:
+        """
+        Acumula o tempo de uma fase no frame atual (uma fase pode rodar várias vezes por frame,
+        como o atualizar em frames com vários passos de simulação).
+        Args:
+            phase (str): Nome da fase.
+            started (float): Valor retornado por start().
+        """
+        if not self.enabled:
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        self._current[phase] = self._current.get(phase, 0.0) + elapsed
+
+    def begin_frame(self) -> None:
+        """Marca o início de um frame."""
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Fecha o frame atual e o acrescenta ao histórico."""
+        if not self.enabled or not self._frame_start:
+            return
+        total = (time.perf_counter() - self._frame_start) * 1000
+        self._frame_start = 0.0
+        self.frame_times.append(total)
+        for phase, elapsed in self._current.items():
+            history = self.phase_history.get(phase)
+            if history is None:
+                history = self.phase_history[phase] = deque(maxlen=self.window)
+            history.append(elapsed)
+        self._current["frame"] = total
+        self.last_frame = self._current
+
+    def percentiles(self, phase: str | None = None, quantiles: tuple[int, ...] = (50, 95, 99)) -> dict[int, float]:
+        """
+        Percentis dos tempos recentes.
+        Args:
+            phase (str | None): Fase consultada (None = frame inteiro).
+            quantiles (tuple[int, ...]): Percentis desejados.
+        Returns:
+            dict[int, float]: {percentil: milissegundos}; vazio se ainda não há medições.
+        """
+        samples = self.frame_times if phase is None else self.phase_history.get(phase, ())
+        if not samples:
+            return {}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {q: ordered[min(last, round(q / 100 * last))] for q in quantiles}
+
+    def reset(self) -> None:
+        """Descarta todo o histórico."""
+        self.frame_times.clear()
+        self.phase_history.clear()
+        self.last_frame = {}
+        self._current = {}
+        self._frame_start = 0.0
+
+
+# Instância compartilhada pelo jogo inteiro
+frame_timer = FrameTimer()
@@ -0,0 +1,61 @@
+import pygame
+
+
+class GameClock:
+    """
+    Relógio do jogo usado pelos cooldowns (bolas de fogo, ataques de contato...).
+    A implementação padrão usa o tempo real do Pygame.
+    """
+    def get_ticks(self) -> int:
+        """Retorna o tempo atual do jogo em milissegundos."""
+        return pygame.time.get_ticks()
+
+
+class SimulatedClock(GameClock):
+    """
+    Relógio que só avança quando mandado (a cada passo de simulação).
+    Torna os cooldowns determinísticos e independentes do tempo real, o que permite
+    simular mais rápido que o tempo real (modo headless, replays, testes de carga).
+    """
+    def __init__(self, start_ms: float = 0.0) -> None:
+        """
+        Inicializa o relógio.
+        Args:
+            start_ms (float): Tempo inicial em milissegundos.
+        """
+        self.now_ms: float = start_ms
+
+    def advance(self, delta_ms: float) -> None:
+        """
+        Avança o relógio.
+        Args:
+            delta_ms (float): Milissegundos a avançar (normalmente a duração de um passo de simulação).
+        """
+        self.now_ms += delta_ms
+
+    def get_ticks(self) -> int:
+        return int(self.now_ms)
+
+
+# Relógio atual do processo; o Jogo injeta o seu com set_game_clock()
+_current_clock: GameClock = GameClock()
+
+
+def set_game_clock(clock: GameClock) -> None:
+    """
+    Define o relógio usado por get_ticks().
+    Args:
+        clock (GameClock): O novo relógio.
+    """
+    global _current_clock
+    _current_clock = clock
+
+
+def get_game_clock() -> GameClock:
+    """Retorna o relógio atual."""
+    return _current_clock
+
+
+def get_ticks() -> int:
+    """Tempo atual do jogo em milissegundos, segundo o relógio injetado."""
+    return _current_clock.get_ticks()
@@ -0,0 +1,143 @@
+import atexit
+import sys
+import threading
+from collections import deque
+from core.settings import LOG_LEVEL, LOG_DISABLED_CATEGORIES, LOG_BUFFER_SIZE, LOG_FILE
+
+DEBUG: int = 10
+INFO: int = 20
+WARNING: int = 30
+ERROR: int = 40
+
+LEVEL_NAMES: dict[int, str] = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS_BY_NAME: dict[str, int] = {name: level for level, name in LEVEL_NAMES.items()}
+
+
+class GameLogger:
+    """
+    Logger do jogo com níveis e categorias ("combate", "moedas", "espada"...).
+    As mensagens vão para um buffer circular e são formatadas e escritas por uma thread
+    de fundo, então quem registra nunca espera pelo terminal ou pelo disco.
+    Mensagens abaixo do nível ou de categorias desligadas são descartadas logo na entrada:
+    custam uma comparação e uma consulta a um conjunto.
+    """
+    def __init__(self, level: int = INFO, capacity: int = 4096, flush_interval: float = 0.25,
+                 path: str | None = None, to_stdout: bool = True) -> None:
+        """
+        Inicializa o logger (a thread de escrita só é criada na primeira mensagem aceita).
+        Args:
+            level (int): Nível mínimo das mensagens aceitas.
+            capacity (int): Tamanho do buffer circular; se encher, as mensagens mais antigas são perdidas.
+            flush_interval (float): Intervalo (em segundos) entre as escritas da thread de fundo.
+            path (str | None): Arquivo onde as mensagens também são gravadas.
+            to_stdout (bool): Se as mensagens também vão para a saída padrão.
+        """
+        self.level: int = level
+        self.flush_interval: float = flush_interval
+        self.path: str | None = path
+        self.to_stdout: bool = to_stdout
+        self.dropped: int = 0 # Mensagens perdidas por buffer cheio
+        self._disabled: set[str] = set()
+        self._buffer: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock() # Uma escrita por vez (thread de fundo ou flush() explícito)
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._file = None
+
+    def set_level(self, level: int) -> None:
+        """
+        Define o nível mínimo das mensagens aceitas.
+        Args:
+            level (int): DEBUG, INFO, WARNING ou ERROR.
+        """
+        self.level = level
+
+    def set_category(self, category: str, enabled: bool) -> None:
+        """
+        Liga ou desliga uma categoria.
+        Args:
+            category (str): Nome da categoria.
+            enabled (bool): Se as mensagens dela devem ser registradas.
+        """
+        if enabled:
+            self._disabled.discard(category)
+        else:
+            self._disabled.add(category)
+
+    def is_enabled(self, category: str, level: int = DEBUG) -> bool:
+        """
+        Se uma mensagem dessa categoria e nível seria registrada.
+        Útil para pular trabalho caro feito só para montar a mensagem.
+        """
+        return level >= self.level and category not in self._disabled
+
+    def log(self, level: int, category: str, message: str, *args) -> None:
+        """
+        Registra uma mensagem. A formatação (message.format(*args)) só acontece na thread de escrita.
+        Args:
+            level (int): Nível da mensagem.
+            category (str): Categoria da mensagem.
+            message (str): Texto, com campos {} para os argumentos.
+            *args: Valores dos campos (devem ser imutáveis, pois são formatados depois).
+        """
+        if level < self.level or category in self._disabled:
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((level, category, message, args))
+        if self._thread is None:
+            self._start()
+        if level >= WARNING:
+            self._wakeup.set() # Avisos e erros aparecem sem esperar o próximo intervalo
+
+    def debug(self, category: str, message: str, *args) -> None:
+        self.log(DEBUG, category, message, *args)
+
+    def info(self, category: str, message: str, *args) -> None:
+        self.log(INFO, category, message, *args)
+
+    def warning(self, category: str, message: str, *args) -> None:
+        self.log(WARNING, category, message, *args)
+
+    def error(self, category: str, message: str, *args) -> None:
+        self.log(ERROR, category, message, *args)
+
+    def _start(self) -> None:
+        """Cria a thread de escrita e garante uma última escrita ao sair do processo."""
+        self._thread = threading.Thread(target=self._run, name="game-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self) -> None:
+        """Laço da thread de escrita."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Formata e escreve todas as mensagens pendentes no buffer."""
+        with self._lock:
+            if not self._buffer:
+                return
+            lines = []
+            while self._buffer:
+                level, category, message, args = self._buffer.popleft()
+                text = message.format(*args) if args else message
+                prefix = f"[{category}]" if level < WARNING else f"[{category}] {LEVEL_NAMES[level]}:"
+                lines.append(f"{prefix} {text}\n")
+            output = "".join(lines)
+            if self.to_stdout:
+                sys.stdout.write(output)
+                sys.stdout.flush()
+            if self.path:
+                if self._file is None:
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(output)
+                self._file.flush()
+
+
+# Instância compartilhada pelo jogo inteiro
+game_logger = GameLogger(LEVELS_BY_NAME.get(LOG_LEVEL, INFO), capacity=LOG_BUFFER_SIZE, path=LOG_FILE)
+for _category in LOG_DISABLED_CATEGORIES:
+    game_logger.set_category(_category, False)
@@ -0,0 +1,74 @@
+import pygame
+from core.font_registry import font_registry
+
+
+class Hud:
+    """
+    Interface de informações do jogo (moedas, espada, vida...).
+    Cada linha só é renderizada de novo quando o seu valor muda, e as linhas são
+    compostas em uma superfície em cache: um frame sem mudanças custa um único blit.
+    """
+    def __init__(self, linhas: list[tuple[str, str]], posicao: tuple[int, int] = (10, 10),
+                 espacamento: int = 40, cor: tuple[int, int, int] = (0, 0, 0)) -> None:
+        """
+        Inicializa a HUD.
+        Args:
+            linhas (list[tuple[str, str]]): Pares (chave, formato) na ordem de exibição,
+                ex: ("moedas", "Moedas: {}").
+            posicao (tuple[int, int]): Canto superior esquerdo da HUD na tela.
+            espacamento (int): Distância vertical entre as linhas, em pixels.
+            cor (tuple[int, int, int]): Cor do texto.
+        """
+        self.fonte = font_registry.get_font('Arial', 30) # Resolvida uma única vez, não a cada frame
+        self.posicao = posicao
+        self.espacamento: int = espacamento
+        self.cor = cor
+
+        self._ordem: list[str] = [chave for chave, _ in linhas]
+        self._formatos: dict[str, str] = dict(linhas)
+        self._valores: dict[str, object] = {}
+        self._textos: dict[str, pygame.Surface] = {}
+
+        self.superficie: pygame.Surface | None = None
+        self.suja: bool = True # Se a superfície composta precisa ser refeita
+
+    def definir_valor(self, chave: str, valor) -> None:
+        """
+        Atualiza o valor de uma linha. Só renderiza o texto se o valor mudou.
+        Args:
+            chave (str): A chave da linha (definida no construtor).
+            valor: O novo valor a ser exibido.
+        """
+        if chave in self._valores and self._valores[chave] == valor:
+            return
+        self._valores[chave] = valor
+        texto = self._formatos[chave].format(valor)
+        self._textos[chave] = self.fonte.render(texto, True, self.cor)
+        self.suja = True
+
+    def _compor(self) -> None:
+        """Monta a superfície em cache com todas as linhas já renderizadas."""
+        linhas = [self._textos[chave] for chave in self._ordem if chave in self._textos]
+        largura = max((linha.get_width() for linha in linhas), default=1)
+        altura = self.espacamento * (len(linhas) - 1) + linhas[-1].get_height() if linhas else 1
+        self.superficie = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        for indice, linha in enumerate(linhas):
+            self.superficie.blit(linha, (0, indice * self.espacamento))
+        self.suja = False
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Área ocupada pela HUD na tela."""
+        if self.superficie is None or self.suja:
+            self._compor()
+        return self.superficie.get_rect(topleft=self.posicao)
+
+    def desenhar(self, tela: pygame.Surface) -> None:
+        """
+        Desenha a HUD na tela (refaz a composição apenas se algum valor mudou).
+        Args:
+            tela (pygame.Surface): A superfície onde a HUD será desenhada.
+        """
+        if self.suja or self.superficie is None:
+            self._compor()
+        tela.blit(self.superficie, self.posicao)
@@ -0,0 +1,45 @@
+import pygame
+
+
+class Interpolated:
+    """
+    Mixin para sprites que se movem: guarda a posição do passo de simulação anterior
+    e calcula a posição de desenho entre ela e a atual.
+    Com a simulação rodando em passo fixo, o rect só muda nos passos; desenhar na
+    posição interpolada mantém o movimento suave em taxas de renderização maiores.
+
+    Quem usa deve ter um atributo rect e chamar snapshot_position() no início de cada
+    passo de simulação (e depois de qualquer teletransporte, como reset de pool).
+    """
+    previous_pos: tuple[int, int] | None = None
+
+    def snapshot_position(self) -> None:
+        """Registra a posição atual como a posição do passo anterior."""
+        self.previous_pos = self.rect.topleft
+
+    def render_pos(self, alpha: float = 1.0) -> tuple[int, int]:
+        """
+        Retorna a posição (topleft) de desenho interpolada.
+        Args:
+            alpha (float): Fração (0.0 a 1.0) do passo de simulação já decorrida.
+                1.0 desenha na posição atual; 0.0 na posição do passo anterior.
+        Returns:
+            tuple[int, int]: Posição de desenho.
+        """
+        x, y = self.rect.topleft
+        previous = self.previous_pos
+        if alpha >= 1.0 or previous is None or previous == (x, y):
+            return x, y
+        previous_x, previous_y = previous
+        return (round(previous_x + (x - previous_x) * alpha),
+                round(previous_y + (y - previous_y) * alpha))
+
+    def render_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """
+        Retorna um novo rect na posição de desenho interpolada (ex: para retângulos sujos).
+        Args:
+            alpha (float): Fração do passo de simulação já decorrida.
+        Returns:
+            pygame.Rect: Rect com o tamanho do sprite na posição interpolada.
+        """
+        return pygame.Rect(self.render_pos(alpha), self.rect.size)
@@ -2,19 +2,36 @@ import pygame
 import sys
 from abc import ABC, abstractmethod
 import os 
+import io
+import time
+import random
 
 from cena import Cena 
 from cena_menu import CenaMenu
 from cena_opcoes import CenaOpcoes
 from cena_jogo import CenaJogo 
-from save_system.save_load import SaveLoad # Importa SaveLoad [cite: 9a]
+from cena_slots import CenaSlots
+from cena_carregando import CenaCarregando
+from asset_manifest import GAME_ASSETS, MENU_MUSIC_PATH, GAME_MUSIC_PATH
+from save_system.save_load import SaveLoad, SaveCallback # Importa SaveLoad [cite: 9a]
 from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, CAPTION # Importa configurações básicas [cite: 9a]
+from core.settings import SIMULATION_HZ, MAX_SIMULATION_STEPS_PER_FRAME, MAX_FRAME_TIME_MS, RENDER_FPS
+from core.settings import PROFILE_CAPTURE_FRAMES, SAVE_THUMBNAIL_SIZE
+from core.game_clock import SimulatedClock, set_game_clock
+from core.replay import InputRecorder, InputReplayer
+from core.frame_timer import frame_timer
+from core.perf_overlay import PerfOverlay
+from core.telemetry import TelemetryWriter
+from core.profiler import FrameProfiler
+from core.game_logger import game_logger
+from core.asset_cache import asset_cache
+from core.asset_loader import AssetLoader
 
 
 class Jogo:
     """Classe principal que controla o loop do jogo e gerencia as cenas"""
     
-    def __init__(self, largura: int = SCREEN_WIDTH, altura: int = SCREEN_HEIGHT, titulo: str = CAPTION):
+    def __init__(self, largura: int = SCREEN_WIDTH, altura: int = SCREEN_HEIGHT, titulo: str = CAPTION, headless: bool = False):
         """
         Inicializa o jogo com configurações básicas
         
@@ -22,7 +39,14 @@ class Jogo:
             largura (int): Largura da janela em pixels
             altura (int): Altura da janela em pixels
             titulo (str): Título da janela
+            headless (bool): Roda sem janela nem áudio (drivers "dummy" do SDL), sem desenhar,
+                e com a simulação avançando o mais rápido possível (testes de carga, CI, balanceamento)
         """
+        self.headless: bool = headless
+        if headless:
+            # Precisa ser definido antes do pygame.init()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         pygame.mixer.init() # Inicializa o módulo de mixer para áudio
         self.tela = pygame.display.set_mode((largura, altura))
@@ -33,13 +57,38 @@ class Jogo:
         self.altura = altura
         self.rodando = True
 
+        # Loop de passo fixo: a simulação roda a simulacao_hz independentemente da taxa de renderização.
+        # A taxa é fixa (ver SIMULATION_HZ): a física do jogo é calibrada por passo a 60 Hz
+        self.simulacao_hz: int = SIMULATION_HZ
+        self.max_passos_por_frame: int = MAX_SIMULATION_STEPS_PER_FRAME
+        self.fps_render: int = RENDER_FPS # 0 = renderiza o mais rápido possível (sem vsync, sem espera)
+        self.alpha_interpolacao: float = 1.0 # Fração do passo de simulação decorrida no momento do desenho
+
+        # Relógio do jogo: avança um passo de simulação por vez, então os cooldowns
+        # seguem o tempo simulado (e não o tempo real) em qualquer modo
+        self.relogio = SimulatedClock()
+        set_game_clock(self.relogio)
+        self.passos_simulados: int = 0
+
+        # Gravação/reprodução das entradas (ver gravar_entradas e reproduzir_entradas)
+        self.gravador: InputRecorder | None = None
+        self.reprodutor: InputReplayer | None = None
+
+        # Painel de desempenho (F3); as fases só são medidas enquanto ele está visível
+        self.painel_desempenho = PerfOverlay()
+        # Telemetria por frame gravada em arquivo (ver iniciar_telemetria)
+        self.telemetria: TelemetryWriter | None = None
+        self.frames_renderizados: int = 0
+        # Captura do cProfile sob demanda (F9 ou --profile-frames)
+        self.perfilador = FrameProfiler()
+
         # Atributos para controle de volume
         self.volume_musica: float = 0.5  # 50% do volume [cite: 10d]
         self.volume_efeitos: float = 0.75 # 75% do volume [cite: 10d]
         
         # Caminhos dos arquivos de música
-        self.musica_fundo_menu_path = os.path.join("assets", "sounds", "orb8bt.mp3") # [cite: 9a]
-        self.musica_fundo_jogo_path = os.path.join("assets", "sounds", "game_music.mp3") # Exemplo: outra música para o jogo [cite: 9a]
+        self.musica_fundo_menu_path = MENU_MUSIC_PATH # [cite: 9a]
+        self.musica_fundo_jogo_path = GAME_MUSIC_PATH # Exemplo: outra música para o jogo [cite: 9a]
         
         self.musica_atual_tocando: str | None = None # Atributo para guardar o caminho da música que está atualmente tocando
 
@@ -47,7 +96,16 @@ class Jogo:
 
         # Começa com a cena do menu
         # NOTA: Passa 'self' (a instância do Jogo) para a CenaMenu.
-        self.mudar_cena(CenaMenu(self)) 
+        self.carregador_assets: AssetLoader | None = None
+        if headless:
+            self.mudar_cena(CenaMenu(self)) # Sem janela, os assets são carregados quando pedidos
+        else:
+            # Imagens, sons e músicas são lidos em segundo plano enquanto a CenaCarregando mostra o
+            # progresso; o menu (e o primeiro frame da CenaJogo) já os encontra no cache
+            self.carregador_assets = AssetLoader()
+            self.carregador_assets.start(GAME_ASSETS)
+            self.mudar_cena(CenaCarregando(self, self.carregador_assets.finalize,
+                                           lambda: self.mudar_cena(CenaMenu(self))))
         
     def mudar_musica(self, caminho_nova_musica: str) -> None:
         """
@@ -66,10 +124,16 @@ class Jogo:
             pygame.mixer.music.stop()
             # print("Parando música atual.") # Debug removido
 
-        # Carregar e tocar a nova música
-        if os.path.exists(caminho_nova_musica):
+        # Carregar e tocar a nova música (da memória, se foi pré-carregada, sem ler o disco na troca de cena)
+        dados_musica = asset_cache.get_music(caminho_nova_musica)
+        if dados_musica is not None or os.path.exists(caminho_nova_musica):
             try:
-                pygame.mixer.music.load(caminho_nova_musica)
+                if dados_musica is not None:
+                    # O mixer lê a música por stream: o buffer precisa continuar vivo enquanto ela toca
+                    self._buffer_musica = io.BytesIO(dados_musica)
+                    pygame.mixer.music.load(self._buffer_musica, os.path.splitext(caminho_nova_musica)[1].lstrip("."))
+                else:
+                    pygame.mixer.music.load(caminho_nova_musica)
                 pygame.mixer.music.set_volume(self.volume_musica) # [cite: 10d]
                 pygame.mixer.music.play(-1) # -1 para loop infinito
                 self.musica_atual_tocando = caminho_nova_musica
@@ -112,73 +176,306 @@ class Jogo:
         # Este volume será aplicado a cada som de efeito ao ser carregado/tocado (não afeta mixer globalmente)
         # print(f"Volume dos efeitos definido para: {self.volume_efeitos}") # Debug removido
         
-    def executar(self) -> None: 
+    def executar(self, max_passos: int | None = None) -> None: 
         """
         Executa o loop principal do jogo.
+        A simulação (atualizar) avança em passos fixos de 1/simulacao_hz segundos, tantos quantos
+        couberem no tempo real decorrido; a renderização (desenhar) acontece uma vez por volta do loop.
+        No modo headless, não há desenho nem espera: cada volta é um passo de simulação.
+        Args:
+            max_passos (int | None): Encerra depois deste número de passos de simulação (None = sem limite).
+        """
+        self.max_passos = max_passos
+        if self.headless:
+            self._executar_headless()
+        else:
+            self._executar_janela()
+        if self.gravador:
+            self.gravador.close()
+        if self.telemetria:
+            self.telemetria.close()
+        self.perfilador.stop() # Salva uma captura interrompida pelo fim do jogo
+        self.save_load_system.shutdown() # Não perde um save ainda sendo escrito
+        game_logger.flush()
+        pygame.quit() # Garante que o Pygame seja encerrado corretamente ao sair do loop
+
+    def gravar_entradas(self, caminho: str, semente: int | None = None) -> None:
+        """
+        Passa a gravar os eventos de cada passo de simulação em um arquivo.
+        Deve ser chamado antes de criar a CenaJogo, pois a semente é aplicada ao random
+        usado na geração do cenário.
+        Args:
+            caminho (str): Arquivo de gravação a ser criado.
+            semente (int | None): Semente do random (None = sorteia uma).
+        """
+        if semente is None:
+            semente = random.randrange(2 ** 32)
+        random.seed(semente)
+        self.gravador = InputRecorder(caminho, semente)
+
+    def iniciar_telemetria(self, caminho: str) -> None:
+        """
+        Passa a gravar um registro por frame (tempos de atualizar/desenhar/flip e quantidade
+        de entidades) e um por troca de cena. A escrita em disco acontece em uma thread de fundo.
+        Args:
+            caminho (str): Arquivo de saída (.csv para CSV; qualquer outra extensão grava JSONL).
+        """
+        self.telemetria = TelemetryWriter(caminho)
+        frame_timer.enabled = True
+        self._registrar_evento_telemetria("start")
+
+    def _registrar_evento_telemetria(self, evento: str) -> None:
+        """Grava um registro de evento (início, troca de cena...) na telemetria."""
+        self.telemetria.record({
+            "frame": self.frames_renderizados,
+            "time_ms": round(self.telemetria.elapsed_ms(), 3),
+            "event": evento,
+            "scene": type(self.cena_atual).__name__ if self.cena_atual else None,
+        })
+
+    def _registrar_frame_telemetria(self, passos: int) -> None:
+        """
+        Grava o registro do frame que acabou de terminar.
+        Args:
+            passos (int): Passos de simulação executados no frame.
+        """
+        fases = frame_timer.last_frame
+        contagens = self.cena_atual.obter_contagens() if self.cena_atual else {}
+        self.telemetria.record({
+            "frame": self.frames_renderizados,
+            "time_ms": round(self.telemetria.elapsed_ms(), 3),
+            "event": "frame",
+            "scene": type(self.cena_atual).__name__ if self.cena_atual else None,
+            "steps": passos,
+            "update_ms": round(fases.get("atualizar", 0.0), 4),
+            "draw_ms": round(fases.get("desenhar", 0.0), 4),
+            "flip_ms": round(fases.get("flip", 0.0), 4),
+            "frame_ms": round(fases.get("frame", 0.0), 4),
+            "monsters": contagens.get("monstros", 0),
+            "coins": contagens.get("moedas", 0),
+            "projectiles": contagens.get("projéteis", 0),
+        })
+
+    def reproduzir_entradas(self, caminho: str) -> None:
+        """
+        Passa a alimentar a simulação com os eventos de uma gravação, no lugar do teclado.
+        O jogo termina quando a gravação acaba. Deve ser chamado antes de criar a CenaJogo.
+        Args:
+            caminho (str): Arquivo de gravação.
+        """
+        self.reprodutor = InputReplayer(caminho)
+        random.seed(self.reprodutor.seed)
+
+    def _passo_simulacao(self, eventos: list) -> None:
+        """
+        Executa um passo de simulação da cena atual e avança o relógio do jogo.
+        Args:
+            eventos (list): Eventos entregues a este passo.
         """
+        self.save_load_system.process_completed() # Callbacks de saves em segundo plano já concluídos
+        if self.reprodutor:
+            if self.reprodutor.finished:
+                self.rodando = False
+                return
+            eventos = self.reprodutor.next_tick() # As entradas reais são ignoradas durante a reprodução
+        if self.gravador:
+            self.gravador.record_tick(eventos)
+        if self.cena_atual:
+            self.cena_atual.atualizar(eventos)
+        self.relogio.advance(1000.0 / self.simulacao_hz)
+        self.passos_simulados += 1
+        if self.max_passos is not None and self.passos_simulados >= self.max_passos:
+            self.rodando = False
+
+    def _executar_janela(self) -> None:
+        """Loop com janela: passo fixo de simulação + renderização a cada volta."""
+        passo_ms = 1000.0 / self.simulacao_hz
+        acumulador = 0.0
+        eventos_pendentes: list = [] # Eventos ainda não entregues a um passo de simulação
+        self.clock.tick() # Descarta o tempo gasto antes do loop (carregamento)
+
         while self.rodando:
+            # Limita a renderização (se configurado) e mede o tempo real do frame.
+            # Frames muito longos (janela arrastada, disco lento...) são truncados para
+            # que a simulação não tente recuperar um atraso impossível.
+            tempo_frame = min(self.clock.tick(self.fps_render), MAX_FRAME_TIME_MS)
+            acumulador += tempo_frame
+
+            frame_timer.begin_frame()
+
+            inicio_fase = frame_timer.start()
             eventos = pygame.event.get()
             for evento in eventos:
                 if evento.type == pygame.QUIT:
                     self.rodando = False
+                elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3:
+                    self.alternar_painel_desempenho()
+                elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_F9:
+                    self.capturar_perfil()
+            eventos_pendentes.extend(eventos)
+            frame_timer.stop("eventos", inicio_fase)
+
+            passos = 0
+            inicio_fase = frame_timer.start()
+            while acumulador >= passo_ms and passos < self.max_passos_por_frame and self.rodando:
+                # Os eventos vão inteiros para o primeiro passo; os seguintes não recebem eventos
+                self._passo_simulacao(eventos_pendentes)
+                eventos_pendentes = []
+                acumulador -= passo_ms
+                passos += 1
+            frame_timer.stop("atualizar", inicio_fase)
+            if acumulador >= passo_ms:
+                # Limite de recuperação atingido: descarta o atraso em vez de acumulá-lo para sempre
+                acumulador %= passo_ms
+            # Quanto do próximo passo já passou: as cenas desenham entre o passo anterior e o atual
+            self.alpha_interpolacao = acumulador / passo_ms
             
+            inicio_fase = frame_timer.start()
+            areas_alteradas = None
             if self.cena_atual:
-                self.cena_atual.atualizar(eventos)
                 self.cena_atual.desenhar(self.tela)
+                areas_alteradas = self.cena_atual.obter_areas_alteradas()
+                if self.painel_desempenho.visible:
+                    area_painel = self.painel_desempenho.draw(self.tela, self.cena_atual.obter_contagens(), self.clock.get_fps())
+                    if areas_alteradas is not None:
+                        areas_alteradas = areas_alteradas + [area_painel]
+            frame_timer.stop("desenhar", inicio_fase)
             
-            pygame.display.flip()
-            self.clock.tick(60)
+            inicio_fase = frame_timer.start()
+            if areas_alteradas is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(areas_alteradas) # Só as regiões que mudaram
+            frame_timer.stop("flip", inicio_fase)
 
-        pygame.quit() # Garante que o Pygame seja encerrado corretamente ao sair do loop
-        sys.exit()
+            frame_timer.end_frame()
+            self.frames_renderizados += 1
+            if self.telemetria:
+                self._registrar_frame_telemetria(passos)
+            self.perfilador.end_frame()
+
+    def capturar_perfil(self, frames: int = PROFILE_CAPTURE_FRAMES) -> None:
+        """
+        Captura os próximos frames com o cProfile (F9). Ignorado se já há uma captura em andamento.
+        Args:
+            frames (int): Quantos frames capturar.
+        """
+        nome_cena = type(self.cena_atual).__name__ if self.cena_atual else "SemCena"
+        self.perfilador.start(frames, nome_cena)
+
+    def alternar_painel_desempenho(self) -> None:
+        """
+        Liga/desliga o painel de desempenho (F3) e, com ele, a medição das fases do frame.
+        """
+        visivel = self.painel_desempenho.toggle()
+        frame_timer.enabled = visivel or self.telemetria is not None
+        if visivel:
+            frame_timer.reset() # Estatísticas só do período observado
+        elif self.cena_atual:
+            self.cena_atual.invalidar() # Apaga o painel que ficou na tela
+
+    def _executar_headless(self) -> None:
+        """Loop headless: um passo de simulação por volta, sem desenhar e sem esperar o tempo real."""
+        inicio = time.perf_counter()
+        while self.rodando:
+            frame_timer.begin_frame()
+            eventos = pygame.event.get()
+            for evento in eventos:
+                if evento.type == pygame.QUIT:
+                    self.rodando = False
+            inicio_fase = frame_timer.start()
+            self._passo_simulacao(eventos)
+            frame_timer.stop("atualizar", inicio_fase)
+            frame_timer.end_frame()
+            self.frames_renderizados += 1 # No modo headless, cada passo conta como um frame
+            if self.telemetria:
+                self._registrar_frame_telemetria(1)
+            self.perfilador.end_frame()
+
+        duracao = time.perf_counter() - inicio
+        passos_por_segundo = self.passos_simulados / duracao if duracao > 0 else 0.0
+        print(f"Simulação headless: {self.passos_simulados} passos em {duracao:.2f}s ({passos_por_segundo:.0f} passos/s)")
 
     def mudar_cena(self, nova_cena: Cena) -> None: # Tipagem Cena
         """
         Altera a cena atual do jogo.
+        Gravações e reproduções de entradas cobrem só a partida: sair da CenaJogo (ESC, game over)
+        encerra o jogo, pois os menus dependem do mouse, que não é gravado.
         Args:
             nova_cena (Cena): A nova cena a ser exibida.
         """
+        if (self.gravador or self.reprodutor) and isinstance(self.cena_atual, CenaJogo) and nova_cena is not self.cena_atual:
+            game_logger.info("jogo", "Fim da partida gravada/reproduzida no passo {}.", self.passos_simulados + 1)
+            self.cena_atual.finalizar()
+            self.rodando = False
+            return
+        if self.cena_atual is not None and self.cena_atual is not nova_cena:
+            self.cena_atual.finalizar() # A cena antiga devolve o que pegou dos pools
         self.cena_atual = nova_cena
+        if self.telemetria:
+            self._registrar_evento_telemetria("scene_change")
         
         # Controlar a música com base na cena
         if isinstance(nova_cena, CenaMenu): # [cite: 9a]
             self.mudar_musica(self.musica_fundo_menu_path) 
-        elif isinstance(nova_cena, CenaOpcoes): # Se for para a cena de opções
-            self.mudar_musica(self.musica_fundo_menu_path) # Mantém a música do menu na tela de opções
+        elif isinstance(nova_cena, (CenaOpcoes, CenaSlots)): # Se for para a cena de opções ou de slots
+            self.mudar_musica(self.musica_fundo_menu_path) # Mantém a música do menu nas telas do menu
+        elif isinstance(nova_cena, CenaCarregando):
+            pass # Mantém a música que estiver tocando durante o carregamento
         elif isinstance(nova_cena, CenaJogo): # [cite: 9a]
             self.mudar_musica(self.musica_fundo_jogo_path) # Toca a música do jogo
         else:
             self.parar_musica() # Para a música para outras cenas (ex: Game Over, se não tiver música própria)
 
-    def save_game_state(self, player_data: dict, environment_data: dict) -> None:
+    def save_game_state(self, player_data: dict, environment_data: dict, ao_concluir: SaveCallback | None = None,
+                        slot: int | None = None, tempo_jogo_ms: float = 0) -> None:
         """
-        Salva o estado atual do jogo.
+        Salva o estado atual do jogo em segundo plano (o frame não espera pela escrita).
         Args:
             player_data (dict): Dados serializados do jogador.
             environment_data (dict): Dados serializados do ambiente.
+            ao_concluir (SaveCallback | None): Chamado na thread principal com (sucesso, mensagem)
+                quando o save terminar.
+            slot (int | None): Slot de destino (None = arquivo único, sem entrada no índice).
+            tempo_jogo_ms (float): Tempo total de jogo da partida, mostrado na escolha de slots.
         """
         game_state = {
             "player": player_data,
             "environment": environment_data,
             "current_scene": "CenaJogo", # Indica a cena para a qual o jogo deve voltar
             "music_volume": self.volume_musica,
-            "sfx_volume": self.volume_efeitos
+            "sfx_volume": self.volume_efeitos,
+            "play_time_ms": int(tempo_jogo_ms)
         }
-        self.save_load_system.save_game(game_state)
+        miniatura = self._capturar_miniatura() if slot else None
+        self.save_load_system.save_game_async(game_state, ao_concluir, slot, miniatura)
+
+    def _capturar_miniatura(self) -> pygame.Surface:
+        """Retorna uma cópia reduzida do último frame desenhado (a gravação em PNG fica com a thread de save)."""
+        try:
+            return pygame.transform.smoothscale(self.tela, SAVE_THUMBNAIL_SIZE)
+        except ValueError: # smoothscale exige superfícies de 24 ou 32 bits
+            return pygame.transform.scale(self.tela, SAVE_THUMBNAIL_SIZE)
 
-    def load_game_state(self) -> dict | None:
+    def load_game_state(self, slot: int | None = None) -> dict | None:
         """
-        Carrega o estado do jogo salvo e muda para a cena de jogo com esses dados.
+        Carrega o estado do jogo salvo e muda para a cena de jogo com esses dados,
+        passando pela cena de carregamento enquanto os sprites do cenário são criados.
+        Args:
+            slot (int | None): Slot a carregar (None = arquivo único).
         Returns:
             dict | None: Os dados do jogo carregados, ou None se falhar.
         """
-        loaded_data = self.save_load_system.load_game()
+        loaded_data = self.save_load_system.load_game(slot)
         if loaded_data:
             print("Dados carregados com sucesso. Preparando para iniciar CenaJogo com dados...")
             # Aplica os volumes salvos
             self.definir_volume_musica(loaded_data.get("music_volume", self.volume_musica))
             self.definir_volume_efeitos(loaded_data.get("sfx_volume", self.volume_efeitos))
 
-            # Mude para a cena do jogo passando os dados carregados
-            self.mudar_cena(CenaJogo(self, initial_game_data=loaded_data)) # Passa os dados para a CenaJogo
+            # Os sprites do cenário são criados aos poucos pela CenaCarregando, que mostra o progresso;
+            # a CenaJogo só entra quando o cenário está completo
+            cena_jogo = CenaJogo(self, initial_game_data=loaded_data, slot=slot, carregamento_gradual=True)
+            self.mudar_cena(CenaCarregando(self, cena_jogo.environment.materialize,
+                                           lambda: self.mudar_cena(cena_jogo), "Carregando o mundo..."))
         return loaded_data
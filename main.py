@@ -1,20 +1,66 @@
 import pygame
 import sys
+import argparse
 from jogo import Jogo
 from cena_menu import CenaMenu
+from cena_jogo import CenaJogo
+from core.game_logger import game_logger, LEVELS_BY_NAME
 
 def main():
     """
     Função principal que inicializa o Pygame e inicia o jogo.
     """
+    parser = argparse.ArgumentParser(description="A Lenda da Espada Crescente")
+    parser.add_argument("--headless", action="store_true",
+                        help="Roda a simulação sem janela nem áudio, o mais rápido possível (CI, testes de carga)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="Encerra depois deste número de passos de simulação")
+    parser.add_argument("--record", metavar="ARQUIVO",
+                        help="Grava as entradas e a semente do random para reproduzir a partida depois")
+    parser.add_argument("--replay", metavar="ARQUIVO",
+                        help="Reproduz uma partida gravada com --record (com ou sem --headless)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semente do random usada com --record")
+    parser.add_argument("--telemetry", metavar="ARQUIVO",
+                        help="Grava tempos e contagens de cada frame em ARQUIVO (.jsonl ou .csv)")
+    parser.add_argument("--profile-frames", type=int, default=None, metavar="N",
+                        help="Captura os primeiros N frames com o cProfile (F9 captura durante o jogo)")
+    parser.add_argument("--log-level", choices=list(LEVELS_BY_NAME), default=None,
+                        help="Nível mínimo do log (DEBUG mostra combate, moedas etc.)")
+    parser.add_argument("--mute", nargs="+", default=[], metavar="CATEGORIA",
+                        help="Silencia categorias do log, ex: --mute combate moedas")
+    args = parser.parse_args()
+
+    if args.log_level:
+        game_logger.set_level(LEVELS_BY_NAME[args.log_level])
+    for categoria in args.mute:
+        game_logger.set_category(categoria, False)
+
     # Cria a instância do jogo
-    jogo = Jogo()
+    jogo = Jogo(headless=args.headless)
     
     # Define a cena inicial para o menu
     # O jogo já inicializa com o menu dentro do seu __init__
+    if args.telemetry:
+        jogo.iniciar_telemetria(args.telemetry)
+    if args.replay:
+        jogo.reproduzir_entradas(args.replay)
+    elif args.record:
+        jogo.gravar_entradas(args.record, args.seed)
+
+    if args.headless or args.record or args.replay:
+        # Sem janela não há menu para clicar, e gravações começam sempre do mesmo ponto:
+        # a simulação começa direto no jogo, fora dos slots de save do jogador
+        if jogo.carregador_assets is not None:
+            jogo.carregador_assets.finalize() # Termina o pré-carregamento que a CenaCarregando faria
+        jogo.mudar_cena(CenaJogo(jogo, sem_slot=True))
     
+    if args.profile_frames:
+        jogo.capturar_perfil(args.profile_frames)
+
     # Inicia o loop principal
-    jogo.executar()
+    jogo.executar(max_passos=args.frames)
+    sys.exit()
 
 if __name__ == "__main__":
     main()
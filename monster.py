@@ -1,7 +1,21 @@
 import pygame
 from core.settings import COINS_PER_MONSTER_KILL, SCREEN_HEIGHT # [cite: 9a]
+from core.asset_cache import asset_cache
+from world.platform_index import PlatformIndex
+from core.interpolation import Interpolated
+from core.game_logger import game_logger
 
-class Monster(pygame.sprite.Sprite):
+MONSTER_IMAGE_PATH: str = "assets/images/monster.png"
+MONSTER_SIZE: tuple[int, int] = (90, 90) # Tamanho do monstro
+
+
+def _monster_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Retângulo vermelho usado quando monster.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((255, 0, 0)) # Vermelho
+    return surface
+
+class Monster(Interpolated, pygame.sprite.Sprite):
     """
     Representa um inimigo genérico com movimento básico, vida e dano.
     """
@@ -17,13 +31,8 @@ class Monster(pygame.sprite.Sprite):
             initial_data (dict | None): Dados para restaurar o estado do monstro.
         """
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/monster.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (90, 90)) # Tamanho do monstro [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem do monstro (monster.png) não encontrada. Usando um retângulo vermelho como placeholder.")
-            self.image = pygame.Surface((90, 90), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            self.image.fill((255, 0, 0)) # Vermelho
+        self.image_right, self.image_left = asset_cache.get_oriented(MONSTER_IMAGE_PATH, MONSTER_SIZE, placeholder=_monster_placeholder)
+        self.image = self.image_right
         
         self.rect = self.image.get_rect(topleft=(x, y))
         self.speed: int = speed
@@ -44,6 +53,7 @@ class Monster(pygame.sprite.Sprite):
 
         if initial_data: # Restaura o estado do monstro se dados forem fornecidos
             self.from_dict(initial_data)
+        self.snapshot_position()
 
 
     def take_damage(self, damage: int) -> int:
@@ -61,15 +71,17 @@ class Monster(pygame.sprite.Sprite):
         # print(f"Monstro atingido! Vida restante: {self.health}") # Debug removido
         if self.health <= 0:
             self.is_alive = False
-            print("Monstro derrotado!")
+            game_logger.debug("combate", "Monstro derrotado!")
             # TODO: Tocar som de monstro morrendo
             return self.coins_on_defeat
         return 0
 
-    def update(self) -> None: # NOTA: Este update NÃO recebe player_rect
+    def update(self, platforms: PlatformIndex | None = None) -> None: # NOTA: Este update NÃO recebe player_rect
         """
         Atualiza a lógica do monstro (movimento, física).
         Este método é para monstros que não precisam da posição do jogador.
+        Args:
+            platforms (PlatformIndex | None): Índice de plataformas sobre as quais o monstro pode pousar.
         """
         if not self.is_alive:
             return
@@ -83,6 +95,10 @@ class Monster(pygame.sprite.Sprite):
         elif self.direction == -1 and self.rect.x <= self.walk_limit_left:
             self.direction = 1
 
+        # Troca a referência da imagem (sem transformações) para a direção atual;
+        # assim o Group.draw também desenha o monstro virado corretamente
+        self.image = self.image_right if self.direction == 1 else self.image_left
+
         # Física de Gravidade para Monstro
         self.velocity_y += self.gravity
         self.rect.y += self.velocity_y
@@ -92,20 +108,22 @@ class Monster(pygame.sprite.Sprite):
         if self.rect.bottom >= ground_level:
             self.rect.bottom = ground_level
             self.velocity_y = 0 
+        elif platforms is not None:
+            landing_top = platforms.find_landing(self.rect, self.velocity_y)
+            if landing_top is not None: # Pousa em cima da plataforma
+                self.rect.bottom = landing_top
+                self.velocity_y = 0
             
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Desenha o monstro na tela se estiver vivo.
         Args:
             screen (pygame.Surface): A superfície da tela do Pygame.
+            alpha (float): Fração do passo de simulação decorrida, para interpolar a posição.
         """
         if self.is_alive:
-            # Se o monstro estiver virado para a esquerda, espelha a imagem
-            if self.direction == -1:
-                flipped_image = pygame.transform.flip(self.image, True, False)
-                screen.blit(flipped_image, self.rect)
-            else:
-                screen.blit(self.image, self.rect)
+            # Usa a variação pré-espelhada para a direção atual
+            screen.blit(self.image_right if self.direction == 1 else self.image_left, self.render_pos(alpha))
 
     def to_dict(self) -> dict:
         """Converte o estado do monstro em um dicionário para salvamento."""
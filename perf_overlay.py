@@ -0,0 +1,96 @@
+import pygame
+from core.frame_timer import FrameTimer, frame_timer
+from core.font_registry import font_registry
+
+PANEL_WIDTH: int = 320
+GRAPH_HEIGHT: int = 60
+LINE_HEIGHT: int = 16
+VALUE_COLUMN_X: int = 140 # Onde começam os números das linhas de fases
+FRAME_BUDGET_MS: float = 1000 / 60 # Linha de referência do gráfico (um frame a 60 FPS)
+
+
+class PerfOverlay:
+    """
+    Painel de desempenho (liga/desliga com F3): FPS, percentis p50/p95/p99 do tempo de frame,
+    tempo de cada fase, quantidade de entidades por grupo e um gráfico dos últimos frames.
+    O painel é remontado a cada refresh_interval frames; nos outros, só é copiado para a tela.
+    """
+    def __init__(self, timer: FrameTimer = frame_timer, position: tuple[int, int] | None = None,
+                 refresh_interval: int = 10) -> None:
+        """
+        Inicializa o painel (desligado).
+        Args:
+            timer (FrameTimer): Medidor de onde vêm os tempos.
+            position (tuple[int, int] | None): Canto superior esquerdo do painel (None = canto superior direito da tela).
+            refresh_interval (int): A cada quantos frames o painel é remontado.
+        """
+        self.timer: FrameTimer = timer
+        self.position = position
+        self.refresh_interval: int = refresh_interval
+        self.visible: bool = False
+        self.font = font_registry.get_font('Arial', 14)
+        self._panel: pygame.Surface | None = None
+        self._frames_until_refresh: int = 0
+
+    def toggle(self) -> bool:
+        """
+        Liga ou desliga o painel. Quem desenha o painel deve manter o medidor (timer) ligado enquanto ele está visível.
+        Returns:
+            bool: Se o painel ficou visível.
+        """
+        self.visible = not self.visible
+        self._frames_until_refresh = 0
+        return self.visible
+
+    def _build_panel(self, counts: dict[str, int], fps: float) -> pygame.Surface:
+        """Monta a superfície do painel com os números atuais."""
+        # Cada linha tem um rótulo e, opcionalmente, valores alinhados em uma segunda coluna
+        lines: list[tuple[str, str]] = [(f"FPS: {fps:.1f}", "")]
+        frame = self.timer.percentiles()
+        if frame:
+            lines.append(("frame", f"p50 {frame[50]:.2f}  p95 {frame[95]:.2f}  p99 {frame[99]:.2f} ms"))
+        for phase in sorted(self.timer.phase_history):
+            stats = self.timer.percentiles(phase)
+            lines.append((phase, f"p50 {stats[50]:.2f}  p95 {stats[95]:.2f} ms"))
+        if counts:
+            lines.append(("  ".join(f"{name}: {count}" for name, count in counts.items()), ""))
+
+        height = len(lines) * LINE_HEIGHT + GRAPH_HEIGHT + 12
+        panel = pygame.Surface((PANEL_WIDTH, height))
+        panel.fill((20, 20, 20))
+        for index, (label, values) in enumerate(lines):
+            y = 4 + index * LINE_HEIGHT
+            panel.blit(self.font.render(label, True, (230, 230, 230)), (6, y))
+            if values:
+                panel.blit(self.font.render(values, True, (230, 230, 230)), (VALUE_COLUMN_X, y))
+        self._draw_graph(panel, pygame.Rect(6, height - GRAPH_HEIGHT - 6, PANEL_WIDTH - 12, GRAPH_HEIGHT))
+        return panel
+
+    def _draw_graph(self, panel: pygame.Surface, area: pygame.Rect) -> None:
+        """Desenha uma barra por frame recente; a escala vai até o dobro do orçamento de um frame."""
+        pygame.draw.rect(panel, (45, 45, 45), area)
+        scale = area.height / (FRAME_BUDGET_MS * 2)
+        budget_y = area.bottom - int(FRAME_BUDGET_MS * scale)
+        samples = list(self.timer.frame_times)[-area.width:]
+        for x, elapsed in enumerate(samples):
+            bar = min(area.height, int(elapsed * scale))
+            color = (90, 200, 90) if elapsed <= FRAME_BUDGET_MS else (220, 80, 60)
+            pygame.draw.line(panel, color, (area.left + x, area.bottom - 1), (area.left + x, area.bottom - bar))
+        pygame.draw.line(panel, (240, 200, 60), (area.left, budget_y), (area.right - 1, budget_y))
+
+    def draw(self, screen: pygame.Surface, counts: dict[str, int], fps: float) -> pygame.Rect:
+        """
+        Desenha o painel por cima da cena.
+        Args:
+            screen (pygame.Surface): A tela.
+            counts (dict[str, int]): Entidades por grupo da cena atual.
+            fps (float): FPS de renderização atual.
+        Returns:
+            pygame.Rect: Área da tela ocupada pelo painel.
+        """
+        if self._panel is None or self._frames_until_refresh <= 0:
+            self._panel = self._build_panel(counts, fps)
+            self._frames_until_refresh = self.refresh_interval
+        self._frames_until_refresh -= 1
+        position = self.position or (screen.get_width() - self._panel.get_width() - 10, 10)
+        return screen.blit(self._panel, position)
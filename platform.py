@@ -1,5 +1,16 @@
 import pygame
 from core.settings import ASSETS_DIR # [cite: 9a]
+from core.asset_cache import asset_cache
+
+PLATFORM_IMAGE_PATH: str = ASSETS_DIR + "images/platform.png"
+
+
+def _platform_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Retângulo cinza com borda usado quando platform.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((100, 100, 100)) # Cinza
+    pygame.draw.rect(surface, (150, 150, 150), (0, 0, size[0], size[1]), 2) # Borda
+    return surface
 
 class Platform(pygame.sprite.Sprite):
     """
@@ -17,16 +28,8 @@ class Platform(pygame.sprite.Sprite):
         """
         super().__init__()
         
-        # Tenta carregar uma imagem para a plataforma, caso contrário, usa um placeholder
-        try:
-            # Assumimos uma imagem de plataforma genérica ou de "grama"
-            self.image = pygame.image.load(ASSETS_DIR + "images/platform.png").convert_alpha() # [cite: 9a]
-            self.image = pygame.transform.scale(self.image, (width, height)) # Redimensiona para o tamanho especificado [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem da plataforma (platform.png) não encontrada. Usando um retângulo cinza como placeholder.")
-            self.image = pygame.Surface((width, height), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            self.image.fill((100, 100, 100)) # Cinza
-            pygame.draw.rect(self.image, (150, 150, 150), (0, 0, width, height), 2) # Borda
+        # Imagem genérica de plataforma, escalada (e cacheada) para o tamanho especificado
+        self.image = asset_cache.get_image(PLATFORM_IMAGE_PATH, (width, height), placeholder=_platform_placeholder)
 
         self.rect = self.image.get_rect(topleft=(x, y)) # Retângulo de colisão/posição [cite: 9a]
 
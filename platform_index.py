@@ -0,0 +1,84 @@
+import bisect
+import pygame
+from typing import Iterable
+
+
+class PlatformIndex:
+    """
+    Índice estático das plataformas de uma fase.
+    As plataformas não se movem depois de geradas/carregadas, então o índice é montado
+    uma única vez: os rects ficam ordenados pela borda esquerda e uma consulta só
+    examina as plataformas cujo intervalo em X pode tocar o intervalo consultado.
+    Qualquer corpo em queda (jogador, monstros, moedas) pousa usando find_landing().
+    """
+    def __init__(self, platforms: Iterable[pygame.sprite.Sprite] = ()) -> None:
+        """
+        Inicializa o índice.
+        Args:
+            platforms (Iterable[pygame.sprite.Sprite]): Plataformas iniciais (com atributo rect).
+        """
+        self._platforms: list[pygame.sprite.Sprite] = []
+        self._lefts: list[int] = []
+        self._max_width: int = 0
+        self.build(platforms)
+
+    def build(self, platforms: Iterable[pygame.sprite.Sprite]) -> None:
+        """
+        (Re)monta o índice. Deve ser chamado uma vez por fase (geração ou carregamento).
+        Args:
+            platforms (Iterable[pygame.sprite.Sprite]): As plataformas da fase.
+        """
+        self._platforms = sorted(platforms, key=lambda platform: platform.rect.left)
+        self._lefts = [platform.rect.left for platform in self._platforms]
+        self._max_width = max((platform.rect.width for platform in self._platforms), default=0)
+
+    def _candidates(self, left: int, right: int) -> list[pygame.sprite.Sprite]:
+        """Plataformas que podem sobrepor o intervalo [left, right) em X."""
+        # Só plataformas com borda esquerda em (left - maior_largura, right) podem tocar o intervalo
+        start = bisect.bisect_right(self._lefts, left - self._max_width)
+        end = bisect.bisect_left(self._lefts, right)
+        return self._platforms[start:end]
+
+    def query_rect(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """
+        Retorna as plataformas que colidem com o rect.
+        Args:
+            rect (pygame.Rect): Área consultada.
+        Returns:
+            list[pygame.sprite.Sprite]: Plataformas que colidem.
+        """
+        return [platform for platform in self._candidates(rect.left, rect.right)
+                if rect.colliderect(platform.rect)]
+
+    def collide(self, sprite: pygame.sprite.Sprite) -> list[pygame.sprite.Sprite]:
+        """
+        Equivalente a pygame.sprite.spritecollide(sprite, plataformas, False).
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite com atributo rect.
+        Returns:
+            list[pygame.sprite.Sprite]: Plataformas que colidem com ele.
+        """
+        return self.query_rect(sprite.rect)
+
+    def find_landing(self, rect: pygame.Rect, velocity_y: float) -> int | None:
+        """
+        Verifica se um corpo em queda cruzou o topo de alguma plataforma neste passo.
+        Args:
+            rect (pygame.Rect): Rect do corpo, já na posição após o movimento vertical.
+            velocity_y (float): Deslocamento vertical aplicado neste passo.
+        Returns:
+            int | None: O Y do topo da plataforma onde o corpo deve pousar, ou None.
+        """
+        if velocity_y < 0:
+            return None # Subindo: não pousa
+        previous_bottom = rect.bottom - velocity_y
+        landing_top = None
+        for platform in self._candidates(rect.left, rect.right):
+            top = platform.rect.top
+            if previous_bottom <= top <= rect.bottom and rect.right > platform.rect.left and rect.left < platform.rect.right:
+                if landing_top is None or top < landing_top: # A primeira plataforma cruzada na queda
+                    landing_top = top
+        return landing_top
+
+    def __len__(self) -> int:
+        return len(self._platforms)
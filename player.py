@@ -1,8 +1,22 @@
 import pygame
 from characters.sword import Sword 
 from core.settings import PLAYER_SPEED, PLAYER_HEALTH, SCREEN_WIDTH, SCREEN_HEIGHT # [cite: 9a]
+from core.asset_cache import asset_cache
+from world.platform_index import PlatformIndex
+from core.interpolation import Interpolated
+from core.game_logger import game_logger
 
-class Player(pygame.sprite.Sprite):
+PLAYER_IMAGE_PATH: str = "assets/images/player.png"
+PLAYER_SIZE: tuple[int, int] = (80, 110)
+
+
+def _player_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Retângulo azul usado quando player.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((0, 150, 255))
+    return surface
+
+class Player(Interpolated, pygame.sprite.Sprite):
     """
     Representa o personagem jogável, gerenciando seu movimento, física, vida,
     interação com a espada e coleta de moedas.
@@ -17,13 +31,9 @@ class Player(pygame.sprite.Sprite):
         """
         super().__init__() 
 
-        try:
-            self.image = pygame.image.load("assets/images/player.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (80, 110)) # [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem do jogador (player.png) não encontrada. Usando um retângulo como placeholder.")
-            self.image = pygame.Surface((80, 110), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            self.image.fill((0, 150, 255)) 
+        # Variações direita/esquerda pré-espelhadas: o desenho só escolhe uma delas
+        self.image_right, self.image_left = asset_cache.get_oriented(PLAYER_IMAGE_PATH, PLAYER_SIZE, placeholder=_player_placeholder)
+        self.image = self.image_right
         
         self.rect = self.image.get_rect(topleft=(x, y)) # [cite: 9a]
 
@@ -48,6 +58,7 @@ class Player(pygame.sprite.Sprite):
 
         if initial_data: # Restaura o estado do jogador se dados forem fornecidos
             self.from_dict(initial_data)
+        self.snapshot_position()
 
     def handle_input(self, event: pygame.event.Event) -> None:
         """
@@ -84,11 +95,11 @@ class Player(pygame.sprite.Sprite):
                 self.swing_initiated_by_movement = False
         
 
-    def update(self, platforms: pygame.sprite.Group) -> None: # Recebe o grupo de plataformas
+    def update(self, platforms: PlatformIndex) -> None: # Recebe o índice estático de plataformas
         """
         Atualiza a lógica do jogador (movimento, física, e a espada), e verifica colisões com plataformas.
         Args:
-            platforms (pygame.sprite.Group): O grupo de sprites das plataformas para verificação de colisão.
+            platforms (PlatformIndex): O índice de plataformas da fase para verificação de colisão.
         """
         # Movimento Horizontal
         # Atualiza a posição X baseada nas flags de movimento
@@ -117,24 +128,18 @@ class Player(pygame.sprite.Sprite):
         # para que o colisor do Pygame funcione corretamente para "pousar"
         
         # Move o rect Y primeiro, então verifica colisão
-        collided_platforms = pygame.sprite.spritecollide(self, platforms, False) 
-        
         # Lógica de pouso em plataforma (quando o jogador está caindo)
         if self.velocity_y > 0: # Se o jogador está caindo
-            for platform in collided_platforms:
-                # Verifica se o jogador está caindo sobre a plataforma (topo do rect do jogador está ACIMA do topo da plataforma)
-                # Adicionamos uma pequena tolerância (self.gravity * 2 ou similar) para garantir que ele não "atravesse" a plataforma
-                # se estiver se movendo muito rápido.
-                if self.rect.bottom - self.velocity_y <= platform.rect.top and \
-                   self.rect.bottom >= platform.rect.top:
-                    self.rect.bottom = platform.rect.top # Aterriza no topo da plataforma
-                    self.velocity_y = 0 # Para a queda
-                    self.is_jumping = False # Não está pulando
-                    break # Aterriza em uma plataforma, não precisa verificar mais
+            # O índice verifica se o pé do jogador cruzou o topo de alguma plataforma neste frame
+            landing_top = platforms.find_landing(self.rect, self.velocity_y)
+            if landing_top is not None:
+                self.rect.bottom = landing_top # Aterriza no topo da plataforma
+                self.velocity_y = 0 # Para a queda
+                self.is_jumping = False # Não está pulando
 
         # Lógica de bater a cabeça em plataforma (quando o jogador está subindo)
         elif self.velocity_y < 0: # Se o jogador está subindo
-            for platform in collided_platforms:
+            for platform in platforms.collide(self):
                 # Verifica se o jogador está subindo e colide com a parte de baixo da plataforma
                 if self.rect.top >= platform.rect.bottom - abs(self.velocity_y) and \
                    self.rect.top <= platform.rect.bottom:
@@ -145,20 +150,20 @@ class Player(pygame.sprite.Sprite):
         # Atualiza a espada, passando o centro do jogador e a direção para onde ele está virado
         self.sword.update(self.rect.center, self.facing_right)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Desenha o jogador e sua espada na tela.
         Args:
             screen (pygame.Surface): A superfície da tela do Pygame.
+            alpha (float): Fração do passo de simulação decorrida, para interpolar a posição.
         """
-        # Desenha o jogador, espelhando a imagem se ele estiver virado para a esquerda
-        if not self.facing_right:
-            flipped_image = pygame.transform.flip(self.image, True, False)
-            screen.blit(flipped_image, self.rect)
-        else:
-            screen.blit(self.image, self.rect)
+        # Desenha o jogador com a variação já espelhada para a direção em que está virado
+        self.image = self.image_right if self.facing_right else self.image_left
+        render_x, render_y = self.render_pos(alpha)
+        screen.blit(self.image, (render_x, render_y))
         
-        self.sword.draw(screen)
+        # A espada acompanha o deslocamento interpolado do jogador
+        self.sword.draw(screen, (render_x - self.rect.x, render_y - self.rect.y))
 
     def collect_coin(self, amount: int = 1) -> None:
         """
@@ -167,7 +172,7 @@ class Player(pygame.sprite.Sprite):
             amount (int): A quantidade de moedas coletadas.
         """
         self.coins += amount
-        print(f"Moedas: {self.coins}")
+        game_logger.debug("moedas", "Moedas: {}", self.coins)
         self.sword.try_grow_by_coins(self.coins)
 
     def take_damage(self, amount: int) -> None:
@@ -179,7 +184,7 @@ class Player(pygame.sprite.Sprite):
         self.health -= amount
         if self.health < 0:
             self.health = 0
-        print(f"Jogador tomou {amount} de dano. Vida restante: {self.health}")
+        game_logger.debug("combate", "Jogador tomou {} de dano. Vida restante: {}", amount, self.health)
 
     def to_dict(self) -> dict:
         """Converte o estado do jogador em um dicionário para salvamento."""
@@ -0,0 +1,91 @@
+import cProfile
+import datetime
+import io
+import os
+import pstats
+from core.settings import PROFILE_DIR
+
+
+class FrameProfiler:
+    """
+    Captura com cProfile os próximos N frames do loop do jogo.
+    Ao terminar, salva o .pstats (para snakeviz, pstats etc.) e um resumo .txt com as
+    funções de maior tempo acumulado, nomeados com a data/hora e a cena capturada.
+    """
+    def __init__(self, output_dir: str = PROFILE_DIR, summary_lines: int = 40) -> None:
+        """
+        Inicializa o capturador (inativo).
+        Args:
+            output_dir (str): Pasta onde as capturas são salvas.
+            summary_lines (int): Quantas funções entram no resumo em texto.
+        """
+        self.output_dir: str = output_dir
+        self.summary_lines: int = summary_lines
+        self.frames_left: int = 0
+        self.frames_captured: int = 0
+        self.scene_name: str = ""
+        self._profile: cProfile.Profile | None = None
+
+    @property
+    def active(self) -> bool:
+        """Se há uma captura em andamento."""
+        return self._profile is not None
+
+    def start(self, frames: int, scene_name: str) -> bool:
+        """
+        Começa a capturar.
+        Args:
+            frames (int): Quantos frames capturar.
+            scene_name (str): Nome da cena atual (entra no nome dos arquivos).
+        Returns:
+            bool: False se já havia uma captura em andamento.
+        """
+        if self.active:
+            return False
+        self.frames_left = frames
+        self.frames_captured = 0
+        self.scene_name = scene_name
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        print(f"Perfil: capturando {frames} frames de {scene_name}...")
+        return True
+
+    def end_frame(self) -> str | None:
+        """
+        Conta um frame capturado; encerra e salva a captura quando chega a N frames.
+        Returns:
+            str | None: Caminho do .pstats salvo, se a captura terminou neste frame.
+        """
+        if self._profile is None:
+            return None
+        self.frames_captured += 1
+        self.frames_left -= 1
+        if self.frames_left <= 0:
+            return self.stop()
+        return None
+
+    def stop(self) -> str | None:
+        """
+        Encerra a captura (mesmo antes de completar os N frames) e salva os arquivos.
+        Returns:
+            str | None: Caminho do .pstats salvo, ou None se não havia captura.
+        """
+        if self._profile is None:
+            return None
+        self._profile.disable()
+        profile, self._profile = self._profile, None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_path = os.path.join(self.output_dir, f"{timestamp}_{self.scene_name}_{self.frames_captured}frames")
+        profile.dump_stats(base_path + ".pstats")
+
+        summary = io.StringIO()
+        summary.write(f"Cena: {self.scene_name}\nFrames: {self.frames_captured}\n\n")
+        stats = pstats.Stats(profile, stream=summary)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.summary_lines)
+        with open(base_path + ".txt", "w", encoding="utf-8") as f:
+            f.write(summary.getvalue())
+
+        print(f"Perfil salvo em {base_path}.pstats ({self.frames_captured} frames)")
+        return base_path + ".pstats"
@@ -1,8 +1,37 @@
 import pygame
 import math
-from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SFX_VOLUME # [cite: 9a, 10d]
+from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SFX_VOLUME, PROJECTILE_MAX_LIFETIME_FRAMES # [cite: 9a, 10d]
+from core.asset_cache import asset_cache
+from core.sprite_pool import SpritePool
+from core.interpolation import Interpolated
 
-class Projectile(pygame.sprite.Sprite):
+FIREBALL_IMAGE_PATH: str = "assets/images/fireball.png"
+FIREBALL_SIZE: tuple[int, int] = (40, 40) # Tamanho da bola de fogo
+SCREEN_RECT: pygame.Rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT) # Área em que o projétil continua vivo
+
+
+def _fireball_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Círculo laranja usado quando fireball.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 120, 0), (size[0] // 2, size[1] // 2), min(size) // 2)
+    return surface
+
+
+# Bola de fogo já rotacionada, por ângulo inteiro (compartilhada por todos os projéteis)
+_rotated_fireballs: dict[int, pygame.Surface] = {}
+
+
+def _rotated_fireball(angle: float) -> pygame.Surface:
+    """Retorna a imagem da bola de fogo rotacionada para o ângulo (em graus inteiros)."""
+    key = round(angle) % 360
+    image = _rotated_fireballs.get(key)
+    if image is None:
+        base = asset_cache.get_image(FIREBALL_IMAGE_PATH, FIREBALL_SIZE, placeholder=_fireball_placeholder)
+        image = pygame.transform.rotate(base, key)
+        _rotated_fireballs[key] = image
+    return image
+
+class Projectile(Interpolated, pygame.sprite.Sprite):
     """
     Representa um projétil genérico (como uma bola de fogo).
     Gerencia seu movimento, dano e se pode ser repelido.
@@ -18,20 +47,24 @@ class Projectile(pygame.sprite.Sprite):
             damage (int): Dano que o projétil causa ao colidir.
         """
         super().__init__() 
+        self.rect: pygame.Rect | None = None
+        self.reset(x, y, target_pos, speed, damage)
 
-        try:
-            self.image = pygame.image.load("assets/images/fireball.png").convert_alpha() # Carrega a imagem da bola de fogo [cite: 9a]
-            self.image = pygame.transform.scale(self.image, (40, 40)) # Tamanho da bola de fogo [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem da bola de fogo (fireball.png) não encontrada. Usando um círculo laranja como placeholder.")
-            self.image = pygame.Surface((40, 40), pygame.SRCALPHA) # Placeholder transparente [cite: 9a]
-            pygame.draw.circle(self.image, (255, 120, 0), (20, 20), 20) # Círculo laranja [cite: 9a]
-        
-        self.rect = self.image.get_rect(center=(x, y)) # Define o rect centralizado na posição inicial [cite: 9a]
-        
+    def reset(self, x: int, y: int, target_pos: tuple[int, int], speed: int = 5, damage: int = 10) -> None:
+        """
+        Reinicia todo o estado do projétil (usado pelo construtor e pelo projectile_pool).
+        Args:
+            x (int): Posição inicial X do projétil.
+            y (int): Posição inicial Y do projétil.
+            target_pos (tuple[int, int]): Posição (x, y) do alvo para onde o projétil se moverá.
+            speed (int): Velocidade do projétil.
+            damage (int): Dano que o projétil causa ao colidir.
+        """
         self.speed: int = speed
         self.damage: int = damage # Dano que o projétil causa a quem ele atinge
         self.is_active: bool = True # Flag para controlar se o projétil ainda deve ser processado/desenhado
+        self.age_frames: int = 0 # Frames desde o disparo
+        self.max_lifetime_frames: int = PROJECTILE_MAX_LIFETIME_FRAMES
 
         # Calcular direção para o alvo usando vetores
         dx = target_pos[0] - x
@@ -46,10 +79,15 @@ class Projectile(pygame.sprite.Sprite):
             self.direction_x = dx / distance
             self.direction_y = dy / distance
 
-        # Rotação da imagem para apontar para o alvo
+        # Rotação da imagem para apontar para o alvo (quadro compartilhado, sem nova Surface por disparo)
         angle = math.degrees(math.atan2(-dy, dx)) 
-        self.image = pygame.transform.rotate(self.image, angle) # Rota a imagem [cite: 9a]
-        self.rect = self.image.get_rect(center=(x,y)) # Recalcula o rect após rotação para manter o centro [cite: 9a]
+        self.image = _rotated_fireball(angle)
+        if self.rect is None:
+            self.rect = self.image.get_rect(center=(x, y))
+        else: # Reaproveita o rect existente
+            self.rect.size = self.image.get_size()
+            self.rect.center = (x, y)
+        self.snapshot_position() # Projétil reaproveitado não deve "deslizar" da posição antiga
 
         # Atributos para repulsão
         self.repelled: bool = False # Se o projétil foi repelido pelo jogador [cite: 9a]
@@ -65,18 +103,29 @@ class Projectile(pygame.sprite.Sprite):
 
         self.rect.x += self.direction_x * self.speed
         self.rect.y += self.direction_y * self.speed
+        self.age_frames += 1
 
-        # Remover projéteis que saem da tela para evitar sobrecarga de memória
-        screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT) # [cite: 9a]
-        if not screen_rect.colliderect(self.rect): 
-            self.is_active = False 
-            # print("Projétil fora da tela.") # Debug removido
+        # Remove projéteis que saem da tela ou que passaram do tempo de vida (ex: parados no lugar)
+        if not SCREEN_RECT.colliderect(self.rect) or self.age_frames >= self.max_lifetime_frames:
+            self.despawn()
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def despawn(self) -> None:
+        """
+        Encerra o projétil: marca como inativo, remove de todos os grupos e devolve ao projectile_pool.
+        """
+        self.is_active = False
+        projectile_pool.release(self)
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Desenha o projétil na tela se estiver ativo.
         Args:
             screen (pygame.Surface): A superfície da tela do Pygame onde o projétil será desenhado.
+            alpha (float): Fração do passo de simulação decorrida, para interpolar a posição.
         """
         if self.is_active: 
-            screen.blit(self.image, self.rect)
+            screen.blit(self.image, self.render_pos(alpha))
+
+
+# Pool compartilhado de projéteis (bolas de fogo de todos os dragões)
+projectile_pool = SpritePool(Projectile, max_size=128)
@@ -0,0 +1,121 @@
+import struct
+import pygame
+
+# Formato do arquivo (little-endian):
+#   cabeçalho: magic (4 bytes) + versão (uint16) + semente do random (uint64)
+#   para cada passo com eventos: índice do passo (uint32) + número de eventos (uint16),
+#       seguido dos eventos: tipo (uint8) + tecla (int32) + modificadores (uint16)
+#   fim: índice do passo = total de passos gravados, com 0 eventos
+# Passos sem eventos (a grande maioria) não ocupam espaço.
+REPLAY_MAGIC: bytes = b"LECR"
+REPLAY_VERSION: int = 1
+
+_HEADER = struct.Struct("<4sHQ")
+_TICK = struct.Struct("<IH")
+_EVENT = struct.Struct("<BiH")
+
+# Só os eventos de teclado afetam a CenaJogo. Os menus dependem do mouse, que não é gravado:
+# por isso a gravação (e a reprodução) termina quando a partida sai da CenaJogo (ver Jogo.mudar_cena)
+_EVENT_CODES: dict[int, int] = {pygame.KEYDOWN: 1, pygame.KEYUP: 2}
+_EVENT_TYPES: dict[int, int] = {code: event_type for event_type, code in _EVENT_CODES.items()}
+
+
+class InputRecorder:
+    """
+    Grava, passo de simulação a passo, os eventos entregues às cenas, junto com a semente do random.
+    Com o relógio simulado (core.game_clock), a mesma semente e os mesmos eventos
+    reproduzem exatamente a mesma partida.
+    """
+    def __init__(self, path: str, seed: int) -> None:
+        """
+        Abre o arquivo de gravação e escreve o cabeçalho.
+        Args:
+            path (str): Caminho do arquivo a ser criado.
+            seed (int): Semente usada no random antes de gerar o cenário.
+        """
+        self.path: str = path
+        self.seed: int = seed
+        self.tick: int = 0
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed))
+
+    def record_tick(self, events: list) -> None:
+        """
+        Grava os eventos de um passo de simulação.
+        Args:
+            events (list): Eventos entregues a este passo (os que não afetam a simulação são ignorados).
+        """
+        recorded = [event for event in events if event.type in _EVENT_CODES]
+        if recorded:
+            chunks = [_TICK.pack(self.tick, len(recorded))]
+            for event in recorded:
+                chunks.append(_EVENT.pack(_EVENT_CODES[event.type], event.key, getattr(event, "mod", 0)))
+            self._file.write(b"".join(chunks))
+        self.tick += 1
+
+    def close(self) -> None:
+        """Escreve o marcador de fim e fecha o arquivo."""
+        if self._file.closed:
+            return
+        self._file.write(_TICK.pack(self.tick, 0))
+        self._file.close()
+        print(f"Gravação salva em {self.path}: {self.tick} passos (semente {self.seed}).")
+
+
+class InputReplayer:
+    """
+    Lê uma gravação de InputRecorder e devolve os eventos de cada passo de simulação,
+    na mesma ordem em que foram gravados.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Carrega a gravação inteira para a memória.
+        Args:
+            path (str): Caminho do arquivo de gravação.
+        Raises:
+            ValueError: Se o arquivo não for uma gravação válida.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} não é uma gravação válida.")
+        magic, version, self.seed = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} não é uma gravação válida (versão {version}).")
+
+        self.path: str = path
+        self._events: dict[int, list[pygame.event.Event]] = {}
+        self.tick_count: int | None = None # Sem marcador de fim (gravação interrompida): até o último evento
+        offset = _HEADER.size
+        last_tick = -1
+        while offset + _TICK.size <= len(data):
+            tick, count = _TICK.unpack_from(data, offset)
+            offset += _TICK.size
+            if count == 0:
+                self.tick_count = tick
+                break
+            events = []
+            for _ in range(count):
+                code, key, mod = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                events.append(pygame.event.Event(_EVENT_TYPES[code], key=key, mod=mod))
+            self._events[tick] = events
+            last_tick = tick
+        if self.tick_count is None:
+            self.tick_count = last_tick + 1
+        self.tick: int = 0
+
+    @property
+    def finished(self) -> bool:
+        """Se todos os passos gravados já foram reproduzidos."""
+        return self.tick >= self.tick_count
+
+    def next_tick(self) -> list:
+        """
+        Retorna os eventos do próximo passo de simulação.
+        Returns:
+            list: Os eventos gravados para o passo (vazia se não houve nenhum).
+        """
+        events = self._events.get(self.tick, [])
+        self.tick += 1
+        return events
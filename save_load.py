@@ -1,50 +1,415 @@
 import json
 import os
+import queue
+import struct
+import tempfile
+import threading
+import time
+from typing import Callable
+import pygame
+from core.game_logger import game_logger
+from core.settings import SAVE_FORMAT, SAVE_COMPRESS, SAVE_SLOTS
+from save_system.binary_save import encode_game_state, decode_game_state, is_binary_save
+
+# Assinatura das funções chamadas ao fim de um save em segundo plano: (sucesso, mensagem)
+SaveCallback = Callable[[bool, str], None]
+
+SAVE_DIR: str = "save_data"
+INDEX_FILE_NAME: str = "index.json"
+JOURNAL_VERSION: int = 1
+
 
 class SaveLoad:
     """
-    Gerencia o salvamento e carregamento do estado do jogo para um arquivo JSON.
+    Gerencia o salvamento e carregamento do estado do jogo para um arquivo JSON ou binário
+    (save_system.binary_save, bem menor e mais rápido de carregar em mundos grandes).
+    O formato de um arquivo é reconhecido pelo cabeçalho na hora de carregar.
+    Os saves são atômicos: o arquivo é escrito em um temporário na mesma pasta, sincronizado
+    com o disco (fsync) e só então renomeado por cima do save anterior. Uma queda no meio da
+    escrita nunca corrompe o save existente.
+
+    Há SAVE_SLOTS slots de save. Um índice pequeno (index.json) guarda o resumo de cada slot
+    (data, moedas, vida, nível da espada, tempo de jogo e miniatura), para que os menus listem
+    os saves sem abrir os arquivos completos; o mundo só é lido quando um slot é escolhido.
+
+    Autosave incremental: entre dois saves completos (snapshots), cada autosave só acrescenta
+    uma linha com o que mudou (um delta) ao journal do slot (slotN.journal). Um snapshot
+    reinicia o journal; o carregamento aplica o journal por cima do snapshot.
     """
-    def __init__(self, save_file_name: str = "savegame.json") -> None:
+    def __init__(self, save_file_name: str | None = None, save_format: str = SAVE_FORMAT,
+                 compress: bool = SAVE_COMPRESS) -> None:
         """
         Inicializa o sistema de save/load.
         Args:
-            save_file_name (str): O nome do arquivo onde o jogo será salvo/carregado.
+            save_file_name (str | None): O nome do arquivo onde o jogo será salvo/carregado
+                (None = "savegame.json" ou "savegame.sav", conforme o formato).
+            save_format (str): "json" ou "binary".
+            compress (bool): Comprime os saves binários com zlib.
         """
-        self.save_file_path = os.path.join("save_data", save_file_name) # Salva em uma pasta separada
+        self.save_format: str = save_format
+        self.compress: bool = compress
+        if save_file_name is None:
+            save_file_name = "savegame.sav" if save_format == "binary" else "savegame.json"
+        self.save_file_path = os.path.join(SAVE_DIR, save_file_name) # Salva em uma pasta separada
         os.makedirs(os.path.dirname(self.save_file_path), exist_ok=True) # Garante que a pasta 'save_data' exista
 
+        self.slot_count: int = SAVE_SLOTS
+        self.index_path: str = os.path.join(SAVE_DIR, INDEX_FILE_NAME)
+        self._index: dict[int, dict] | None = None # Índice em memória (lido do disco uma única vez)
+        self._index_lock = threading.Lock() # O índice é atualizado pela thread de escrita e lido pelos menus
+
+        # Saves em segundo plano: pedidos vão para a thread de escrita; os resultados voltam
+        # por outra fila e os callbacks rodam na thread principal (process_completed)
+        self._jobs: queue.Queue = queue.Queue()
+        self._completed: queue.Queue = queue.Queue()
+        self._worker: threading.Thread | None = None
+
+    def serialize(self, game_data: dict) -> bytes:
+        """
+        Converte o estado do jogo para o conteúdo do arquivo, no formato configurado.
+        Args:
+            game_data (dict): O estado do jogo.
+        Returns:
+            bytes: O conteúdo do arquivo.
+        """
+        if self.save_format == "binary":
+            return encode_game_state(game_data, self.compress)
+        return json.dumps(game_data, indent=4).encode('utf-8') # Salva com indentação para legibilidade
+
+    @staticmethod
+    def deserialize(data: bytes) -> dict:
+        """
+        Converte o conteúdo de um arquivo de save (binário ou JSON, pelo cabeçalho) no estado do jogo.
+        Args:
+            data (bytes): O conteúdo do arquivo.
+        Returns:
+            dict: O estado do jogo.
+        Raises:
+            ValueError: Se o conteúdo estiver corrompido (json.JSONDecodeError também é um ValueError).
+        """
+        if is_binary_save(data):
+            return decode_game_state(data)
+        return json.loads(data.decode('utf-8'))
+
+    def journal_path(self, slot: int) -> str:
+        """
+        Caminho do journal de deltas de um slot.
+        Args:
+            slot (int): Número do slot (1 a slot_count).
+        """
+        return os.path.join(SAVE_DIR, f"slot{slot}.journal")
+
+    def slot_path(self, slot: int) -> str:
+        """
+        Caminho do arquivo completo de um slot.
+        Args:
+            slot (int): Número do slot (1 a slot_count).
+        """
+        extension = ".sav" if self.save_format == "binary" else ".json"
+        return os.path.join(SAVE_DIR, f"slot{slot}{extension}")
+
+    def read_index(self) -> dict[int, dict]:
+        """
+        Retorna o resumo de cada slot ocupado, sem abrir os saves completos.
+        O arquivo de índice só é lido na primeira chamada; depois, vem da memória.
+        Returns:
+            dict[int, dict]: {slot: resumo}; slots vazios não aparecem.
+        """
+        with self._index_lock:
+            if self._index is None:
+                self._index = {}
+                try:
+                    with open(self.index_path, 'r', encoding='utf-8') as f:
+                        slots = json.load(f).get("slots", {})
+                    self._index = {int(slot): entry for slot, entry in slots.items()}
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    game_logger.error("save", "Índice de saves ilegível, será refeito: {}", e)
+            return dict(self._index)
+
+    def first_free_slot(self) -> int | None:
+        """Retorna o primeiro slot vazio, ou None se todos estiverem ocupados (nunca escolhe um save para sobrescrever)."""
+        used = self.read_index()
+        return next((slot for slot in range(1, self.slot_count + 1) if slot not in used), None)
+
+    def _slot_summary(self, game_data: dict, slot: int, thumbnail_path: str | None) -> dict:
+        """Monta o resumo de um slot a partir do estado salvo nele."""
+        player = game_data.get("player") or {}
+        return {
+            "file": os.path.basename(self.slot_path(slot)),
+            "timestamp": time.time(),
+            "coins": player.get("coins", 0),
+            "health": player.get("health", 0),
+            "sword_level": player.get("sword_growth_level", 0),
+            "play_time_ms": game_data.get("play_time_ms", 0),
+            "thumbnail": thumbnail_path,
+        }
+
+    def _update_index(self, slot: int, summary: dict) -> None:
+        """
+        Atualiza a entrada de um slot e regrava o índice (também de forma atômica).
+        Campos ausentes do resumo (ex: arquivo e miniatura, num delta) mantêm o valor anterior.
+        """
+        self.read_index() # Garante que o índice existente foi carregado antes de sobrescrevê-lo
+        with self._index_lock:
+            self._index[slot] = {**self._index.get(slot, {}), **summary}
+            content = json.dumps({"version": 1, "slots": {str(s): entry for s, entry in sorted(self._index.items())}}, indent=4)
+        self._write_atomic(content.encode('utf-8'), self.index_path)
+
+    def _write_atomic(self, content: bytes, path: str) -> None:
+        """
+        Grava um arquivo de forma atômica (temporário + fsync + rename).
+        Args:
+            content (bytes): O conteúdo do arquivo.
+            path (str): O arquivo de destino.
+        Raises:
+            OSError: Se a escrita falhar (o arquivo anterior continua intacto).
+        """
+        directory = os.path.dirname(path) or "."
+        fd, temp_path = tempfile.mkstemp(prefix=".savegame_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno()) # Garante que os dados estão no disco antes do rename
+            os.replace(temp_path, path) # Atômico: o save antigo ou o novo, nunca um pela metade
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
     def save_game(self, game_data: dict) -> None:
         """
-        Salva o estado atual do jogo para um arquivo.
+        Salva o estado atual do jogo para um arquivo (bloqueia até terminar).
         Args:
             game_data (dict): Um dicionário contendo todo o estado do jogo a ser salvo.
         """
         try:
-            with open(self.save_file_path, 'w', encoding='utf-8') as f:
-                json.dump(game_data, f, indent=4) # Salva com indentação para legibilidade
-            print(f"Jogo salvo com sucesso em: {self.save_file_path}")
-        except IOError as e:
-            print(f"Erro ao salvar o jogo: {e}")
+            self._write_atomic(self.serialize(game_data), self.save_file_path)
+            game_logger.info("save", "Jogo salvo com sucesso em: {}", self.save_file_path)
+        except (OSError, TypeError, ValueError, struct.error, KeyError) as e:
+            game_logger.error("save", "Erro ao salvar o jogo: {}", e)
 
-    def load_game(self) -> dict | None:
+    def save_game_async(self, game_data: dict, on_complete: SaveCallback | None = None,
+                        slot: int | None = None, thumbnail: pygame.Surface | None = None) -> None:
+        """
+        Salva o estado do jogo em segundo plano: a serialização e a escrita acontecem na
+        thread de escrita, e o frame atual não espera pelo disco.
+        O game_data não deve ser modificado depois de entregue (use os dicionários de to_dict()).
+        Args:
+            game_data (dict): Um dicionário contendo todo o estado do jogo a ser salvo.
+            on_complete (SaveCallback | None): Chamado na thread principal, por process_completed(),
+                com (sucesso, mensagem) quando o save terminar.
+            slot (int | None): Slot de destino (None = o arquivo único save_file_path, sem índice).
+            thumbnail (pygame.Surface | None): Miniatura da tela, gravada junto com o slot.
+        """
+        self._submit(self._write_snapshot, (game_data, slot, thumbnail), on_complete)
+
+    def append_delta_async(self, delta: dict, slot: int, on_complete: SaveCallback | None = None) -> None:
+        """
+        Acrescenta um delta ao journal do slot em segundo plano (autosave incremental).
+        Os pedidos seguem a ordem da fila: um delta pedido depois de um snapshot vai para o journal novo.
+        Args:
+            delta (dict): {"player", "play_time_ms", "upsert", "remove"} (ver Environment.collect_delta).
+            slot (int): Slot de destino; ele já precisa ter um snapshot.
+            on_complete (SaveCallback | None): Chamado na thread principal com (sucesso, mensagem).
+        """
+        self._submit(self._append_delta, (delta, slot), on_complete)
+
+    def _submit(self, task: Callable[..., str], args: tuple, on_complete: SaveCallback | None) -> None:
+        """Entrega uma tarefa de escrita à thread de escrita (criada no primeiro pedido)."""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, name="save-writer", daemon=True)
+            self._worker.start()
+        self._jobs.put((task, args, on_complete))
+
+    def _run_worker(self) -> None:
+        """Laço da thread de escrita: uma tarefa por vez, na ordem em que foram pedidas."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            task, args, on_complete = job
+            try:
+                result = (True, task(*args))
+                game_logger.info("save", result[1])
+            except Exception as e: # Um erro inesperado falha só este save; a thread segue atendendo os próximos
+                result = (False, f"Erro ao salvar o jogo: {e}")
+                game_logger.error("save", result[1])
+            self._completed.put((on_complete, *result))
+            self._jobs.task_done()
+
+    def _write_snapshot(self, game_data: dict, slot: int | None, thumbnail: pygame.Surface | None) -> str:
+        """Grava um save completo (na thread de escrita). Num slot, também atualiza o índice e reinicia o journal."""
+        path = self.slot_path(slot) if slot else self.save_file_path
+        self._write_atomic(self.serialize(game_data), path)
+        if slot:
+            self._update_index(slot, self._slot_summary(game_data, slot, self._save_thumbnail(slot, thumbnail)))
+            self._reset_journal(slot, path)
+        return f"Jogo salvo com sucesso em: {path}"
+
+    @staticmethod
+    def _snapshot_stamp(snapshot_path: str) -> list[int]:
+        """Identifica a versão de um snapshot pelo arquivo (data de modificação em ns e tamanho)."""
+        stat = os.stat(snapshot_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _reset_journal(self, slot: int, snapshot_path: str) -> None:
+        """
+        Recria o journal do slot só com o cabeçalho, que aponta para o snapshot recém-gravado.
+        Se o jogo cair entre a gravação do snapshot e esta, o journal antigo aponta para o snapshot
+        anterior e é ignorado no carregamento, em vez de ser aplicado sobre o snapshot errado.
+        """
+        header = {"journal": JOURNAL_VERSION, "snapshot": os.path.basename(snapshot_path),
+                  "stamp": self._snapshot_stamp(snapshot_path)}
+        self._write_atomic((json.dumps(header) + "\n").encode('utf-8'), self.journal_path(slot))
+
+    def _append_delta(self, delta: dict, slot: int) -> str:
+        """Acrescenta um delta ao journal do slot (na thread de escrita) e atualiza o resumo no índice."""
+        path = self.journal_path(slot)
+        if not os.path.exists(path): # Slot salvo antes dos journals: começa um apontando para o snapshot atual
+            entry = self.read_index().get(slot)
+            self._reset_journal(slot, os.path.join(SAVE_DIR, entry["file"]) if entry else self.slot_path(slot))
+        line = (json.dumps(delta, separators=(",", ":")) + "\n").encode('utf-8')
+        with open(path, 'a+b') as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n": # Linha incompleta de uma queda: o delta novo começa em outra linha
+                    line = b"\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        summary = self._slot_summary(delta, slot, None)
+        del summary["file"], summary["thumbnail"] # Continuam os do último snapshot
+        self._update_index(slot, summary)
+        return f"Autosave (delta) gravado em: {path}"
+
+    def _save_thumbnail(self, slot: int, thumbnail: pygame.Surface | None) -> str | None:
+        """Grava a miniatura de um slot. Uma falha aqui não impede o save."""
+        if thumbnail is None:
+            return None
+        path = os.path.join(SAVE_DIR, f"slot{slot}.png")
+        try:
+            pygame.image.save(thumbnail, path)
+            return path
+        except (pygame.error, OSError) as e:
+            game_logger.warning("save", "Miniatura do slot {} não foi salva: {}", slot, e)
+            return None
+
+    def process_completed(self) -> None:
+        """
+        Chama, na thread atual (a principal, uma vez por frame), os callbacks dos saves
+        em segundo plano que já terminaram.
+        """
+        while not self._completed.empty():
+            on_complete, success, message = self._completed.get_nowait()
+            if on_complete:
+                on_complete(success, message)
+
+    @property
+    def pending(self) -> bool:
+        """Se ainda há saves em segundo plano sendo escritos."""
+        return self._jobs.unfinished_tasks > 0
+
+    def shutdown(self) -> None:
+        """Espera os saves pendentes terminarem e encerra a thread de escrita."""
+        if self._worker is None:
+            return
+        self._jobs.put(None)
+        self._worker.join()
+        self._worker = None
+
+    def load_game(self, slot: int | None = None) -> dict | None:
         """
         Carrega o estado do jogo de um arquivo.
+        Args:
+            slot (int | None): Slot a carregar (None = o arquivo único save_file_path).
         Returns:
             dict | None: O dicionário com o estado do jogo se bem-sucedido, None caso contrário.
         """
-        if not os.path.exists(self.save_file_path):
-            print("Nenhum arquivo de save encontrado. Iniciando novo jogo.")
+        path = self.save_file_path
+        if slot:
+            entry = self.read_index().get(slot)
+            # O índice guarda o nome do arquivo: um slot salvo em outro formato continua legível
+            path = os.path.join(SAVE_DIR, entry["file"]) if entry else self.slot_path(slot)
+        if not os.path.exists(path):
+            game_logger.info("save", "Nenhum arquivo de save encontrado. Iniciando novo jogo.")
             return None
-        
+
         try:
-            with open(self.save_file_path, 'r', encoding='utf-8') as f:
-                game_data = json.load(f)
-            print(f"Jogo carregado com sucesso de: {self.save_file_path}")
+            with open(path, 'rb') as f:
+                game_data = self.deserialize(f.read())
+            if slot:
+                self._replay_journal(game_data, slot, path)
+            game_logger.info("save", "Jogo carregado com sucesso de: {}", path)
             return game_data
-        except json.JSONDecodeError as e:
-            print(f"Erro ao decodificar arquivo de save (JSON corrompido): {e}")
+        except (ValueError, UnicodeDecodeError) as e:
+            game_logger.error("save", "Erro ao decodificar arquivo de save (corrompido): {}", e)
             return None
         except IOError as e:
-            print(f"Erro ao carregar o jogo: {e}")
+            game_logger.error("save", "Erro ao carregar o jogo: {}", e)
             return None
+
+    def _replay_journal(self, game_data: dict, slot: int, snapshot_path: str) -> None:
+        """
+        Aplica sobre o snapshot carregado os deltas do journal do slot.
+        Um journal de outro snapshot é ignorado; linhas incompletas (queda durante a escrita)
+        são puladas. O número de deltas aplicados fica em game_data["journal_deltas"].
+        Args:
+            game_data (dict): O estado carregado do snapshot (modificado no lugar).
+            slot (int): O slot carregado.
+            snapshot_path (str): O arquivo do snapshot.
+        """
+        game_data["journal_deltas"] = 0
+        try:
+            with open(self.journal_path(slot), 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        if not lines:
+            return
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = {}
+        if header.get("stamp") != self._snapshot_stamp(snapshot_path):
+            game_logger.warning("save", "Journal do slot {} não corresponde ao snapshot e foi ignorado.", slot)
+            return
+
+        deltas = []
+        for line in lines[1:]:
+            try:
+                deltas.append(json.loads(line))
+            except ValueError:
+                game_logger.warning("save", "Journal do slot {} tem um delta incompleto; ele foi descartado.", slot)
+        if deltas:
+            self.apply_deltas(game_data, deltas)
+        game_data["journal_deltas"] = len(deltas)
+
+    @staticmethod
+    def apply_deltas(game_data: dict, deltas: list[dict]) -> None:
+        """
+        Aplica deltas do autosave a um estado de jogo completo (modificado no lugar).
+        Os registros do cenário ganham a chave "id" (a posição no snapshot, ou o id do delta),
+        que Environment.from_dict usa para manter os ids dos deltas seguintes.
+        Args:
+            game_data (dict): O estado do jogo (como o de um snapshot).
+            deltas (list[dict]): Os deltas, na ordem em que foram gravados.
+        """
+        environment = game_data.setdefault("environment", {})
+        groups = {kind: {record.get("id", index): record for index, record in enumerate(environment.get(kind, []))}
+                  for kind in ("trees", "monsters", "coins")}
+        for delta in deltas:
+            for kind, records in delta.get("upsert", {}).items():
+                for record in records:
+                    groups[kind][record["id"]] = record
+            for kind, ids in delta.get("remove", {}).items():
+                for entity_id in ids:
+                    groups[kind].pop(entity_id, None)
+            if "player" in delta:
+                game_data["player"] = delta["player"]
+            if "play_time_ms" in delta:
+                game_data["play_time_ms"] = delta["play_time_ms"]
+        for kind, records in groups.items():
+            environment[kind] = [{**record, "id": entity_id} for entity_id, record in sorted(records.items())]
@@ -3,6 +3,38 @@ SCREEN_HEIGHT: int = 720
 CAPTION: str = "A Lenda da Espada Crescente"
 FPS: int = 60
 
+# Loop principal (passo fixo de simulação)
+# Passos de simulação por segundo. NÃO é configurável: velocidades, gravidade e deslocamentos são
+# aplicados por passo e foram calibrados para 60 Hz, enquanto cooldowns e timers contam milissegundos.
+# Outro valor muda a jogabilidade (a 30 Hz tudo anda na metade da velocidade com os mesmos cooldowns)
+# e invalida gravações de entradas, que guardam um passo por linha. O que varia é a taxa de
+# renderização (RENDER_FPS), desacoplada da simulação
+SIMULATION_HZ: int = 60
+MAX_SIMULATION_STEPS_PER_FRAME: int = 5 # Limite de passos de recuperação por frame renderizado
+MAX_FRAME_TIME_MS: int = 250 # Tempo máximo de um frame considerado pelo acumulador (evita a "espiral da morte")
+RENDER_FPS: int = 60 # Limite de frames renderizados por segundo (0 = sem limite: ocupa 100% de um núcleo da CPU)
+DIRTY_RECT_RENDERING: bool = False # Atualiza só as áreas alteradas da tela na CenaJogo (útil em máquinas fracas)
+LOADING_FRAME_BUDGET_MS: float = 8.0 # Tempo máximo de carregamento por passo na CenaCarregando (a janela continua respondendo)
+
+# Depuração
+PROFILE_CAPTURE_FRAMES: int = 120 # Frames capturados pelo cProfile ao apertar F9
+PROFILE_DIR: str = "profiles" # Pasta onde as capturas (.pstats e resumo .txt) são salvas
+
+# Saves
+SAVE_STATUS_DURATION_MS: int = 2000 # Tempo que o aviso "Jogo salvo!" fica na HUD
+SAVE_FORMAT: str = "json" # "json" (legível) ou "binary" (compacto, mais rápido de carregar em mundos grandes)
+SAVE_COMPRESS: bool = True # Comprime os saves binários com zlib
+SAVE_SLOTS: int = 3 # Quantidade de slots de save
+SAVE_THUMBNAIL_SIZE: tuple[int, int] = (160, 90) # Miniatura da tela guardada com cada slot
+AUTOSAVE_INTERVAL_MS: int = 5000 # Intervalo (tempo de jogo) entre autosaves incrementais (0 = desligado)
+AUTOSAVE_SNAPSHOT_EVERY: int = 20 # A cada quantos deltas no journal o autosave grava um save completo
+
+# Log do jogo
+LOG_LEVEL: str = "INFO" # DEBUG mostra também os eventos de combate, moedas etc. (muitos por frame)
+LOG_DISABLED_CATEGORIES: tuple[str, ...] = () # Categorias silenciadas, ex: ("combate", "moedas")
+LOG_BUFFER_SIZE: int = 4096 # Mensagens guardadas até a próxima escrita (as mais antigas são perdidas se encher)
+LOG_FILE: str | None = None # Arquivo onde o log também é gravado (None = só a saída padrão)
+
 # Cores (em RGB)
 WHITE: tuple[int, int, int] = (255, 255, 255)
 BLACK: tuple[int, int, int] = (0, 0, 0)
@@ -18,6 +50,14 @@ PLAYER_HEALTH: int = 100
 # Configurações da Espada
 SWORD_GROWTH_PER_COIN: float = 0.5 # 0.5 unidades de crescimento por moeda (multiplicado por um fator para ficar visível)
 COINS_FOR_SWORD_LEVEL_UP: int = 5 # A cada 5 moedas coletadas, a espada aumenta de tamanho
+SWORD_ROTATION_STEP: float = 3.0 # Passo (em graus) dos quadros de rotação pré-calculados da espada
+SWORD_PREBUILD_ROTATIONS: bool = False # Se True, gera todos os quadros ao subir de nível (senão, sob demanda)
+
+# Colisões
+COLLISION_CELL_SIZE: int = 128 # Tamanho (em pixels) das células da grade de colisão (spatial hash)
+
+# Projéteis
+PROJECTILE_MAX_LIFETIME_FRAMES: int = 300 # Tempo de vida máximo de um projétil (em frames de simulação)
 
 # Ganhos
 COINS_PER_TREE_CUT: int = 1
@@ -0,0 +1,105 @@
+import pygame
+from typing import Iterable
+
+from core.settings import COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Grade uniforme para a fase ampla (broad-phase) das colisões.
+    Cada sprite é registrado em todas as células que o seu rect ocupa; uma consulta
+    só testa os sprites das células que o rect consultado toca, em vez do grupo inteiro.
+    A grade é reconstruída a cada frame para os objetos que se movem (clear() + insert_many()).
+    """
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE) -> None:
+        """
+        Inicializa a grade.
+        Args:
+            cell_size (int): Tamanho (em pixels) do lado de cada célula.
+        """
+        self.cell_size: int = cell_size
+        self._cells: dict[tuple[int, int], list] = {}
+        self._count: int = 0
+
+    def _cell_range(self, rect: pygame.Rect) -> tuple[range, range]:
+        """Retorna os intervalos de colunas e linhas de células que o rect ocupa."""
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def clear(self) -> None:
+        """Remove todos os sprites da grade."""
+        self._cells.clear()
+        self._count = 0
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Registra um sprite nas células ocupadas pelo seu rect.
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite com atributo rect.
+        """
+        columns, rows = self._cell_range(sprite.rect)
+        cells = self._cells
+        for cx in columns:
+            for cy in rows:
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+        self._count += 1
+
+    def insert_many(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """
+        Registra vários sprites de uma vez (ex: um pygame.sprite.Group).
+        Args:
+            sprites (Iterable[pygame.sprite.Sprite]): Os sprites a registrar.
+        """
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def rebuild(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """
+        Esvazia a grade e registra novamente os sprites (usado uma vez por frame).
+        Args:
+            sprites (Iterable[pygame.sprite.Sprite]): Os sprites a registrar.
+        """
+        self.clear()
+        self.insert_many(sprites)
+
+    def query_rect(self, rect: pygame.Rect) -> list:
+        """
+        Retorna os sprites cujo rect colide com o rect dado (teste exato após a fase ampla).
+        Args:
+            rect (pygame.Rect): Área consultada.
+        Returns:
+            list: Sprites que colidem, sem repetições.
+        """
+        columns, rows = self._cell_range(rect)
+        cells = self._cells
+        found = []
+        seen = set()
+        for cx in columns:
+            for cy in rows:
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for sprite in bucket:
+                    if sprite not in seen:
+                        seen.add(sprite)
+                        if rect.colliderect(sprite.rect):
+                            found.append(sprite)
+        return found
+
+    def collide(self, sprite: pygame.sprite.Sprite) -> list:
+        """
+        Equivalente a pygame.sprite.spritecollide(sprite, grupo, False) usando a grade.
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite com atributo rect.
+        Returns:
+            list: Sprites da grade que colidem com ele.
+        """
+        return self.query_rect(sprite.rect)
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,95 @@
+import pygame
+
+
+class SpritePool:
+    """
+    Pool genérico de sprites reutilizáveis (projéteis, moedas...).
+    Em vez de criar e descartar sprites a cada disparo/queda, o pool devolve uma
+    instância já existente e apenas reinicia o seu estado.
+
+    Contrato com a classe do sprite:
+        - O construtor aceita os mesmos argumentos de reset() (usado quando o pool está vazio).
+        - reset(*args, **kwargs) reinicia todo o estado do sprite (chamado ao reaproveitar).
+        - on_release() (opcional) é chamado quando o sprite volta para o pool.
+    """
+    def __init__(self, sprite_class: type, max_size: int = 256) -> None:
+        """
+        Inicializa o pool.
+        Args:
+            sprite_class (type): Classe dos sprites gerenciados.
+            max_size (int): Quantidade máxima de sprites livres guardados; o excedente é descartado.
+        """
+        self.sprite_class = sprite_class
+        self.max_size: int = max_size
+        self._free: list[pygame.sprite.Sprite] = []
+
+        # Estatísticas
+        self.hits: int = 0 # Aquisições atendidas por um sprite reaproveitado
+        self.misses: int = 0 # Aquisições que precisaram criar um sprite novo
+        self.in_use: int = 0 # Sprites entregues e ainda não devolvidos
+        self.high_water: int = 0 # Maior quantidade de sprites em uso ao mesmo tempo
+
+    def acquire(self, *args, **kwargs) -> pygame.sprite.Sprite:
+        """
+        Entrega um sprite pronto para uso, reaproveitado ou novo.
+        Args:
+            *args, **kwargs: Repassados para reset() (ou para o construtor, se o pool estiver vazio).
+        Returns:
+            pygame.sprite.Sprite: O sprite com o estado reiniciado.
+        """
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            sprite = self.sprite_class(*args, **kwargs)
+            self.misses += 1
+        sprite._in_pool = False
+
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return sprite
+
+    def release(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Devolve um sprite ao pool, removendo-o de todos os grupos.
+        Devoluções repetidas do mesmo sprite são ignoradas.
+        Args:
+            sprite (pygame.sprite.Sprite): O sprite a ser devolvido.
+        """
+        sprite.kill()
+        if getattr(sprite, "_in_pool", True):
+            return # Já devolvido (ou não veio deste pool)
+        sprite._in_pool = True
+        self.in_use -= 1
+
+        on_release = getattr(sprite, "on_release", None)
+        if on_release:
+            on_release()
+        if len(self._free) < self.max_size:
+            self._free.append(sprite)
+
+    def release_all(self, group: pygame.sprite.AbstractGroup) -> None:
+        """
+        Devolve ao pool todos os sprites de um grupo.
+        Args:
+            group (pygame.sprite.AbstractGroup): O grupo a ser esvaziado.
+        """
+        for sprite in group.sprites():
+            self.release(sprite)
+
+    @property
+    def available(self) -> int:
+        """Quantidade de sprites livres aguardando reutilização."""
+        return len(self._free)
+
+    def stats(self) -> dict:
+        """Retorna as estatísticas do pool em um dicionário."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_use": self.in_use,
+            "available": self.available,
+            "high_water": self.high_water
+        }
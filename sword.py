@@ -1,22 +1,28 @@
 import pygame
 import math
-from core.settings import SWORD_GROWTH_PER_COIN, COINS_FOR_SWORD_LEVEL_UP 
+from core.settings import SWORD_GROWTH_PER_COIN, COINS_FOR_SWORD_LEVEL_UP, SWORD_ROTATION_STEP, SWORD_PREBUILD_ROTATIONS
 from world.projectile import Projectile # <--- ADICIONE ESTA LINHA [cite: sword_180_degree_swing]
+from core.asset_cache import asset_cache
+from core.game_logger import game_logger
+
+SWORD_IMAGE_PATH: str = "assets/images/sword.png"
+SWORD_BASE_SIZE: tuple[int, int] = (45, 150) # Tamanho base da espada
+
+
+def _sword_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Lâmina cinza com cabo marrom usada quando sword.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((150, 150, 150))
+    pygame.draw.rect(surface, (100, 50, 0), (size[0] // 3, size[1] * 4 // 5, size[0] // 3, size[1] // 5)) # Cabo
+    return surface
 
 class Sword(pygame.sprite.Sprite):
     def __init__(self) -> None:
         super().__init__()
 
-        try:
-            self.original_image = pygame.image.load("assets/images/sword.png").convert_alpha()
-            self.original_image = pygame.transform.scale(self.original_image, (45, 150)) # Tamanho base da espada
-        except pygame.error:
-            print("Erro: Imagem da espada (sword.png) não encontrada. Usando um retângulo como placeholder.")
-            self.original_image = pygame.Surface((45, 150), pygame.SRCALPHA) # Placeholder
-            self.original_image.fill((150, 150, 150)) 
-            pygame.draw.rect(self.original_image, (100, 50, 0), (15, 120, 15, 30)) # Cabo do placeholder
+        self.original_image = asset_cache.get_image(SWORD_IMAGE_PATH, SWORD_BASE_SIZE, placeholder=_sword_placeholder)
 
-        self.scaled_current_image = self.original_image.copy() 
+        self.scaled_current_image = self.original_image 
         self.image = self.scaled_current_image 
         self.rect = self.image.get_rect() 
 
@@ -41,6 +47,9 @@ class Sword(pygame.sprite.Sprite):
 
         self.sword_pivot_offset_local = pygame.math.Vector2(self.base_width / 2, self.base_height * 0.9)
 
+        # Cache de quadros rotacionados do nível atual: {índice do ângulo: (imagem, offset do pivô)}
+        self.rotation_step: float = SWORD_ROTATION_STEP
+        self._rotation_cache: dict[int, tuple[pygame.Surface, pygame.math.Vector2]] = {}
 
     def try_grow_by_coins(self, total_coins: int) -> None:
         new_growth_level = total_coins // COINS_FOR_SWORD_LEVEL_UP
@@ -49,12 +58,50 @@ class Sword(pygame.sprite.Sprite):
             self.current_growth_level = new_growth_level
             new_height = self.base_height + (self.current_growth_level * SWORD_GROWTH_PER_COIN * 10)
             
-            self.scaled_current_image = pygame.transform.scale(self.original_image, (self.base_width, int(new_height)))
+            previous_size = self.scaled_current_image.get_size()
+            self.scaled_current_image = asset_cache.get_image(SWORD_IMAGE_PATH, (self.base_width, int(new_height)), placeholder=_sword_placeholder)
             self.sword_pivot_offset_local = pygame.math.Vector2(self.base_width / 2, self.scaled_current_image.get_height() * 0.9)
 
-            print(f"Espada cresceu! Nível: {self.current_growth_level}, Altura: {new_height:.2f}px")
+            # A espada nunca encolhe: o tamanho anterior e os quadros rotacionados dele não voltam a ser usados.
+            # O tamanho base fica no cache (é o de toda espada nova)
+            if previous_size != (self.base_width, self.base_height):
+                asset_cache.evict(SWORD_IMAGE_PATH, previous_size)
+            self._rotation_cache = {}
+            if SWORD_PREBUILD_ROTATIONS:
+                self.build_rotation_cache()
+
+            game_logger.info("espada", "Espada cresceu! Nível: {}, Altura: {:.2f}px", self.current_growth_level, new_height)
             self.current_damage = 5 + (self.current_growth_level * 2) 
 
+    def _rotated_frame(self, angle: float) -> tuple[pygame.Surface, pygame.math.Vector2]:
+        """
+        Retorna a imagem rotacionada e o offset do pivô para o ângulo dado,
+        quantizado em passos de rotation_step. Cada quadro é rotacionado uma única vez por nível.
+        Args:
+            angle (float): Ângulo da espada em graus.
+        Returns:
+            tuple[pygame.Surface, pygame.math.Vector2]: Imagem rotacionada e offset do pivô rotacionado.
+        """
+        steps_per_turn = max(1, round(360 / self.rotation_step))
+        index = round(angle / self.rotation_step) % steps_per_turn
+        frame = self._rotation_cache.get(index)
+        if frame is None:
+            quantized_angle = index * self.rotation_step
+            frame = (
+                pygame.transform.rotate(self.scaled_current_image, quantized_angle),
+                self.sword_pivot_offset_local.rotate(-quantized_angle)
+            )
+            self._rotation_cache[index] = frame
+        return frame
+
+    def build_rotation_cache(self) -> None:
+        """
+        Gera de uma vez todos os quadros rotacionados do nível atual da espada.
+        """
+        steps_per_turn = max(1, round(360 / self.rotation_step))
+        for index in range(steps_per_turn):
+            self._rotated_frame(index * self.rotation_step)
+
     def start_swing(self, direction: int) -> None:
         if not self.swing_active: 
             self.swing_active = True
@@ -107,7 +154,8 @@ class Sword(pygame.sprite.Sprite):
             self.is_attacking = False
 
 
-        rotated_image = pygame.transform.rotate(self.scaled_current_image, self.swing_angle)
+        # Busca na tabela de quadros em vez de rotacionar a imagem a cada frame
+        rotated_image, rotated_pivot_offset = self._rotated_frame(self.swing_angle)
         
         player_anchor_offset_x = 0 
         player_anchor_offset_y = -40 
@@ -115,8 +163,6 @@ class Sword(pygame.sprite.Sprite):
         player_anchor_world_x = player_center[0] + (player_anchor_offset_x if player_facing_right else -player_anchor_offset_x)
         player_anchor_world_y = player_center[1] + player_anchor_offset_y
 
-        rotated_pivot_offset = self.sword_pivot_offset_local.rotate(-self.swing_angle) 
-
         new_topleft_x = player_anchor_world_x - rotated_pivot_offset.x
         new_topleft_y = player_anchor_world_y - rotated_pivot_offset.y
 
@@ -124,8 +170,14 @@ class Sword(pygame.sprite.Sprite):
 
         self.image = rotated_image
 
-    def draw(self, screen: pygame.Surface) -> None:
-        screen.blit(self.image, self.rect)
+    def draw(self, screen: pygame.Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        """
+        Desenha a espada.
+        Args:
+            screen (pygame.Surface): A superfície da tela do Pygame.
+            offset (tuple[int, int]): Deslocamento de desenho (ex: interpolação da posição do jogador).
+        """
+        screen.blit(self.image, self.rect.move(offset))
 
     def get_damage(self) -> int:
         return self.current_damage
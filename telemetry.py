@@ -0,0 +1,85 @@
+import csv
+import json
+import queue
+import threading
+import time
+
+# Colunas dos registros (no CSV, nesta ordem; no JSONL, as chaves de cada linha)
+TELEMETRY_FIELDS: list[str] = [
+    "frame", "time_ms", "event", "scene", "steps",
+    "update_ms", "draw_ms", "flip_ms", "frame_ms",
+    "monsters", "coins", "projectiles",
+]
+
+
+class TelemetryWriter:
+    """
+    Grava registros de telemetria (um por frame, mais eventos como troca de cena) em JSONL ou CSV.
+    O loop do jogo só acrescenta o registro a uma lista; a cada batch_size registros, o lote
+    é entregue a uma thread de fundo que escreve no disco. O frame nunca espera pelo disco.
+    """
+    def __init__(self, path: str, batch_size: int = 120) -> None:
+        """
+        Abre o arquivo e inicia a thread de escrita.
+        Args:
+            path (str): Arquivo de saída; termina em .csv para CSV, qualquer outra extensão grava JSONL.
+            batch_size (int): Quantos registros são acumulados antes de serem entregues à thread.
+        """
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.format: str = "csv" if path.lower().endswith(".csv") else "jsonl"
+        self.records_written: int = 0
+        self._start: float = time.perf_counter()
+        self._buffer: list[dict] = []
+        self._batches: queue.Queue = queue.Queue()
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._csv_writer = None
+        if self.format == "csv":
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=TELEMETRY_FIELDS, extrasaction="ignore")
+            self._csv_writer.writeheader()
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def elapsed_ms(self) -> float:
+        """Milissegundos (tempo real) desde a abertura do arquivo."""
+        return (time.perf_counter() - self._start) * 1000
+
+    def record(self, record: dict) -> None:
+        """
+        Acrescenta um registro. Não faz E/S: no máximo entrega um lote completo à thread de escrita.
+        Args:
+            record (dict): O registro (chaves de TELEMETRY_FIELDS).
+        """
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self._batches.put(self._buffer)
+            self._buffer = []
+
+    def _run(self) -> None:
+        """Laço da thread de escrita: grava cada lote recebido até receber None."""
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list[dict]) -> None:
+        """Grava um lote e o envia ao sistema operacional."""
+        if self._csv_writer:
+            self._csv_writer.writerows(batch)
+        else:
+            self._file.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch))
+        self._file.flush()
+        self.records_written += len(batch)
+
+    def close(self) -> None:
+        """Entrega os registros pendentes, espera a thread terminar e fecha o arquivo."""
+        if self._file.closed:
+            return
+        if self._buffer:
+            self._batches.put(self._buffer)
+            self._buffer = []
+        self._batches.put(None)
+        self._thread.join()
+        self._file.close()
+        print(f"Telemetria salva em {self.path}: {self.records_written} registros.")
@@ -0,0 +1,20 @@
+import random
+from save_system import save_load as save_load_module
+from jogo import Jogo
+from cena_jogo import CenaJogo
+
+
+def test_headless_run_stops_at_game_over(tmp_path, monkeypatch):
+    """Sem janela, o game over encerra a simulação em vez de deixar o jogo parado no menu."""
+    monkeypatch.setattr(save_load_module, "SAVE_DIR", str(tmp_path))
+    jogo = Jogo(headless=True)
+    random.seed(1)
+    cena = CenaJogo(jogo)
+    jogo.mudar_cena(cena)
+
+    jogo.executar(max_passos=20000)
+
+    assert cena.player.health <= 0
+    assert jogo.cena_atual is cena
+    assert not jogo.rodando
+    assert jogo.passos_simulados < 20000
@@ -0,0 +1,127 @@
+import pytest
+from save_system import save_load as save_load_module
+from save_system.binary_save import (encode_game_state, decode_game_state, BINARY_SAVE_MAGIC,
+                                     _HEADER, _GAME_V1, _PLAYER, _COUNTS)
+from save_system.save_load import SaveLoad
+
+
+def _game_state(coins: int = 12, play_time_ms: int = 1234) -> dict:
+    """Estado de jogo pequeno com um elemento de cada tipo."""
+    return {
+        "player": {"x": 100, "y": 500, "health": 80, "coins": coins, "facing_right": False,
+                   "sword_growth_level": 2, "sword_current_damage": 9},
+        "environment": {
+            "trees": [{"x": 10, "y": 20, "health": 3, "is_cut": False},
+                      {"x": 30, "y": 20, "health": 1, "is_cut": False}],
+            "monsters": [{"x": 50, "y": 60, "health": 20, "is_alive": True, "speed": 2, "damage": 5,
+                          "direction": -1, "patrol_start_x": 50, "type": "Monster"},
+                         {"x": 70, "y": 150, "health": 100, "is_alive": True, "speed": 3, "damage": 10,
+                          "direction": 1, "patrol_start_x": 70, "type": "Dragon", "last_fireball_time": 4500}],
+            "coins": [{"x": 5, "y": 6, "value": 1, "collected": False, "velocity_y": 1.5}],
+            "platforms": [{"x": 200, "y": 300, "width": 150, "height": 30}],
+        },
+        "current_scene": "CenaJogo",
+        "music_volume": 0.25,
+        "sfx_volume": 0.5,
+        "play_time_ms": play_time_ms,
+    }
+
+
+@pytest.fixture
+def save_dir(tmp_path, monkeypatch):
+    """Grava os saves do teste em uma pasta temporária."""
+    monkeypatch.setattr(save_load_module, "SAVE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_binary_round_trip(compress):
+    state = _game_state()
+    assert decode_game_state(encode_game_state(state, compress)) == state
+
+
+def test_binary_v1_still_decodes_without_play_time():
+    scene = b"CenaJogo"
+    body = (_GAME_V1.pack(0.25, 0.5, len(scene)) + scene
+            + _PLAYER.pack(1, 2, 3, 4, True, 0, 5) + _COUNTS.pack(0, 0, 0, 0))
+    data = decode_game_state(_HEADER.pack(BINARY_SAVE_MAGIC, 1, 0) + body)
+    assert data["player"]["coins"] == 4
+    assert data["music_volume"] == 0.25
+    assert "play_time_ms" not in data
+
+
+def test_binary_rejects_truncated_save():
+    with pytest.raises(ValueError):
+        decode_game_state(encode_game_state(_game_state(), compress=False)[:-4])
+
+
+@pytest.mark.parametrize("save_format", ["json", "binary"])
+def test_slot_snapshot_round_trip(save_dir, save_format):
+    save_load = SaveLoad(save_format=save_format)
+    state = _game_state()
+    save_load.save_game_async(state, slot=1)
+    save_load.shutdown()
+
+    loaded = save_load.load_game(1)
+    assert loaded.pop("journal_deltas") == 0
+    assert loaded == state
+    assert SaveLoad(save_format=save_format).read_index()[1]["play_time_ms"] == 1234
+
+
+@pytest.mark.parametrize("save_format", ["json", "binary"])
+def test_journal_replay_on_top_of_snapshot(save_dir, save_format):
+    save_load = SaveLoad(save_format=save_format)
+    save_load.save_game_async(_game_state(coins=12), slot=2)
+    new_coin = {"x": 40, "y": 0, "value": 1, "collected": False, "velocity_y": 0.0, "id": 1}
+    save_load.append_delta_async({
+        "player": _game_state(coins=15)["player"], "play_time_ms": 6000,
+        "upsert": {"trees": [{"x": 10, "y": 20, "health": 2, "is_cut": False, "id": 0}], "coins": [new_coin]},
+        "remove": {"monsters": [0]},
+    }, slot=2)
+    save_load.append_delta_async({"player": _game_state(coins=16)["player"], "play_time_ms": 11000,
+                                  "upsert": {}, "remove": {"trees": [1], "coins": [0]}}, slot=2)
+    save_load.shutdown()
+
+    loaded = save_load.load_game(2)
+    environment = loaded["environment"]
+    assert loaded["journal_deltas"] == 2
+    assert loaded["player"]["coins"] == 16
+    assert loaded["play_time_ms"] == 11000
+    assert [(tree["id"], tree["health"]) for tree in environment["trees"]] == [(0, 2)]
+    assert [monster["type"] for monster in environment["monsters"]] == ["Dragon"]
+    assert environment["coins"] == [new_coin]
+    assert save_load.read_index()[2]["coins"] == 16
+
+
+def test_stale_journal_is_ignored(save_dir):
+    save_load = SaveLoad()
+    save_load.save_game_async(_game_state(coins=12), slot=1)
+    save_load.append_delta_async({"player": _game_state(coins=99)["player"], "upsert": {}, "remove": {}}, slot=1)
+    save_load.shutdown()
+
+    # Snapshot regravado sem que o journal fosse reiniciado (queda entre as duas escritas)
+    snapshot_path = save_load.slot_path(1)
+    with open(snapshot_path, "ab") as f:
+        f.write(b"\n")
+    loaded = save_load.load_game(1)
+    assert loaded["journal_deltas"] == 0
+    assert loaded["player"]["coins"] == 12
+
+
+def test_unexpected_save_error_does_not_stop_the_writer(save_dir):
+    save_load = SaveLoad()
+    results = []
+    write_snapshot = save_load._write_snapshot
+
+    def broken_write(*args):
+        raise RuntimeError("disco sumiu")
+
+    save_load._write_snapshot = broken_write
+    save_load.save_game_async(_game_state(), slot=1, on_complete=lambda ok, msg: results.append(ok))
+    save_load._write_snapshot = write_snapshot
+    save_load.save_game_async(_game_state(), slot=1, on_complete=lambda ok, msg: results.append(ok))
+    save_load.shutdown()
+    save_load.process_completed()
+
+    assert results == [False, True]
+    assert save_load.load_game(1)["player"]["coins"] == 12
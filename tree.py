@@ -1,5 +1,18 @@
 import pygame
 from core.settings import COINS_PER_TREE_CUT # [cite: 9a]
+from core.asset_cache import asset_cache
+from core.game_logger import game_logger
+
+TREE_IMAGE_PATH: str = "assets/images/tree.png"
+TREE_SIZE: tuple[int, int] = (120, 180) # Tamanho da árvore
+
+
+def _tree_placeholder(size: tuple[int, int]) -> pygame.Surface:
+    """Retângulo verde com tronco marrom usado quando tree.png não é encontrada."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((0, 100, 0)) # Verde escuro
+    pygame.draw.rect(surface, (139, 69, 19), (size[0] // 3, size[1] * 5 // 6, size[0] // 3, size[1] // 6)) # Tronco marrom
+    return surface
 
 class Tree(pygame.sprite.Sprite):
     """
@@ -14,14 +27,7 @@ class Tree(pygame.sprite.Sprite):
             initial_data (dict | None): Dados para restaurar o estado da árvore.
         """
         super().__init__()
-        try:
-            self.image = pygame.image.load("assets/images/tree.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (120, 180)) # Tamanho da árvore [cite: 9a]
-        except pygame.error:
-            print("Erro: Imagem da árvore (tree.png) não encontrada. Usando um retângulo verde como placeholder.")
-            self.image = pygame.Surface((120, 180), pygame.SRCALPHA) # Placeholder [cite: 9a]
-            self.image.fill((0, 100, 0)) # Verde escuro
-            pygame.draw.rect(self.image, (139, 69, 19), (40, 150, 40, 30)) # Tronco marrom no placeholder [cite: 9a]
+        self.image = asset_cache.get_image(TREE_IMAGE_PATH, TREE_SIZE, placeholder=_tree_placeholder)
 
         self.rect = self.image.get_rect(topleft=(x, y))
         self.health: int = 3 # Quantos "hits" para cortar a árvore
@@ -46,7 +52,7 @@ class Tree(pygame.sprite.Sprite):
         # print(f"Árvore atingida! Vida restante: {self.health}") # Debug removido
         if self.health <= 0:
             self.is_cut = True
-            print("Árvore cortada!")
+            game_logger.debug("combate", "Árvore cortada!")
             # TODO: Tocar som de árvore caindo/cortando
             return self.coins_on_cut
         return 0